@@ -1,10 +1,16 @@
 import nextcord
 from nextcord.ext import commands
-import os
 import config
 import traceback
 import asyncio
 from datetime import datetime
+from logic.http_client import http_client
+from logic.storage import storage
+from logic.audit_log import audit_log
+from logic.donation_journal import donation_journal
+from logic.command_sync import sync_if_changed
+from logic.member_loader import member_loader
+from logic.cog_loader import cog_loader
 
 # Initialize the bot with appropriate intents
 intents = nextcord.Intents.default()
@@ -13,48 +19,59 @@ intents.guilds = True
 intents.messages = True
 intents.guild_messages = True
 intents.members = True  # Enable members intent for fetching and caching members
-bot = commands.Bot(command_prefix="!", intents=intents)
+# Only associate known commands on connect; on_ready syncs when the command tree changes.
+# Members are chunked in the background after ready instead of blocking startup.
+bot = commands.Bot(
+    command_prefix="!",
+    intents=intents,
+    chunk_guilds_at_startup=False,
+    rollout_delete_unknown=False,
+    rollout_register_new=False,
+    rollout_update_known=False
+)
+audit_log.bind(bot)
 
 # Event to sync commands once the bot is ready
 @bot.event
 async def on_ready():
     print("[DEBUG] on_ready event triggered")
-    try:
-        for guild in bot.guilds:
-            try:
-                members = await guild.fetch_members().flatten()
-                for member in members:
-                    user_id = getattr(member, 'id', None)
-                    if user_id is not None:
-                        user_id = int(user_id)
-                    else:
-                        print(f"[WARNING] Missing user_id for member: {member}")
-                print(f"[DEBUG] Fetched members for guild: {guild.name}")
-            except Exception as e:
-                print(f"[ERROR] Failed to fetch members for guild {guild.name}: {e}")
+    # Chunk every guild's members concurrently in the background
+    member_loader.start_reconcile(bot)
+
+    # Load the deferred cogs before syncing so their commands are part of the tree
+    elapsed_ms = await cog_loader.load_deferred(bot)
+    print(f"[DEBUG] Deferred cogs loaded in {elapsed_ms:.0f} ms")
 
-        await bot.sync_application_commands()
-        print("[DEBUG] Successfully synced application commands globally")
+    try:
+        if await sync_if_changed(bot):
+            print("[DEBUG] Successfully synced application commands globally")
+        else:
+            print("[DEBUG] Application commands unchanged, skipped sync")
     except Exception as e:
         error_traceback = traceback.format_exc()
         print(f"[ERROR] Failed to sync application commands: {error_traceback}")
 
-# Add cogs explicitly including event cog and news cog
+# Load the critical cogs from the manifest; the rest are deferred until on_ready
 async def load_cogs():
-    print("[DEBUG] Loading cogs")
-    for filename in os.listdir('./cogs'):
-        if filename.endswith('.py'):
-            try:
-                bot.load_extension(f'cogs.{filename[:-3]}')
-                print(f"[DEBUG] Loaded {filename}")
-            except Exception as e:
-                print(f"[ERROR] Failed to load {filename}. Exception: {e}")
+    print("[DEBUG] Loading critical cogs")
+    elapsed_ms = await cog_loader.load_critical(bot)
+    for timing in cog_loader.report():
+        if timing["error"]:
+            print(f"[ERROR] Failed to load {timing['name']}.py. Exception: {timing['error']}")
+    print(f"[DEBUG] Critical cogs loaded in {elapsed_ms:.0f} ms")
 
 # Run the bot
 if __name__ == "__main__":
     async def main():
+        await member_loader.load_snapshot()
         await load_cogs()
-        await bot.start(config.BOT_TOKEN)
+        try:
+            await bot.start(config.BOT_TOKEN)
+        finally:
+            await audit_log.flush()
+            await donation_journal.close()
+            await http_client.close()
+            await storage.close()
 
     print("[DEBUG] Starting bot...")
     asyncio.run(main())
\ No newline at end of file
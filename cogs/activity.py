@@ -1,50 +1,14 @@
 import nextcord
 from nextcord.ext import commands
 from nextcord import Interaction, SlashOption
-import os
-import json
 from datetime import datetime
 import config
+from logic.storage import storage
+from logic.audit_log import audit_log
 
 class ActivityManagement(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.data_dir = "/root/ghosted-bot/data/activity"
-        self.osrs_file = os.path.join(self.data_dir, "osrs-inactivity-list.json")
-        self.rs3_file = os.path.join(self.data_dir, "rs3-inactivity-list.json")
-
-        # Ensure data directory exists
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
-
-        # Ensure the files exist
-        for file in [self.osrs_file, self.rs3_file]:
-            if not os.path.exists(file):
-                with open(file, "w") as f:
-                    json.dump([], f)
-
-    def load_data(self, file_path):
-        """Loads data from a JSON file."""
-        if os.path.exists(file_path):
-            with open(file_path, "r") as f:
-                return json.load(f)
-        return []
-
-    def save_data(self, file_path, data):
-        """Saves data to a JSON file."""
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=4)
-
-    async def log_command_usage(self, interaction, command_name):
-        """Logs command usage to the logs channel."""
-        logs_channel = config.CHANNEL_IDS.get("logs")
-        if logs_channel:
-            channel = interaction.guild.get_channel(logs_channel)
-            if channel:
-                timestamp = int(datetime.now().timestamp())
-                await channel.send(
-                    f"<t:{timestamp}:F> <@{interaction.user.id}> used command `/{command_name}` in channel <#{interaction.channel.id}>."
-                )
 
     @nextcord.slash_command(name='activity', description="Report your activity status for Old School RuneScape and/or RuneScape 3.")
     async def activity(
@@ -86,29 +50,17 @@ class ActivityManagement(commands.Cog):
             )
             return
 
-        affected_files = []
+        affected_games = []
         if game in ["osrs", "both"]:
-            affected_files.append(self.osrs_file)
+            affected_games.append("osrs")
         if game in ["rs3", "both"]:
-            affected_files.append(self.rs3_file)
+            affected_games.append("rs3")
 
         try:
             if status == "inactive":
-                for file_path in affected_files:
-                    data = self.load_data(file_path)
-
-                    # Check if already inactive
-                    if any(entry["Discord User ID"] == user_id for entry in data):
-                        continue  # Skip adding again if already inactive
-
-                    # Add new inactivity entry
-                    data.append({
-                        "Display Name": display_name,
-                        "Discord User ID": user_id,
-                        "Date & Time": timestamp_now  # Store as Unix timestamp
-                    })
-
-                    self.save_data(file_path, data)
+                for affected_game in affected_games:
+                    # Add new inactivity entry (skipped if already inactive)
+                    await storage.mark_inactive(affected_game, user_id, display_name, timestamp_now)
 
                 await interaction.response.send_message(
                     f"Thanks for your inactivity report, <@{user_id}>. "
@@ -117,14 +69,8 @@ class ActivityManagement(commands.Cog):
                 )
 
             elif status == "active":
-                for file_path in affected_files:
-                    data = self.load_data(file_path)
-                    new_data = [entry for entry in data if entry["Discord User ID"] != user_id]
-
-                    if len(new_data) == len(data):
-                        continue  # Skip if no change
-
-                    self.save_data(file_path, new_data)
+                for affected_game in affected_games:
+                    await storage.mark_active(affected_game, user_id)
 
                 await interaction.response.send_message(
                     f"Welcome back, <@{user_id}>! You have been marked as active again.",
@@ -132,7 +78,7 @@ class ActivityManagement(commands.Cog):
                 )
 
             # Log command usage
-            await self.log_command_usage(interaction, "activity")
+            audit_log.record(interaction, "activity")
 
         except Exception as e:
             await interaction.response.send_message(f"An error occurred: {e}", ephemeral=True)
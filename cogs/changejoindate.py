@@ -4,16 +4,14 @@ from nextcord import Interaction, SlashOption, Embed
 import logging
 import traceback
 import config
-import os
-import json
 from datetime import datetime
+from logic.storage import storage
 
 logger = logging.getLogger(__name__)
 
 class ChangeJoinDateCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.rs3_data_dir = "/root/ghosted-bot/data/members/runescape3"
 
     @nextcord.slash_command(name="changejoindate", description="Change the join date for a RuneScape 3 member.")
     async def changejoindate(
@@ -59,32 +57,14 @@ class ChangeJoinDateCog(commands.Cog):
                 )
                 return
 
-            # Load RS3 member data
-            file_path = os.path.join(self.rs3_data_dir, "rs3_memberlist.json")
-
-            if not os.path.exists(file_path):
-                await interaction.response.send_message(
-                    "No RS3 member list found. Please run `/fetch game: RuneScape 3` first.",
-                    ephemeral=True
-                )
-                return
-
-            with open(file_path, "r") as f:
-                members_data = json.load(f)
-
-            if member_name not in members_data:
+            # Update join date
+            if not await storage.set_join_date("rs3", member_name, join_date):
                 await interaction.response.send_message(
                     f"Member `{member_name}` not found in the member list.",
                     ephemeral=True
                 )
                 return
 
-            # Update join date
-            members_data[member_name]["Join Date"] = join_date
-
-            with open(file_path, "w") as f:
-                json.dump(members_data, f, indent=4)
-
             embed = Embed(
                 title="Join Date Updated",
                 description=f"Successfully updated join date for **{member_name}** to **{join_date}**.",
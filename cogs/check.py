@@ -4,16 +4,13 @@ from nextcord import Interaction, SlashOption, Embed
 import logging
 import traceback
 import config
-import os
-import json
+from logic.member_cache import member_cache
 
 logger = logging.getLogger(__name__)
 
 class CheckCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.rs3_data_dir = "/root/ghosted-bot/data/members/runescape3"
-        self.osrs_data_dir = "/root/ghosted-bot/data/members/oldschoolrunescape"
 
     @nextcord.slash_command(name="check", description="Check members without join dates for RuneScape 3 or Old School RuneScape.")
     async def check(
@@ -46,8 +43,6 @@ class CheckCog(commands.Cog):
                     )
                     return
 
-                file_path = os.path.join(self.rs3_data_dir, "rs3_memberlist.json")
-
             elif game == "osrs":
                 if config.ROLE_IDS['osrsbotmod'] not in [role.id for role in user.roles]:
                     await interaction.response.send_message(
@@ -56,18 +51,14 @@ class CheckCog(commands.Cog):
                     )
                     return
 
-                file_path = os.path.join(self.osrs_data_dir, "osrs_memberlist.json")
-
-            if not os.path.exists(file_path):
+            members_data = await member_cache.get_roster(game)
+            if not members_data:
                 await interaction.response.send_message(
                     f"No {game.upper()} member list found. Please run `/fetch game: {game.upper()}` first.",
                     ephemeral=True
                 )
                 return
 
-            with open(file_path, "r") as f:
-                members_data = json.load(f)
-
             members_without_join_date = [name for name, data in members_data.items() if data.get("Join Date") == "Unknown"]
 
             # Chunking the message if needed
@@ -1,37 +1,19 @@
 import nextcord
 from nextcord.ext import commands
 from nextcord import Interaction, SlashOption
-import os
-import json
 import config
 from datetime import datetime
-import pytz  # Ensure timestamps are in UTC
+from logic.storage import storage
+from logic.audit_log import audit_log
+from logic.lazy_import import lazy_import
+
+# Only needed when a legacy date string has to be parsed
+pytz = lazy_import("pytz")  # Ensure timestamps are in UTC
 
 
 class CheckActivity(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.data_dir = "/root/ghosted-bot/data/activity"
-        self.osrs_file = os.path.join(self.data_dir, "osrs-inactivity-list.json")
-        self.rs3_file = os.path.join(self.data_dir, "rs3-inactivity-list.json")
-
-    def load_data(self, file_path):
-        """Loads data from a JSON file."""
-        if os.path.exists(file_path):
-            with open(file_path, "r") as f:
-                return json.load(f)
-        return []
-
-    async def log_command_usage(self, interaction, command_name):
-        """Logs command usage to the logs channel."""
-        logs_channel = config.CHANNEL_IDS.get("logs")
-        if logs_channel:
-            channel = interaction.guild.get_channel(logs_channel)
-            if channel:
-                timestamp = int(datetime.now().timestamp())
-                await channel.send(
-                    f"<t:{timestamp}:F> <@{interaction.user.id}> used command `/{command_name}` in channel <#{interaction.channel.id}>."
-                )
 
     def convert_to_timestamp(self, date_string):
         """Converts the Date & Time string into a Unix timestamp format for Discord."""
@@ -83,8 +65,8 @@ class CheckActivity(commands.Cog):
             return
 
         # Load data based on selected game
-        osrs_data = self.load_data(self.osrs_file) if game in ["osrs", "both"] else []
-        rs3_data = self.load_data(self.rs3_file) if game in ["rs3", "both"] else []
+        osrs_data = await storage.get_inactivity("osrs") if game in ["osrs", "both"] else []
+        rs3_data = await storage.get_inactivity("rs3") if game in ["rs3", "both"] else []
 
         # Embed storage
         embeds = []
@@ -135,7 +117,7 @@ class CheckActivity(commands.Cog):
             await interaction.followup.send(embed=embed)
 
         # Log command usage
-        await self.log_command_usage(interaction, "checkactivity")
+        audit_log.record(interaction, "checkactivity")
 
 
 def setup(bot):
@@ -4,16 +4,13 @@ from nextcord import Interaction, SlashOption, Embed
 import logging
 import traceback
 import config
-import os
-import json
+from logic.member_cache import member_cache
 
 logger = logging.getLogger(__name__)
 
 class CheckJoinDateCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.rs3_data_dir = "/root/ghosted-bot/data/members/runescape3"
-        self.osrs_data_dir = "/root/ghosted-bot/data/members/oldschoolrunescape"
 
     @nextcord.slash_command(name="checkjoindate", description="Check the join date for a RuneScape 3 or Old School RuneScape member.")
     async def checkjoindate(
@@ -50,7 +47,6 @@ class CheckJoinDateCog(commands.Cog):
                         ephemeral=True
                     )
                     return
-                file_path = os.path.join(self.rs3_data_dir, "rs3_memberlist.json")
 
             elif game == "osrs":
                 if config.ROLE_IDS['osrsbotmod'] not in [role.id for role in user.roles]:
@@ -59,26 +55,16 @@ class CheckJoinDateCog(commands.Cog):
                         ephemeral=True
                     )
                     return
-                file_path = os.path.join(self.osrs_data_dir, "osrs_memberlist.json")
 
-            if not os.path.exists(file_path):
-                await interaction.response.send_message(
-                    f"No {game.upper()} member list found. Please run `/fetch game: {game.upper()}` first.",
-                    ephemeral=True
-                )
-                return
-
-            with open(file_path, "r") as f:
-                members_data = json.load(f)
-
-            if member_name not in members_data:
+            member_data = await member_cache.get_member(game, member_name)
+            if member_data is None:
                 await interaction.response.send_message(
                     f"Member `{member_name}` not found in the member list.",
                     ephemeral=True
                 )
                 return
 
-            join_date = members_data[member_name].get("Join Date", "Unknown")
+            join_date = member_data.get("Join Date", "Unknown")
 
             embed = Embed(
                 title="Join Date Check",
@@ -1,67 +1,55 @@
 import nextcord
-from nextcord.ext import commands
+from nextcord.ext import commands, tasks
 from nextcord import Interaction, SlashOption
-import os
-import json
 import config
-import requests
 import traceback
 from datetime import datetime
+from logic.leaderboard import leaderboard_index
+from logic.donation_journal import donation_journal
+from logic.webhooks import webhook_dispatcher
+from logic.audit_log import audit_log
 
 class Donate(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.data_dir = "/root/ghosted-bot/data/donations/leaderboard"
-
-        # Ensure the leaderboard directory exists
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
-
-    def load_donator_data(self, user_id):
-        """Loads a donator's data from their JSON file."""
-        file_path = os.path.join(self.data_dir, f"{user_id}.json")
-        if os.path.exists(file_path):
-            with open(file_path, "r") as f:
-                return json.load(f)
-        return {"rs3_donated": 0, "osrs_donated": 0}
-
-    def save_donator_data(self, user_id, data):
-        """Saves a donator's data to their JSON file."""
-        file_path = os.path.join(self.data_dir, f"{user_id}.json")
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=4)
-
-    def get_leaderboard(self):
-        """Retrieves and sorts the top donators based on total donations."""
-        leaderboard_data = []
-        for file in os.listdir(self.data_dir):
-            if file.endswith(".json"):
-                file_path = os.path.join(self.data_dir, file)
-                with open(file_path, "r") as f:
-                    try:
-                        data = json.load(f)
-                        total_donated = data.get("rs3_donated", 0) + data.get("osrs_donated", 0)
-                        leaderboard_data.append({
-                            "id": file.replace(".json", ""),
-                            "total_donated": total_donated,
-                            "rs3_donated": data.get("rs3_donated", 0),
-                            "osrs_donated": data.get("osrs_donated", 0)
-                        })
-                    except json.JSONDecodeError:
-                        continue
-
-        return sorted(leaderboard_data, key=lambda x: x["total_donated"], reverse=True)[:10]
-
-    async def log_command_usage(self, interaction, command_name):
-        """Logs command usage to the logs channel."""
-        logs_channel = config.CHANNEL_IDS.get("logs")
-        if logs_channel:
-            channel = interaction.guild.get_channel(logs_channel)
-            if channel:
-                timestamp = int(datetime.now().timestamp())
-                await channel.send(
-                    f"<t:{timestamp}:F> <@{interaction.user.id}> used command `/{command_name}` in channel <#{interaction.channel.id}>."
-                )
+        self.save_leaderboard_index.start()
+        self.compact_donation_journal.start()
+
+    def cog_unload(self):
+        self.save_leaderboard_index.cancel()
+        self.compact_donation_journal.cancel()
+        self.bot.loop.create_task(leaderboard_index.save_if_dirty())
+
+    @tasks.loop(seconds=60)
+    async def save_leaderboard_index(self):
+        """Periodically persists the leaderboard index snapshot."""
+        await leaderboard_index.save_if_dirty()
+
+    @save_leaderboard_index.before_loop
+    async def before_save_leaderboard_index(self):
+        """Loads or rebuilds the leaderboard index once at startup."""
+        await self.bot.wait_until_ready()
+        await leaderboard_index.ensure_loaded()
+
+    @tasks.loop(minutes=10)
+    async def compact_donation_journal(self):
+        """Periodically folds the donation journal into the donation totals."""
+        try:
+            await donation_journal.compact()
+        except Exception:
+            error_traceback = traceback.format_exc()
+            debugging_channel = self.bot.get_channel(config.CHANNEL_IDS['debugging'])
+            if debugging_channel:
+                await debugging_channel.send(f"Exception while compacting donation journal: ```{error_traceback}```")
+
+    @compact_donation_journal.before_loop
+    async def before_compact_donation_journal(self):
+        await self.bot.wait_until_ready()
+
+    async def get_leaderboard(self):
+        """Retrieves the top donators based on total donations."""
+        await leaderboard_index.ensure_loaded()
+        return leaderboard_index.top(10)
 
     def convert_amount(self, amount_str):
         """Converts an amount string (e.g., 5m, 10k, 1b) into an integer."""
@@ -124,13 +112,9 @@ class Donate(commands.Cog):
                 await interaction.followup.send("Invalid amount format. Please enter a valid number.", ephemeral=True)
                 return
 
-            # Load and update donator data
-            donator_data = self.load_donator_data(donator_id)
-            if game == "rs3":
-                donator_data["rs3_donated"] += amount_full
-            else:
-                donator_data["osrs_donated"] += amount_full
-            self.save_donator_data(donator_id, donator_data)
+            # Journal the donation; the leaderboard index follows the journal
+            await leaderboard_index.ensure_loaded()
+            await donation_journal.append(donator_id, game, amount_full, interaction.user.id)
 
             # Create an embed confirmation
             embed = nextcord.Embed(
@@ -146,7 +130,7 @@ class Donate(commands.Cog):
             await interaction.followup.send(embed=embed)
 
             # Log command usage
-            await self.log_command_usage(interaction, "donate")
+            audit_log.record(interaction, "donate")
 
             # Update leaderboard post
             await self.update_donations_post(interaction)
@@ -160,7 +144,7 @@ class Donate(commands.Cog):
     async def update_donations_post(self, interaction):
         """Updates the donation leaderboard post."""
         try:
-            leaderboard = self.get_leaderboard()
+            leaderboard = await self.get_leaderboard()
             embeds = {
                 "content": None,
                 "embeds": [
@@ -188,8 +172,7 @@ class Donate(commands.Cog):
                 embeds['embeds'][0]['fields'].append(field)
 
             message_id = config.COPY_MESSAGE['leaderboardpost'].split('/')[-1]
-            response = requests.patch(f"{config.WEBHOOK_URLS['donations']}/messages/{message_id}", json=embeds)
-            response.raise_for_status()
+            await webhook_dispatcher.edit_message(config.WEBHOOK_URLS['donations'], message_id, embeds)
 
         except Exception as e:
             error_traceback = traceback.format_exc()
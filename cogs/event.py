@@ -2,22 +2,14 @@ import nextcord
 from nextcord.ext import commands
 from nextcord import Interaction, SlashOption
 import config
-import requests
 import traceback
-from datetime import datetime
+from logic.http_client import http_client
+from logic.audit_log import audit_log
 
 class Event(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-    async def log_command_usage(self, interaction, command_name):
-        """Logs command usage to the logs channel."""
-        logs_channel = self.bot.get_channel(config.CHANNEL_IDS["logs"])
-        timestamp_now = int(datetime.now().timestamp())
-        log_message = f"<t:{timestamp_now}:F> <@{interaction.user.id}> issued command `/{command_name}` in <#{interaction.channel_id}>."
-        if logs_channel:
-            await logs_channel.send(log_message)
-
     @nextcord.slash_command(name="event", description="Create a new event for Discord, Old School RuneScape, or RuneScape 3.")
     async def event(
         self,
@@ -92,7 +84,7 @@ class Event(commands.Cog):
             return
 
         # Log command usage
-        await self.log_command_usage(interaction, "event")
+        audit_log.record(interaction, "event")
 
         # Determine the webhook URL based on game choice
         webhook_key = f"events{game}"
@@ -165,7 +157,7 @@ class Event(commands.Cog):
 
         # Send the embed to the appropriate webhook
         try:
-            response = requests.post(
+            response = await http_client.post(
                 webhook_url, json={"content": roles_to_tag, "embeds": [embed.to_dict()]}
             )
 
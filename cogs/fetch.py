@@ -1,35 +1,126 @@
 import nextcord
-from nextcord.ext import commands
+from nextcord.ext import commands, tasks
 from nextcord import Interaction, SlashOption, Embed
+import time
+import random
+import asyncio
 import logging
 import traceback
 import config
-import os
-import json
-import requests
-from datetime import datetime
+from logic.http_client import HttpError
+from logic.resilience import CircuitOpenError
+from logic.roster_fetch import roster_fetcher, UPDATED
+from logic.hiscores import hiscores_enricher
+from logic.wise_old_man import wise_old_man
+from logic.audit_log import audit_log
 
 logger = logging.getLogger(__name__)
 
+# Backoff after failed scheduled syncs: 1 minute, doubling up to the sync interval
+SYNC_BACKOFF_BASE_SECONDS = 60
+
 class FetchCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.rs3_data_dir = "/root/ghosted-bot/data/members/runescape3"
-        self.osrs_data_dir = "/root/ghosted-bot/data/members/oldschoolrunescape"
-        self.discord_data_dir = "/root/ghosted-bot/data/members/discord"
-        self.rs3_api_url = "http://services.runescape.com/m=clan-hiscores/members_lite.ws?clanName=Ghosted"
-        self.osrs_api_url = "https://www.ghostedbot.com/data/osrs_clanexport.csv"
-
-        # Ensure the data directories exist
-        os.makedirs(self.rs3_data_dir, exist_ok=True)
-        os.makedirs(self.osrs_data_dir, exist_ok=True)
-        os.makedirs(self.discord_data_dir, exist_ok=True)
 
         # Role IDs
         self.discord_guest_role = 973795302752518235
         self.osrs_member_role = 1086485830018797650
         self.rs3_member_role = 973796251835432970
 
+        # Scheduled roster sync state per game
+        self.sync_interval = config.ROSTER_SYNC['interval_minutes'] * 60
+        self.sync_jitter = {}
+        self.sync_failures = {}
+        self.sync_retry_at = {}
+        self.enrich_task = None
+        self.sync_rosters.start()
+
+    def cog_unload(self):
+        self.sync_rosters.cancel()
+        if self.enrich_task is not None:
+            self.enrich_task.cancel()
+
+    async def enrich_osrs_xp(self):
+        """Refreshes OSRS total XP from Wise Old Man, then the hiscores for anyone it missed."""
+        covered = set()
+        try:
+            covered = await wise_old_man.sync_osrs_members()
+        except Exception as e:
+            logger.error(f"Wise Old Man group sync failed, falling back to the hiscores: {e}")
+
+        try:
+            await hiscores_enricher.enrich(exclude=covered)
+        except Exception as e:
+            logger.error(f"OSRS hiscores enrichment failed: {e}")
+
+    def start_osrs_enrichment(self):
+        """Starts OSRS XP enrichment in the background unless it is already running."""
+        if self.enrich_task is None or self.enrich_task.done():
+            self.enrich_task = asyncio.get_running_loop().create_task(self.enrich_osrs_xp())
+        return self.enrich_task
+
+    async def send_private_error(self, interaction, message):
+        """Sends an ephemeral error after a public defer.
+
+        The first followup replaces the deferred response and keeps its
+        visibility, so the public placeholder is deleted first.
+        """
+        try:
+            await interaction.delete_original_message()
+        except nextcord.HTTPException:
+            pass
+        await interaction.followup.send(message, ephemeral=True)
+
+    def is_sync_due(self, game):
+        """Checks whether a game's roster is due for a scheduled refresh."""
+        now = time.time()
+        if now < self.sync_retry_at.get(game, 0):
+            return False
+        last_success = roster_fetcher.last_success.get(game)
+        return last_success is None or now - last_success >= self.sync_interval + self.sync_jitter.get(game, 0)
+
+    @tasks.loop(minutes=1)
+    async def sync_rosters(self):
+        """Refreshes every roster that is due, backing off exponentially after failures."""
+        for game in config.ROSTER_SYNC['games']:
+            if not self.is_sync_due(game):
+                continue
+
+            try:
+                result, diff = await roster_fetcher.fetch(game)
+            except Exception as e:
+                failures = self.sync_failures.get(game, 0) + 1
+                self.sync_failures[game] = failures
+                delay = min(self.sync_interval, SYNC_BACKOFF_BASE_SECONDS * (2 ** (failures - 1)))
+                delay *= random.uniform(0.5, 1.0)
+                self.sync_retry_at[game] = time.time() + delay
+                logger.error(f"Scheduled {game} roster sync failed ({failures} in a row), retrying in {delay:.0f}s: {e}")
+
+                # Only report the first failure of a streak to avoid flooding the channel
+                debugging_channel = self.bot.get_channel(config.CHANNEL_IDS['debugging'])
+                if failures == 1 and debugging_channel:
+                    await debugging_channel.send(
+                        f"Scheduled `{game}` roster sync failed, backing off: ```{traceback.format_exc()[-1800:]}```"
+                    )
+                continue
+
+            self.sync_failures[game] = 0
+            self.sync_retry_at.pop(game, None)
+            self.sync_jitter[game] = random.uniform(0, config.ROSTER_SYNC['jitter_seconds'])
+            if result == UPDATED:
+                logger.info(f"Scheduled {game} roster sync applied changes: {diff.summary()}")
+            if game == "osrs":
+                # The OSRS export has no XP, so top it up from the hiscores without holding up the sync loop
+                self.start_osrs_enrichment()
+
+    @sync_rosters.before_loop
+    async def before_sync_rosters(self):
+        await self.bot.wait_until_ready()
+        # Spread the first run of every game across the jitter window
+        for game in config.ROSTER_SYNC['games']:
+            self.sync_retry_at[game] = time.time() + random.uniform(0, config.ROSTER_SYNC['jitter_seconds'])
+
     @nextcord.slash_command(name="fetch", description="Fetch data for RuneScape 3, Old School RuneScape, or Discord.")
     async def fetch(
         self,
@@ -61,44 +152,26 @@ class FetchCog(commands.Cog):
                     )
                     return
 
-                # Fetch RS3 clan data
-                response = requests.get(self.rs3_api_url)
-                if response.status_code != 200:
-                    await interaction.response.send_message(
-                        f"Failed to fetch data from RuneScape API. Status code: {response.status_code}",
-                        ephemeral=True
+                # Fetch RS3 clan data, joining a scheduled sync if one is running
+                await interaction.response.defer()
+                try:
+                    result, diff = await roster_fetcher.fetch("rs3")
+                except HttpError as e:
+                    await self.send_private_error(
+                        interaction, f"Failed to fetch data from RuneScape API. Status code: {e.status_code}"
+                    )
+                    return
+                except CircuitOpenError as e:
+                    # The stored member list stays in use until the source recovers
+                    await self.send_private_error(
+                        interaction, f"The RuneScape API is currently unavailable, so the stored member list was kept. {e}"
                     )
                     return
 
-                lines = response.text.strip().split('\n')[1:]  # Skip header
-                members_data = {}
-                file_path = os.path.join(self.rs3_data_dir, "rs3_memberlist.json")
-
-                if os.path.exists(file_path):
-                    with open(file_path, "r") as f:
-                        members_data = json.load(f)
-
-                current_members = {}
-                for line in lines:
-                    name, rank, xp, _ = line.split(",")
-                    current_members[name] = {
-                        "Clan Rank": rank,
-                        "Total XP": int(xp),
-                        "Join Date": members_data.get(name, {}).get("Join Date", "Unknown")
-                    }
-
-                # Remove members no longer in the clan
-                removed_members = set(members_data.keys()) - set(current_members.keys())
-                for member in removed_members:
-                    del members_data[member]
-
-                # Update members and add new ones
-                members_data.update(current_members)
-
-                with open(file_path, "w") as f:
-                    json.dump(members_data, f, indent=4)
-
-                confirmation_message = "The RuneScape 3 clan member list has been fetched and updated successfully."
+                if result == UPDATED:
+                    confirmation_message = f"The RuneScape 3 clan member list has been fetched and updated successfully ({diff.summary()})."
+                else:
+                    confirmation_message = "The RuneScape 3 clan member list is already up to date."
 
             elif game == "osrs":
                 if config.ROLE_IDS['osrsbotmod'] not in [role.id for role in user.roles]:
@@ -108,58 +181,31 @@ class FetchCog(commands.Cog):
                     )
                     return
 
-                # Fetch OSRS clan data
-                response = requests.get(self.osrs_api_url)
-                if response.status_code != 200:
-                    await interaction.response.send_message(
-                        f"Failed to fetch data from OSRS API. Status code: {response.status_code}",
-                        ephemeral=True
+                # Fetch OSRS clan data, joining a scheduled sync if one is running
+                await interaction.response.defer()
+                try:
+                    result, diff = await roster_fetcher.fetch("osrs")
+                except HttpError as e:
+                    await self.send_private_error(
+                        interaction, f"Failed to fetch data from OSRS API. Status code: {e.status_code}"
+                    )
+                    return
+                except CircuitOpenError as e:
+                    # The stored member list stays in use until the source recovers
+                    await self.send_private_error(
+                        interaction, f"The OSRS API is currently unavailable, so the stored member list was kept. {e}"
                     )
                     return
 
-                lines = response.text.strip().split('\n')[1:]  # Skip header
-                members_data = {}
-                file_path = os.path.join(self.osrs_data_dir, "osrs_memberlist.json")
-
-                if os.path.exists(file_path):
-                    with open(file_path, "r") as f:
-                        members_data = json.load(f)
-
-                current_members = {}
-                for line in lines:
-                    name, rank, join_date = line.split(",")
-
-                    # Convert Join Date from DD-MMM-YYYY to MM/DD/YYYY
-                    try:
-                        date_obj = datetime.strptime(join_date.strip(), "%d-%b-%Y")
-                        formatted_date = date_obj.strftime("%m/%d/%Y")
-                    except ValueError:
-                        formatted_date = "Unknown"
-
-                    current_members[name] = {
-                        "Clan Rank": rank,
-                        "Join Date": formatted_date
-                    }
-
-                # Remove members no longer in the clan
-                removed_members = set(members_data.keys()) - set(current_members.keys())
-                for member in removed_members:
-                    del members_data[member]
-
-                # Update members and add new ones
-                members_data.update(current_members)
-
-                with open(file_path, "w") as f:
-                    json.dump(members_data, f, indent=4)
-
-                confirmation_message = "The Old School RuneScape clan member list has been fetched and updated successfully."
+                if result == UPDATED:
+                    confirmation_message = f"The Old School RuneScape clan member list has been fetched and updated successfully ({diff.summary()})."
+                else:
+                    confirmation_message = "The Old School RuneScape clan member list is already up to date."
+                confirmation_message += " Total XP is being refreshed from the hiscores in the background."
+                self.start_osrs_enrichment()
 
             # Logging command usage
-            log_channel = self.bot.get_channel(config.CHANNEL_IDS['logs'])
-            timestamp = int(datetime.utcnow().timestamp())
-            log_message = f"<t:{timestamp}:F> <@{user.id}> used command `/fetch` in channel <#{interaction.channel.id}>."
-            if log_channel:
-                await log_channel.send(log_message)
+            audit_log.record(interaction, "fetch")
 
             # Sending a confirmation embed
             embed = Embed(
@@ -167,15 +213,16 @@ class FetchCog(commands.Cog):
                 description=confirmation_message,
                 color=nextcord.Color.green()
             )
-            await interaction.response.send_message(embed=embed)
+            await interaction.followup.send(embed=embed)
 
         except Exception as e:
             error_traceback = traceback.format_exc()
             logger.error(f"Error executing fetch command for {game}: {error_traceback}")
-            await interaction.response.send_message(
-                f"<@{interaction.user.id}>, there was an error executing this command. Please check the debugging channel for more details.",
-                ephemeral=True
-            )
+            error_message = f"<@{interaction.user.id}>, there was an error executing this command. Please check the debugging channel for more details."
+            if interaction.response.is_done():
+                await self.send_private_error(interaction, error_message)
+            else:
+                await interaction.response.send_message(error_message, ephemeral=True)
             debugging_channel = self.bot.get_channel(config.CHANNEL_IDS['debugging'])
             if debugging_channel:
                 await debugging_channel.send(
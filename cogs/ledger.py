@@ -1,48 +1,15 @@
 import nextcord
 from nextcord.ext import commands
 from nextcord import Interaction, SlashOption
-import os
-import json
 import config
-import requests
 import traceback
-from datetime import datetime
+from logic.storage import storage
+from logic.webhooks import webhook_dispatcher
+from logic.audit_log import audit_log
 
 class Ledger(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.data_dir = "/root/ghosted-bot/data/donations"
-        self.ledger_file = os.path.join(self.data_dir, "ledger.json")
-
-        # Ensure data directory exists
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
-
-        # Ensure ledger file exists with default values
-        if not os.path.exists(self.ledger_file):
-            with open(self.ledger_file, "w") as f:
-                json.dump({"rs3": 0, "osrs": 0}, f, indent=4)
-
-    def load_ledger(self):
-        """Loads ledger data from the JSON file."""
-        with open(self.ledger_file, "r") as f:
-            return json.load(f)
-
-    def save_ledger(self, data):
-        """Saves ledger data to the JSON file."""
-        with open(self.ledger_file, "w") as f:
-            json.dump(data, f, indent=4)
-
-    async def log_command_usage(self, interaction, command_name):
-        """Logs command usage to the logs channel."""
-        logs_channel = config.CHANNEL_IDS.get("logs")
-        if logs_channel:
-            channel = interaction.guild.get_channel(logs_channel)
-            if channel:
-                timestamp = int(datetime.now().timestamp())
-                await channel.send(
-                    f"<t:{timestamp}:F> <@{interaction.user.id}> used command `/{command_name}` in channel <#{interaction.channel.id}>."
-                )
 
     def convert_amount(self, amount_str):
         """Converts an amount string (e.g., 5m, 10k, 1b) into an integer."""
@@ -109,20 +76,14 @@ class Ledger(commands.Cog):
             return
 
         try:
-            # Load ledger data
-            ledger_data = self.load_ledger()
-
             # Update the ledger with the new value (REPLACE instead of ADD)
-            ledger_data[game] = amount_full
-            self.save_ledger(ledger_data)
+            await storage.set_ledger_amount(game, amount_full)
+            ledger_data = await storage.get_ledger()
 
             # Format amounts
             formatted_rs3 = self.format_amount(ledger_data["rs3"])
             formatted_osrs = self.format_amount(ledger_data["osrs"])
 
-            # Update the ledger post
-            await self.update_ledger_post(interaction, formatted_rs3, formatted_osrs)
-
             # Create an embed response
             embed = nextcord.Embed(
                 title="📜 Clan Ledger Updated",
@@ -136,7 +97,10 @@ class Ledger(commands.Cog):
             await interaction.response.send_message(embed=embed)
 
             # Log command usage
-            await self.log_command_usage(interaction, "ledger")
+            audit_log.record(interaction, "ledger")
+
+            # Update the ledger post
+            await self.update_ledger_post(interaction, formatted_rs3, formatted_osrs)
 
         except Exception as e:
             error_traceback = traceback.format_exc()
@@ -178,12 +142,8 @@ class Ledger(commands.Cog):
             # Get the message ID from the ledger post URL
             message_id = config.COPY_MESSAGE['ledgerpost'].split('/')[-1]
 
-            # Make the PATCH request to update the existing message
-            response = requests.patch(
-                f"{config.WEBHOOK_URLS['donations']}/messages/{message_id}",
-                json=webhook_message
-            )
-            response.raise_for_status()
+            # Queue the edit of the existing message
+            await webhook_dispatcher.edit_message(config.WEBHOOK_URLS['donations'], message_id, webhook_message)
 
         except Exception as e:
             error_traceback = traceback.format_exc()
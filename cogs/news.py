@@ -2,22 +2,14 @@ import nextcord
 from nextcord.ext import commands
 from nextcord import Interaction, SlashOption
 import config
-import requests
 import traceback
-from datetime import datetime
+from logic.http_client import http_client
+from logic.audit_log import audit_log
 
 class News(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-    async def log_command_usage(self, interaction, command_name):
-        """Logs command usage to the logs channel."""
-        logs_channel = self.bot.get_channel(config.CHANNEL_IDS['logs'])
-        timestamp_now = int(datetime.now().timestamp())
-        log_message = f"<t:{timestamp_now}:F> <@{interaction.user.id}> issued command `/{command_name}` in <#{interaction.channel_id}>."
-        if logs_channel:
-            await logs_channel.send(log_message)
-
     @nextcord.slash_command(name="news", description="Post a news update for Discord, Old School RuneScape, or RuneScape 3.")
     async def news(
         self,
@@ -69,7 +61,7 @@ class News(commands.Cog):
             return
 
         # Log command usage
-        await self.log_command_usage(interaction, "news")
+        audit_log.record(interaction, "news")
 
         # Use the news webhook URL for all game choices
         webhook_url = config.WEBHOOK_URLS.get("news")
@@ -120,7 +112,7 @@ class News(commands.Cog):
 
         # Send the embed to the appropriate webhook
         try:
-            response = requests.post(
+            response = await http_client.post(
                 webhook_url, json={"content": roles_to_tag, "embeds": [embed.to_dict()]}
             )
 
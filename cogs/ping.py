@@ -2,24 +2,12 @@ import nextcord
 from nextcord.ext import commands
 from nextcord import Interaction
 import config
+from logic.audit_log import audit_log
 
 class Ping(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-    async def log_command_usage(self, interaction, command_name):
-        """Logs command usage to the logs channel."""
-        logs_channel = config.CHANNEL_IDS.get("logs")
-        if logs_channel:
-            channel = interaction.guild.get_channel(logs_channel)
-            if channel:
-                await channel.send(
-                    f"🛠 **Command Used:** `{command_name}`\n"
-                    f"👤 **User:** <@{interaction.user.id}>\n"
-                    f"📌 **Channel:** <#{interaction.channel.id}>\n"
-                    f"⏳ **Time:** <t:{int(interaction.created_at.timestamp())}:F>"
-                )
-
     @nextcord.slash_command(name="ping", description="Check the bot's response time.")
     async def ping(self, interaction: Interaction):
         """Returns the bot's latency in a stylish embed."""
@@ -55,7 +43,7 @@ class Ping(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
         # Log command usage
-        await self.log_command_usage(interaction, "ping")
+        audit_log.record(interaction, "ping")
 
 def setup(bot):
     bot.add_cog(Ping(bot))
\ No newline at end of file
@@ -1,92 +1,194 @@
 import nextcord
-from nextcord.ext import commands
+from nextcord.ext import commands, tasks
 from nextcord import Interaction, SlashOption, Embed
 import logging
 import traceback
 import config
+from datetime import time, timezone
+from logic.member_cache import member_cache
+from logic.promotion_scheduler import promotion_scheduler
+from logic.promotions_engine import forecast, get_ladder
+from logic.report_pages import ReportPages, send_report, send_chunks
 from logic.promos_rs3_logic import run_promotions as run_rs3_promotions
 from logic.promos_osrs_logic import run_promotions as run_osrs_promotions
 
 logger = logging.getLogger(__name__)
 
+# When the daily "eligible today" digest is posted
+DIGEST_TIME = time(hour=12, tzinfo=timezone.utc)
+
+# Members listed by /promotions forecast unless a count is given
+DEFAULT_FORECAST_COUNT = 10
+MAX_FORECAST_COUNT = 25
+
+GAME_CHOICES = {"RuneScape 3": "rs3", "Old School RuneScape": "osrs"}
+GAME_TITLES = {"rs3": "RuneScape 3", "osrs": "Old School RuneScape"}
+
 class PromotionsCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.eligibility_digest.start()
+
+    def cog_unload(self):
+        self.eligibility_digest.cancel()
 
-    @nextcord.slash_command(name="promotions", description="Run promotions for RuneScape 3 or Old School RuneScape members.")
-    async def promotions(
+    @tasks.loop(time=DIGEST_TIME)
+    async def eligibility_digest(self):
+        """Posts the members who became eligible for promotion today to the control panel."""
+        controlpanel_channel = self.bot.get_channel(config.CHANNEL_IDS['controlpanel'])
+        if controlpanel_channel is None:
+            return
+
+        for game, title in GAME_TITLES.items():
+            try:
+                promotions = await promotion_scheduler.digest(game)
+            except Exception:
+                logger.exception(f"Failed to build the {game} eligibility digest")
+                continue
+            if not promotions:
+                continue
+
+            pages = ReportPages(
+                f"📅 Eligible for Promotion Today ({title})",
+                (f"• {p[0]}: {p[2]} → **{p[3]}**" for p in promotions),
+                color=nextcord.Color.gold(),
+                footer=f"{len(promotions)} member(s) became eligible. Run /promotions run to review."
+            )
+            for page in pages:
+                await controlpanel_channel.send(embeds=page)
+
+    @eligibility_digest.before_loop
+    async def before_eligibility_digest(self):
+        await self.bot.wait_until_ready()
+
+    async def check_access(self, interaction, game):
+        """Checks the channel and the game's bot moderator role, replying if the user may not continue."""
+        user = interaction.user
+
+        # Restrict command to controlpanel channel
+        controlpanel_channel_id = config.CHANNEL_IDS['controlpanel']
+        if interaction.channel.id != controlpanel_channel_id:
+            await interaction.response.send_message(
+                f"This command can only be used in the <#{controlpanel_channel_id}> channel.",
+                ephemeral=True
+            )
+            return False
+
+        moderator_role = config.ROLE_IDS['rs3botmod'] if game == "rs3" else config.ROLE_IDS['osrsbotmod']
+        if moderator_role not in [role.id for role in user.roles]:
+            await interaction.response.send_message(
+                f"<@{user.id}> you do not have permission to use this command.",
+                ephemeral=True
+            )
+            return False
+
+        return True
+
+    async def report_error(self, interaction, command_name):
+        error_traceback = traceback.format_exc()
+        logger.error(f"Error executing {command_name} command: {error_traceback}")
+        # The report may already have been sent when the debug output fails
+        send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
+        await send(
+            f"<@{interaction.user.id}>, there was an error executing this command. Please check the debugging channel for more details.",
+            ephemeral=True
+        )
+        debugging_channel = self.bot.get_channel(config.CHANNEL_IDS['debugging'])
+        if debugging_channel:
+            await debugging_channel.send(
+                f"Exception while executing `{command_name}`: ```{error_traceback}```"
+            )
+
+    @nextcord.slash_command(name="promotions", description="Promotions for RuneScape 3 or Old School RuneScape members.")
+    async def promotions(self, interaction: Interaction):
+        pass
+
+    @promotions.subcommand(name="run", description="Run promotions for RuneScape 3 or Old School RuneScape members.")
+    async def promotions_run(
         self,
         interaction: Interaction,
         game: str = SlashOption(
             name="game",
             description="Specify the game version for promotions.",
-            choices={"RuneScape 3": "rs3", "Old School RuneScape": "osrs"},
+            choices=GAME_CHOICES,
             required=True,
         ),
     ):
         try:
-            user = interaction.user
-
-            # Restrict command to controlpanel channel
-            controlpanel_channel_id = config.CHANNEL_IDS['controlpanel']
-            if interaction.channel.id != controlpanel_channel_id:
-                await interaction.response.send_message(
-                    f"This command can only be used in the <#{controlpanel_channel_id}> channel.",
-                    ephemeral=True
-                )
+            if not await self.check_access(interaction, game):
                 return
 
-            if game == "rs3":
-                if config.ROLE_IDS['rs3botmod'] not in [role.id for role in user.roles]:
-                    await interaction.response.send_message(
-                        f"<@{user.id}> you do not have permission to use this command.",
-                        ephemeral=True
-                    )
-                    return
+            if not await member_cache.get_roster(game):
+                raise ValueError(f"{GAME_TITLES[game]} member list not found")
 
-                # Run the RS3 promotion logic
-                promotion_summary, debug_details = run_rs3_promotions()
+            # Eligible members come from the incremental scheduler instead of a full roster scan
+            promotions = await promotion_scheduler.eligible(game)
+            if game == "rs3":
+                promotion_summary, debug_details = run_rs3_promotions(promotions)
 
             elif game == "osrs":
-                if config.ROLE_IDS['osrsbotmod'] not in [role.id for role in user.roles]:
-                    await interaction.response.send_message(
-                        f"<@{user.id}> you do not have permission to use this command.",
-                        ephemeral=True
-                    )
-                    return
+                promotion_summary, debug_details = run_osrs_promotions(promotions)
 
-                # Run the OSRS promotion logic
-                promotion_summary, debug_details = run_osrs_promotions()
+            pages = ReportPages(
+                "🎖️ Promotion Summary 🎖️",
+                promotion_summary,
+                color=nextcord.Color.green(),
+                empty_text="No promotions were found."
+            )
+            await send_report(interaction, pages)
 
-            # Handle case with no promotions
-            if not promotion_summary:
-                promotion_summary = "No promotions were found."
+            # Send debug details to the debugging channel in as few messages as fit
+            debugging_channel = self.bot.get_channel(config.CHANNEL_IDS['debugging'])
+            if debugging_channel:
+                await send_chunks(debugging_channel, debug_details, header="Promotion Debug Details:")
 
-            embed = Embed(
-                title="🎖️ Promotion Summary 🎖️",
-                description=promotion_summary,
-                color=nextcord.Color.green()
-            )
+        except Exception:
+            await self.report_error(interaction, "/promotions run")
 
-            await interaction.response.send_message(embed=embed)
+    @promotions.subcommand(name="forecast", description="List the members closest to their next rank.")
+    async def promotions_forecast(
+        self,
+        interaction: Interaction,
+        game: str = SlashOption(
+            name="game",
+            description="Specify the game version for the forecast.",
+            choices=GAME_CHOICES,
+            required=True,
+        ),
+        count: int = SlashOption(
+            name="count",
+            description=f"How many members to list (default {DEFAULT_FORECAST_COUNT}).",
+            min_value=1,
+            max_value=MAX_FORECAST_COUNT,
+            required=False,
+            default=DEFAULT_FORECAST_COUNT,
+        ),
+    ):
+        try:
+            if not await self.check_access(interaction, game):
+                return
 
-            # Send debug details to the debugging channel only if there's content
-            debugging_channel = self.bot.get_channel(config.CHANNEL_IDS['debugging'])
-            if debugging_channel and debug_details:
-                await debugging_channel.send(f"Promotion Debug Details:\n{debug_details}")
+            upcoming = forecast(await member_cache.get_roster(game), get_ladder(game), limit=count)
 
-        except Exception as e:
-            error_traceback = traceback.format_exc()
-            logger.error(f"Error executing promotions command: {error_traceback}")
-            await interaction.response.send_message(
-                f"<@{interaction.user.id}>, there was an error executing this command. Please check the debugging channel for more details.",
-                ephemeral=True
+            lines = []
+            for index, (name, rank, next_rank, days_left, xp_left) in enumerate(upcoming):
+                remaining = []
+                if days_left:
+                    remaining.append(f"{days_left} day(s)")
+                if xp_left:
+                    remaining.append(f"{xp_left:,} XP")
+                lines.append(f"{index + 1}. {name}: {rank} → **{next_rank}** in {' and '.join(remaining)}")
+
+            embed = Embed(
+                title=f"🔮 Promotion Forecast ({GAME_TITLES[game]})",
+                description="\n".join(lines) or "No members are working towards a promotion.",
+                color=nextcord.Color.blurple()
             )
-            debugging_channel = self.bot.get_channel(config.CHANNEL_IDS['debugging'])
-            if debugging_channel:
-                await debugging_channel.send(
-                    f"Exception while executing `/promotions`: ```{error_traceback}```"
-                )
+            embed.set_footer(text="Members already eligible are listed by /promotions run.")
+            await interaction.response.send_message(embed=embed)
+
+        except Exception:
+            await self.report_error(interaction, "/promotions forecast")
 
 def setup(bot):
     bot.add_cog(PromotionsCog(bot))
\ No newline at end of file
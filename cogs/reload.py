@@ -1,10 +1,10 @@
 import nextcord
 from nextcord.ext import commands
 from nextcord import Interaction, SlashOption
-from datetime import datetime
 import config
 import traceback
 import os
+from logic.audit_log import audit_log
 
 class Reload(commands.Cog):
     def __init__(self, bot):
@@ -20,17 +20,6 @@ class Reload(commands.Cog):
             if os.path.isfile(os.path.join(cogs_directory, f)) and f.endswith('.py') and not f.startswith('__')
         ]
 
-    async def log_command_usage(self, interaction, command_name, cog_name):
-        """Logs command usage in the logs channel."""
-        logs_channel = config.CHANNEL_IDS.get("logs")
-        if logs_channel:
-            channel = interaction.guild.get_channel(logs_channel)
-            if channel:
-                timestamp = int(datetime.now().timestamp())
-                await channel.send(
-                    f"📌 <t:{timestamp}:F> <@{interaction.user.id}> used `/{command_name} {cog_name}` in <#{interaction.channel.id}>."
-                )
-
     @nextcord.slash_command(name="reload", description="Reload a specified cog.")
     async def reload(
         self,
@@ -83,7 +72,7 @@ class Reload(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
             # Log command usage
-            await self.log_command_usage(interaction, "reload", cog_name)
+            audit_log.record(interaction, "reload", cog_name)
 
         except Exception as e:
             error_traceback = traceback.format_exc()
@@ -1,50 +1,15 @@
 import nextcord
 from nextcord.ext import commands
 from nextcord import Interaction, SlashOption
-import os
-import json
 import config
 from datetime import datetime
+from logic.storage import storage
+from logic.member_loader import member_loader
+from logic.audit_log import audit_log
 
 class SetActivity(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.data_dir = "/root/ghosted-bot/data/activity"
-        self.osrs_file = os.path.join(self.data_dir, "osrs-inactivity-list.json")
-        self.rs3_file = os.path.join(self.data_dir, "rs3-inactivity-list.json")
-
-        # Ensure data directory exists
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
-
-        # Ensure the files exist
-        for file in [self.osrs_file, self.rs3_file]:
-            if not os.path.exists(file):
-                with open(file, "w") as f:
-                    json.dump([], f)
-
-    def load_data(self, file_path):
-        """Loads data from a JSON file."""
-        if os.path.exists(file_path):
-            with open(file_path, "r") as f:
-                return json.load(f)
-        return []
-
-    def save_data(self, file_path, data):
-        """Saves data to a JSON file."""
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=4)
-
-    async def log_command_usage(self, interaction, command_name):
-        """Logs command usage to the logs channel."""
-        logs_channel = config.CHANNEL_IDS.get("logs")
-        if logs_channel:
-            channel = interaction.guild.get_channel(logs_channel)
-            if channel:
-                timestamp = int(datetime.now().timestamp())
-                await channel.send(
-                    f"<t:{timestamp}:F> <@{interaction.user.id}> used command `/{command_name}` in channel <#{interaction.channel.id}>."
-                )
 
     @nextcord.slash_command(name="setactivity", description="Manually set a clan member's activity status.")
     async def setactivity(
@@ -86,35 +51,30 @@ class SetActivity(commands.Cog):
             )
             return
 
-        # Try fetching the user's actual display name
-        member = interaction.guild.get_member(int(clanmember_id))
-        display_name = member.display_name if member else f"Unknown ({clanmember_id})"
+        # Try fetching the user's actual display name, falling back to the member snapshot
+        display_name = member_loader.display_name(interaction.guild, clanmember_id) or f"Unknown ({clanmember_id})"
 
-        file_paths = []
+        selected_games = []
         if game in ["osrs", "both"]:
-            file_paths.append(self.osrs_file)
+            selected_games.append("osrs")
         if game in ["rs3", "both"]:
-            file_paths.append(self.rs3_file)
+            selected_games.append("rs3")
 
         affected_games = []
-        for file_path in file_paths:
-            data = self.load_data(file_path)
-
+        for selected_game in selected_games:
             if status == "inactive":
-                if not any(entry["Discord User ID"] == clanmember_id for entry in data):
-                    data.append({
-                        "Display Name": display_name,  # Correctly store actual display name
-                        "Discord User ID": clanmember_id,
-                        "Date & Time": datetime.now().strftime("%Y-%m-%d %I:%M %p UTC")
-                    })
-                    self.save_data(file_path, data)
-                    affected_games.append("Old School RuneScape" if "osrs" in file_path else "RuneScape 3")
+                changed = await storage.mark_inactive(
+                    selected_game,
+                    clanmember_id,
+                    display_name,  # Correctly store actual display name
+                    datetime.now().strftime("%Y-%m-%d %I:%M %p UTC")
+                )
 
             elif status == "active":
-                new_data = [entry for entry in data if entry["Discord User ID"] != clanmember_id]
-                if len(new_data) != len(data):
-                    self.save_data(file_path, new_data)
-                    affected_games.append("Old School RuneScape" if "osrs" in file_path else "RuneScape 3")
+                changed = await storage.mark_active(selected_game, clanmember_id)
+
+            if changed:
+                affected_games.append("Old School RuneScape" if selected_game == "osrs" else "RuneScape 3")
 
         # Determine the message
         if not affected_games:
@@ -139,7 +99,7 @@ class SetActivity(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
         # Log command usage
-        await self.log_command_usage(interaction, "setactivity")
+        audit_log.record(interaction, "setactivity")
 
 def setup(bot):
     bot.add_cog(SetActivity(bot))
\ No newline at end of file
@@ -1,50 +1,16 @@
 import nextcord
 from nextcord.ext import commands
 from nextcord import Interaction, SlashOption
-import os
-import json
 import config
 from datetime import datetime
 import traceback
-import requests
+from logic.storage import storage
+from logic.webhooks import webhook_dispatcher
+from logic.audit_log import audit_log
 
 class Expenditure(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.data_dir = "/root/ghosted-bot/data/donations"
-        self.expenditures_file = os.path.join(self.data_dir, "expenditures.json")
-
-        # Ensure data directory exists
-        if not os.path.exists(self.data_dir):
-            os.makedirs(self.data_dir)
-
-        # Ensure expenditures file exists
-        if not os.path.exists(self.expenditures_file):
-            with open(self.expenditures_file, "w") as f:
-                json.dump([], f)
-
-    def load_expenditures(self):
-        """Loads the expenditures from the JSON file."""
-        if os.path.exists(self.expenditures_file):
-            with open(self.expenditures_file, "r") as f:
-                return json.load(f)
-        return []
-
-    def save_expenditures(self, data):
-        """Saves only the most recent 5 expenditures."""
-        with open(self.expenditures_file, "w") as f:
-            json.dump(data[:5], f, indent=4)
-
-    async def log_command_usage(self, interaction, command_name):
-        """Logs command usage to the logs channel."""
-        logs_channel = config.CHANNEL_IDS.get("logs")
-        if logs_channel:
-            channel = interaction.guild.get_channel(logs_channel)
-            if channel:
-                timestamp = int(datetime.now().timestamp())
-                await channel.send(
-                    f"<t:{timestamp}:F> <@{interaction.user.id}> used command `/{command_name}` in channel <#{interaction.channel.id}>."
-                )
 
     def convert_amount(self, amount_str):
         """Converts an amount string (e.g., 5m, 10k, 1b) into an integer."""
@@ -115,12 +81,11 @@ class Expenditure(commands.Cog):
             await interaction.response.send_message("Invalid amount format. Please enter a valid number.", ephemeral=True)
             return
 
-        # Save the expenditure to JSON
+        # Save the expenditure
         date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         timestamp = int(datetime.strptime(date, "%Y-%m-%d %H:%M:%S").timestamp())
 
-        expenditures = self.load_expenditures()
-        expenditures.insert(0, {  # Insert new entry at the beginning
+        await storage.add_expenditure({
             "date": date,
             "timestamp": timestamp,
             "amount": amount_full,
@@ -128,7 +93,7 @@ class Expenditure(commands.Cog):
             "game": "Old School RuneScape" if game == "osrs" else "RuneScape 3",
             "reason": reason
         })
-        self.save_expenditures(expenditures)  # Save only the latest 5
+        expenditures = await storage.get_recent_expenditures(5)
 
         # Create confirmation embed
         embed = nextcord.Embed(
@@ -144,7 +109,7 @@ class Expenditure(commands.Cog):
         await interaction.response.send_message(embed=embed)
 
         # Log command usage
-        await self.log_command_usage(interaction, "spend")
+        audit_log.record(interaction, "spend")
 
         # Update the expenditure post
         await self.update_expenditure_post(interaction, expenditures)
@@ -178,16 +143,7 @@ class Expenditure(commands.Cog):
                 }
                 embeds["embeds"][0]["fields"].append(field)
 
-            headers = {"Content-Type": "application/json"}
-
-            response = requests.patch(
-                f"{webhook_url}/messages/{message_id}",
-                json=embeds,
-                headers=headers
-            )
-
-            if response.status_code not in [200, 204]:
-                raise Exception(f"Failed to update webhook message: {response.status_code} {response.text}")
+            await webhook_dispatcher.edit_message(webhook_url, message_id, embeds)
 
         except Exception as e:
             error_traceback = traceback.format_exc()
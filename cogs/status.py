@@ -1,14 +1,32 @@
 import nextcord
-from nextcord.ext import commands
+from nextcord.ext import commands, tasks
 from nextcord import Interaction
 import config
-import psutil
 import time
+from logic.audit_log import audit_log
+from logic.metrics import metrics_sampler, SAMPLE_INTERVAL_SECONDS
+from logic.cog_loader import cog_loader
+
+# Discord's embed field value limit
+MAX_FIELD_LENGTH = 1024
 
 class Status(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.start_time = time.time()  # Bot start time for uptime calculation
+        self.sample_metrics.start()
+
+    def cog_unload(self):
+        self.sample_metrics.cancel()
+
+    @tasks.loop(seconds=SAMPLE_INTERVAL_SECONDS)
+    async def sample_metrics(self):
+        """Records process metrics into the sampler's ring buffer."""
+        await metrics_sampler.sample(self.bot)
+
+    @sample_metrics.before_loop
+    async def before_sample_metrics(self):
+        await self.bot.wait_until_ready()
 
     def get_uptime(self):
         """Calculate bot uptime in HH:MM:SS format."""
@@ -17,18 +35,32 @@ class Status(commands.Cog):
         minutes, seconds = divmod(remainder, 60)
         return f"{hours}h {minutes}m {seconds}s"
 
-    async def log_command_usage(self, interaction, command_name):
-        """Logs command usage to the logs channel."""
-        logs_channel = config.CHANNEL_IDS.get("logs")
-        if logs_channel:
-            channel = interaction.guild.get_channel(logs_channel)
-            if channel:
-                await channel.send(
-                    f"🛠 **Command Used:** `{command_name}`\n"
-                    f"👤 **User:** <@{interaction.user.id}>\n"
-                    f"📌 **Channel:** <#{interaction.channel.id}>\n"
-                    f"⏳ **Time:** <t:{int(interaction.created_at.timestamp())}:F>"
+    def format_trend(self, key, unit, digits=1):
+        """Formats the min / avg / max of a metric over the last hour."""
+        summary = metrics_sampler.summary(key)
+        if summary is None:
+            return "`n/a`"
+        low, average, high = summary
+        return f"`{low:.{digits}f} / {average:.{digits}f} / {high:.{digits}f} {unit}`"
+
+    def format_cog_timings(self):
+        """Formats the per-cog load timings as a table, slowest first."""
+        header = f"{'Cog':<15}{'Phase':<6}{'Load':>8}{'Mem':>8}"
+        lines = [header]
+        for timing in cog_loader.report():
+            if timing["error"]:
+                line = f"{timing['name']:<15}{timing['phase'][:4]:<6}{'failed':>16}"
+            else:
+                line = (
+                    f"{timing['name']:<15}{timing['phase'][:4]:<6}"
+                    f"{timing['load_ms']:>6.0f}ms"
+                    f"{timing['rss_delta_mb']:>+6.1f}MB"
                 )
+            # Leave room for the code block fence
+            if sum(len(entry) + 1 for entry in lines) + len(line) + 8 > MAX_FIELD_LENGTH:
+                break
+            lines.append(line)
+        return "```\n" + "\n".join(lines) + "\n```"
 
     @nextcord.slash_command(name="status", description="Check the bot's system status.")
     async def status(self, interaction: Interaction):
@@ -51,9 +83,8 @@ class Status(commands.Cog):
             )
             return
 
-        # Get system stats
-        memory_usage = psutil.virtual_memory().percent  # RAM Usage
-        cpu_usage = psutil.cpu_percent(interval=1)  # CPU Usage
+        # Get process stats from the sampler, taking a first sample if none exist yet
+        latest = metrics_sampler.latest() or await metrics_sampler.sample(self.bot)
         uptime = self.get_uptime()  # Bot uptime
         loaded_cogs = ", ".join(self.bot.cogs.keys())  # List of loaded cogs
 
@@ -64,15 +95,31 @@ class Status(commands.Cog):
             color=0x3498DB  # Blue color
         )
         embed.add_field(name="🕒 Uptime", value=f"`{uptime}`", inline=True)
-        embed.add_field(name="💾 RAM Usage", value=f"`{memory_usage}%`", inline=True)
-        embed.add_field(name="⚡ CPU Usage", value=f"`{cpu_usage}%`", inline=True)
+        embed.add_field(name="💾 Process Memory", value=f"`{latest['rss_mb']:.1f} MB`", inline=True)
+        embed.add_field(name="⚡ Process CPU", value=f"`{latest['cpu_percent']:.1f}%`", inline=True)
+        embed.add_field(name="🔄 Event Loop Lag", value=f"`{latest['loop_lag_ms']:.2f} ms`", inline=True)
+        embed.add_field(name="📂 Open Files", value=f"`{latest['open_files']}`", inline=True)
+        latency = f"{latest['latency_ms']:.0f} ms" if latest["latency_ms"] is not None else "n/a"
+        embed.add_field(name="📶 Gateway Latency", value=f"`{latency}`", inline=True)
+        embed.add_field(
+            name="📈 Last Hour (min / avg / max)",
+            value=(
+                f"Memory: {self.format_trend('rss_mb', 'MB')}\n"
+                f"CPU: {self.format_trend('cpu_percent', '%')}\n"
+                f"Loop Lag: {self.format_trend('loop_lag_ms', 'ms', 2)}\n"
+                f"Latency: {self.format_trend('latency_ms', 'ms', 0)}"
+            ),
+            inline=False
+        )
         embed.add_field(name="🧩 Loaded Cogs", value=f"`{loaded_cogs}`", inline=False)
+        if cog_loader.timings:
+            embed.add_field(name="⏱️ Cog Load Times", value=self.format_cog_timings(), inline=False)
         embed.set_footer(text="Ghosted Bot | System Metrics")
 
         await interaction.response.send_message(embed=embed)
 
         # Log command usage
-        await self.log_command_usage(interaction, "status")
+        audit_log.record(interaction, "status")
 
 def setup(bot):
     bot.add_cog(Status(bot))
\ No newline at end of file
@@ -1,23 +1,13 @@
 import nextcord
 from nextcord.ext import commands
-from datetime import datetime
 import config
+from logic.audit_log import audit_log
+from logic.command_sync import force_sync
 
 class Sync(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-    async def log_command_usage(self, interaction):
-        """Logs command usage in the logs channel."""
-        logs_channel = config.CHANNEL_IDS.get("logs")
-        if logs_channel:
-            channel = interaction.guild.get_channel(logs_channel)
-            if channel:
-                timestamp = int(datetime.now().timestamp())
-                await channel.send(
-                    f"🔄 <t:{timestamp}:F> <@{interaction.user.id}> used `/sync` in <#{interaction.channel.id}>."
-                )
-
     @nextcord.slash_command(name="sync", description="Force sync all application commands.")
     async def sync(self, interaction: nextcord.Interaction):
         """Force sync all application commands."""
@@ -39,7 +29,7 @@ class Sync(commands.Cog):
             return
 
         try:
-            await self.bot.sync_application_commands()
+            await force_sync(self.bot)
             embed = nextcord.Embed(
                 title="✅ Commands Synced",
                 description="All application commands have been successfully synchronized.",
@@ -50,7 +40,7 @@ class Sync(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
             # Log command usage
-            await self.log_command_usage(interaction)
+            audit_log.record(interaction, "sync")
 
         except Exception as e:
             embed = nextcord.Embed(
@@ -63,4 +63,58 @@ COPY_MESSAGE = {
 WISE_OLD_MAN_CREDENTIALS = {
     'group_id': 6371,
     'verification_code': '510-175-985'
+}
+
+# Cog loading manifest: critical cogs load before connecting, deferred cogs (and any
+# cog not listed here) load once the bot is ready, disabled cogs are not loaded
+COG_MANIFEST = {
+    'critical': ['activity', 'donate', 'event', 'ledger', 'news', 'ping', 'reload', 'spend', 'status', 'sync'],
+    'deferred': ['changejoindate', 'check', 'checkactivity', 'checkjoindate', 'fetch', 'promotions', 'setactivity'],
+    'disabled': []
+}
+
+# Background roster sync: how often each game's member list is refreshed, plus a
+# random delay of up to jitter_seconds so runs do not line up with other traffic
+ROSTER_SYNC = {
+    'games': ['rs3', 'osrs'],
+    'interval_minutes': 30,
+    'jitter_seconds': 300
+}
+
+# Promotion rank ladders, listed from most junior to most senior. A rank with a
+# min_days and/or min_xp requirement is reached once the member meets both; ranks
+# without requirements are entry ranks that are never promoted to. Requirements
+# must not decrease going up the ladder.
+RANK_LADDERS = {
+    'rs3': {
+        'default_rank': 'Recruit',
+        'ranks': [
+            {'name': 'Recruit', 'min_xp': 0},
+            {'name': 'Corporal', 'min_days': 31},
+            {'name': 'Sergeant', 'min_days': 91},
+            {'name': 'Lieutenant', 'min_days': 181},
+            {'name': 'Captain', 'min_days': 366}
+        ],
+        'ignored_ranks': ['Captain', 'General', 'Overseer', 'Admin', 'Deputy Owner', 'Owner']
+    },
+    'osrs': {
+        'default_rank': 'thief',
+        'ranks': [
+            {'name': 'thief'},
+            {'name': 'recruit', 'min_days': 14, 'min_xp': 50000},
+            {'name': 'corporal', 'min_days': 44, 'min_xp': 100000},
+            {'name': 'sergeant', 'min_days': 94, 'min_xp': 500000},
+            {'name': 'lieutenant', 'min_days': 154, 'min_xp': 1000000},
+            {'name': 'captain', 'min_days': 214, 'min_xp': 2000000},
+            {'name': 'general', 'min_days': 274, 'min_xp': 3000000},
+            {'name': 'officer', 'min_days': 334, 'min_xp': 5000000},
+            {'name': 'commander', 'min_days': 394, 'min_xp': 15000000},
+            {'name': 'colonel', 'min_days': 454, 'min_xp': 25000000},
+            {'name': 'brigadier', 'min_days': 494, 'min_xp': 50000000},
+            {'name': 'admiral', 'min_days': 524, 'min_xp': 100000000},
+            {'name': 'marshal', 'min_days': 547, 'min_xp': 200000000}
+        ],
+        'ignored_ranks': ['diamond', 'onyx', 'administrator', 'gnome elder', 'mentor', 'prefect', 'supervisor', 'leader',
+                          'superior', 'executive', 'coordinator', 'moderator', 'deputy owner', 'owner']
+    }
 }
\ No newline at end of file
@@ -0,0 +1,109 @@
+import time
+import asyncio
+import logging
+import config
+from logic.storage import storage
+
+logger = logging.getLogger(__name__)
+
+# Flush to the logs channel every N seconds or M records, whichever comes first
+FLUSH_INTERVAL_SECONDS = 10
+FLUSH_MAX_RECORDS = 20
+
+# Discord's message length limit
+MAX_MESSAGE_LENGTH = 2000
+
+
+class AuditLog:
+    """Batched command usage log.
+
+    Commands call record(), which only enqueues a structured record. A
+    background flusher writes each batch to the audit_log table and posts
+    it to the logs channel as one message, so logging no longer costs a
+    Discord API call per command.
+    """
+
+    def __init__(self, flush_interval=FLUSH_INTERVAL_SECONDS, max_records=FLUSH_MAX_RECORDS):
+        self.flush_interval = flush_interval
+        self.max_records = max_records
+        self._bot = None
+        self._records = []
+        self._batch_full = asyncio.Event()
+        self._flusher = None
+
+    def bind(self, bot):
+        """Sets the bot used to look up the logs channel."""
+        self._bot = bot
+
+    def record(self, interaction, command_name, details=None):
+        """Enqueues a command usage record."""
+        self._records.append({
+            "timestamp": int(time.time()),
+            "user_id": str(interaction.user.id),
+            "command": command_name,
+            "channel_id": str(interaction.channel_id) if interaction.channel_id else None,
+            "details": details
+        })
+
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.get_running_loop().create_task(self._run())
+        if len(self._records) >= self.max_records:
+            self._batch_full.set()
+
+    @staticmethod
+    def format_record(record):
+        command = f"/{record['command']}"
+        if record["details"]:
+            command = f"{command} {record['details']}"
+        channel = f" in channel <#{record['channel_id']}>" if record["channel_id"] else ""
+        return f"<t:{record['timestamp']}:F> <@{record['user_id']}> used command `{command}`{channel}."
+
+    @staticmethod
+    def _chunk_lines(lines):
+        chunks, current = [], ""
+        for line in lines:
+            line = line[:MAX_MESSAGE_LENGTH]
+            if current and len(current) + 1 + len(line) > MAX_MESSAGE_LENGTH:
+                chunks.append(current)
+                current = line
+            else:
+                current = f"{current}\n{line}" if current else line
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+            if not self._records:
+                return
+
+    async def flush(self):
+        """Writes and posts every queued record."""
+        records, self._records = self._records, []
+        self._batch_full.clear()
+        if not records:
+            return
+
+        try:
+            await storage.add_audit_records(records)
+        except Exception:
+            logger.exception("Failed to store audit log records")
+
+        channel = self._bot.get_channel(config.CHANNEL_IDS["logs"]) if self._bot else None
+        if channel is None:
+            return
+
+        try:
+            for chunk in self._chunk_lines([self.format_record(record) for record in records]):
+                await channel.send(chunk)
+        except Exception:
+            logger.exception("Failed to post audit log batch to the logs channel")
+
+
+# Shared audit log used by every cog
+audit_log = AuditLog()
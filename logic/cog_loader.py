@@ -0,0 +1,131 @@
+import os
+import time
+import asyncio
+import logging
+import config
+from logic.lazy_import import lazy_import
+
+# Only needed where /proc is unavailable
+psutil = lazy_import("psutil")
+
+logger = logging.getLogger(__name__)
+
+# Directory and package the cogs are loaded from
+COGS_DIR = "./cogs"
+COGS_PACKAGE = "cogs"
+
+# Warn about any single extension slower than this, and about critical loading over budget
+SLOW_EXTENSION_MS = 500
+CRITICAL_BUDGET_MS = 5000
+
+
+class CogLoader:
+    """Manifest-driven, instrumented extension loader.
+
+    Critical cogs are loaded before the bot connects; deferred cogs (and
+    any cog missing from the manifest) are loaded once the gateway is
+    ready; disabled cogs are skipped. The time load_extension takes (the
+    module body plus its setup function) and the process RSS delta are
+    recorded per extension.
+    """
+
+    def __init__(self, cogs_dir=COGS_DIR, manifest=None):
+        self.cogs_dir = cogs_dir
+        self.manifest = manifest if manifest is not None else config.COG_MANIFEST
+        self.timings = {}
+        self._deferred_task = None
+
+    @staticmethod
+    def _current_rss():
+        # Read /proc directly so measuring memory does not itself import psutil at startup
+        try:
+            with open("/proc/self/statm", "r") as statm:
+                return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return psutil.Process(os.getpid()).memory_info().rss
+
+    def plan(self):
+        """Returns (critical, deferred) lists of cog names present on disk."""
+        available = sorted(
+            filename[:-3] for filename in os.listdir(self.cogs_dir)
+            if filename.endswith(".py") and not filename.startswith("__")
+        )
+        disabled = set(self.manifest.get("disabled", []))
+        critical = [name for name in self.manifest.get("critical", []) if name in available and name not in disabled]
+        deferred = [name for name in available if name not in critical and name not in disabled]
+
+        for name in self.manifest.get("critical", []) + self.manifest.get("deferred", []):
+            if name not in available:
+                logger.warning(f"Cog manifest lists missing cog: {name}")
+        return critical, deferred
+
+    async def _load(self, bot, name, phase):
+        extension = f"{COGS_PACKAGE}.{name}"
+        if extension in bot.extensions:
+            return self.timings.get(name)
+
+        rss_before = self._current_rss()
+        started = time.perf_counter()
+        error = None
+        try:
+            # load_extension executes the module itself, so it is not imported beforehand
+            bot.load_extension(extension)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.error(f"Failed to load cog {name}: {error}")
+
+        timing = {
+            "name": name,
+            "phase": phase,
+            "load_ms": (time.perf_counter() - started) * 1000,
+            "rss_delta_mb": (self._current_rss() - rss_before) / (1024 * 1024),
+            "error": error
+        }
+        self.timings[name] = timing
+
+        if error is None:
+            logger.info(
+                f"Loaded cog {name} ({phase}) in {timing['load_ms']:.0f} ms "
+                f"({timing['rss_delta_mb']:+.1f} MB)"
+            )
+        if timing["load_ms"] > SLOW_EXTENSION_MS:
+            logger.warning(f"Cog {name} took {timing['load_ms']:.0f} ms to load")
+        return timing
+
+    async def _load_all(self, bot, names, phase):
+        started = time.perf_counter()
+        for name in names:
+            await self._load(bot, name, phase)
+            # Yield between cogs so a long deferred load does not starve the gateway
+            await asyncio.sleep(0)
+        return (time.perf_counter() - started) * 1000
+
+    async def load_critical(self, bot):
+        """Loads the critical cogs; call before the bot connects."""
+        critical, _deferred = self.plan()
+        elapsed_ms = await self._load_all(bot, critical, "critical")
+        logger.info(f"Loaded {len(critical)} critical cog(s) in {elapsed_ms:.0f} ms")
+        if elapsed_ms > CRITICAL_BUDGET_MS:
+            logger.warning(f"Critical cogs took {elapsed_ms:.0f} ms, over the {CRITICAL_BUDGET_MS} ms budget")
+        return elapsed_ms
+
+    async def load_deferred(self, bot):
+        """Loads the deferred cogs once; later calls wait for the first load."""
+        if self._deferred_task is None:
+            _critical, deferred = self.plan()
+            self._deferred_task = asyncio.get_running_loop().create_task(
+                self._load_all(bot, deferred, "deferred")
+            )
+        return await asyncio.shield(self._deferred_task)
+
+    def report(self):
+        """Returns the recorded timings, slowest first."""
+        return sorted(
+            self.timings.values(),
+            key=lambda timing: timing["load_ms"],
+            reverse=True
+        )
+
+
+# Shared cog loader used by bot.py and the Status cog
+cog_loader = CogLoader()
@@ -0,0 +1,41 @@
+import json
+import hashlib
+import logging
+from logic.storage import storage
+
+logger = logging.getLogger(__name__)
+
+# Storage meta key holding the fingerprint of the last synced command tree
+FINGERPRINT_KEY = "command_tree_fingerprint"
+
+
+def command_fingerprint(bot):
+    """Hashes the payloads (names, options, choices, guilds) of every registered command."""
+    payloads = []
+    for command in bot.get_all_application_commands():
+        for _name, _type, guild_id in command.get_rollout_signatures():
+            payloads.append(command.get_payload(guild_id))
+
+    canonical = sorted(json.dumps(payload, sort_keys=True, default=str) for payload in payloads)
+    return hashlib.sha256("\n".join(canonical).encode("utf-8")).hexdigest()
+
+
+async def force_sync(bot):
+    """Syncs every application command with Discord and stores the new fingerprint."""
+    await bot.sync_application_commands()
+    await storage.set_meta(FINGERPRINT_KEY, command_fingerprint(bot))
+
+
+async def sync_if_changed(bot):
+    """Syncs application commands only if the command tree changed since the last sync.
+
+    Returns True if a sync was performed.
+    """
+    fingerprint = command_fingerprint(bot)
+    if await storage.get_meta(FINGERPRINT_KEY) == fingerprint:
+        logger.info("Application command tree unchanged, skipping sync")
+        return False
+
+    await bot.sync_application_commands()
+    await storage.set_meta(FINGERPRINT_KEY, fingerprint)
+    return True
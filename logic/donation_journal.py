@@ -0,0 +1,254 @@
+import os
+import json
+import time
+import asyncio
+import logging
+from logic.storage import storage
+
+logger = logging.getLogger(__name__)
+
+# Paths to the active donation journal and its compacted segments
+JOURNAL_DIR = "/root/ghosted-bot/data/donations/journal"
+JOURNAL_PATH = os.path.join(JOURNAL_DIR, "journal.jsonl")
+ARCHIVE_DIR = os.path.join(JOURNAL_DIR, "archive")
+
+# Group commit: appends arriving within this window share one fsync
+FLUSH_WINDOW_SECONDS = 0.05
+MAX_BATCH_SIZE = 64
+
+
+class DonationJournal:
+    """Append-only journal of donation events with batched fsync.
+
+    Each /donate appends one JSON line holding donor, game, amount,
+    moderator and timestamp. Appends that arrive close together are
+    written and fsynced as one batch. A batch that fails to write is cut
+    back out of the file and its sequence numbers are reused, so the
+    journal stays gapless and holds no partial lines. The compactor
+    rotates the active file into the archive and folds it into the
+    donations table, so the archive doubles as a replayable audit
+    history.
+    """
+
+    def __init__(self, journal_path=JOURNAL_PATH, archive_dir=ARCHIVE_DIR):
+        self.journal_path = journal_path
+        self.archive_dir = archive_dir
+        self.durable_seq = 0
+        self._next_seq = 1
+        self._file = None
+        self._opened = False
+        self._open_lock = asyncio.Lock()
+        self._io_lock = asyncio.Lock()
+        self._pending = []
+        self._pending_future = None
+        self._flush_tasks = set()
+        self._batch_full = asyncio.Event()
+        self._listeners = []
+
+    def add_listener(self, listener):
+        """Registers a callback invoked with each event once it is durable."""
+        self._listeners.append(listener)
+
+    # ------------------------------------------------------------ opening
+
+    def _archived_segments(self):
+        """Returns archived segment paths with their last seq, oldest first."""
+        if not os.path.isdir(self.archive_dir):
+            return []
+        segments = []
+        for file in os.listdir(self.archive_dir):
+            if file.startswith("journal-") and file.endswith(".jsonl"):
+                segments.append((int(file[len("journal-"):-len(".jsonl")]), os.path.join(self.archive_dir, file)))
+        return sorted(segments)
+
+    @staticmethod
+    def _read_file(file_path):
+        """Reads the events in a journal file, ignoring a torn final line."""
+        events = []
+        if not os.path.exists(file_path):
+            return events
+        with open(file_path, "r") as f:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                try:
+                    events.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt journal line in {file_path}")
+        return events
+
+    def _open_file(self):
+        os.makedirs(os.path.dirname(self.journal_path), exist_ok=True)
+        os.makedirs(self.archive_dir, exist_ok=True)
+
+        # Drop a torn final line left behind by a crash mid-append
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, "rb+") as f:
+                data = f.read()
+                if data and not data.endswith(b"\n"):
+                    f.truncate(data.rfind(b"\n") + 1)
+
+        last_seq = 0
+        active_events = self._read_file(self.journal_path)
+        if active_events:
+            last_seq = active_events[-1]["seq"]
+        segments = self._archived_segments()
+        if segments:
+            last_seq = max(last_seq, segments[-1][0])
+
+        self._file = open(self.journal_path, "a")
+        return last_seq
+
+    async def ensure_open(self):
+        """Opens the active journal and recovers the last sequence number."""
+        if self._opened:
+            return
+
+        async with self._open_lock:
+            if self._opened:
+                return
+            last_seq = await asyncio.to_thread(self._open_file)
+            compacted_seq = int(await storage.get_meta("journal_compacted_seq") or 0)
+            self.durable_seq = max(last_seq, compacted_seq)
+            self._next_seq = self.durable_seq + 1
+            self._opened = True
+
+    # ----------------------------------------------------------- appending
+
+    def _write_lines(self, lines):
+        # Every batch is flushed, so the file size is where this batch starts
+        offset = os.fstat(self._file.fileno()).st_size
+        try:
+            self._file.write("".join(lines))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except Exception:
+            self._truncate(offset)
+            raise
+
+    def _truncate(self, offset):
+        """Cuts the active journal back to offset, dropping a partly written batch and anything still buffered."""
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        try:
+            os.truncate(self.journal_path, offset)
+        finally:
+            self._file = open(self.journal_path, "a")
+
+    async def append(self, donator_id, game, amount, moderator_id):
+        """Appends a donation event and returns it once it is on disk."""
+        await self.ensure_open()
+
+        event = {
+            "seq": self._next_seq,
+            "donator_id": str(donator_id),
+            "game": game,
+            "amount": amount,
+            "moderator_id": str(moderator_id),
+            "timestamp": int(time.time())
+        }
+        self._next_seq += 1
+        self._pending.append(event)
+
+        if self._pending_future is None:
+            self._pending_future = asyncio.get_running_loop().create_future()
+            task = asyncio.get_running_loop().create_task(self._flush_batch())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_done)
+        if len(self._pending) >= MAX_BATCH_SIZE:
+            self._batch_full.set()
+
+        await asyncio.shield(self._pending_future)
+        return event
+
+    def _flush_done(self, task):
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Donation journal flush failed", exc_info=task.exception())
+
+    async def _flush_batch(self):
+        try:
+            await asyncio.wait_for(self._batch_full.wait(), timeout=FLUSH_WINDOW_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+        async with self._io_lock:
+            batch, future = self._pending, self._pending_future
+            self._pending, self._pending_future = [], None
+            self._batch_full.clear()
+
+            try:
+                await asyncio.to_thread(self._write_lines, [json.dumps(event) + "\n" for event in batch])
+            except Exception as e:
+                # Hand the batch's sequence numbers back; later events are still pending and unwritten
+                for event in self._pending:
+                    event["seq"] -= len(batch)
+                self._next_seq -= len(batch)
+                future.set_exception(e)
+                return
+
+            self.durable_seq = batch[-1]["seq"]
+            for event in batch:
+                for listener in self._listeners:
+                    try:
+                        listener(event)
+                    except Exception:
+                        logger.exception("Donation journal listener failed")
+            future.set_result(None)
+
+    async def close(self):
+        """Waits for batches still being written and closes the active journal."""
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        async with self._io_lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._opened = False
+
+    # ------------------------------------------------------------- reading
+
+    def _read_events(self, after_seq):
+        events = []
+        for last_seq, segment_path in self._archived_segments():
+            if last_seq > after_seq:
+                events.extend(event for event in self._read_file(segment_path) if event["seq"] > after_seq)
+        events.extend(event for event in self._read_file(self.journal_path) if event["seq"] > after_seq)
+        return events
+
+    async def read_events(self, after_seq=0):
+        """Returns every durable event with a sequence number above after_seq."""
+        await self.ensure_open()
+        async with self._io_lock:
+            return await asyncio.to_thread(self._read_events, after_seq)
+
+    # ---------------------------------------------------------- compaction
+
+    def _rotate(self):
+        """Moves the active journal into the archive and starts a new one."""
+        self._file.close()
+        events = self._read_file(self.journal_path)
+        if events:
+            os.replace(self.journal_path, os.path.join(self.archive_dir, f"journal-{events[-1]['seq']:012d}.jsonl"))
+        self._file = open(self.journal_path, "a")
+
+    async def compact(self):
+        """Folds every archived or active event into the donations table."""
+        await self.ensure_open()
+        async with self._io_lock:
+            await asyncio.to_thread(self._rotate)
+
+        compacted_seq = int(await storage.get_meta("journal_compacted_seq") or 0)
+        for last_seq, segment_path in await asyncio.to_thread(self._archived_segments):
+            if last_seq <= compacted_seq:
+                continue
+            events = await asyncio.to_thread(self._read_file, segment_path)
+            await storage.apply_donation_events(events, last_seq)
+            compacted_seq = last_seq
+            logger.info(f"Compacted donation journal through seq {last_seq}")
+
+
+# Shared donation journal used by the donation cogs
+donation_journal = DonationJournal()
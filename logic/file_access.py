@@ -0,0 +1,52 @@
+import os
+import json
+import asyncio
+import tempfile
+
+# One asyncio lock per absolute file path
+_locks = {}
+
+
+def file_lock(file_path):
+    """Returns the asyncio lock guarding a file."""
+    key = os.path.abspath(file_path)
+    lock = _locks.get(key)
+    if lock is None:
+        lock = _locks[key] = asyncio.Lock()
+    return lock
+
+
+def _read_json(file_path, default):
+    if not os.path.exists(file_path):
+        return default
+    with open(file_path, "r") as f:
+        return json.load(f)
+
+
+def _write_json_atomic(file_path, data, indent):
+    """Writes JSON to a temp file in the same directory and swaps it into place."""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+async def read_json(file_path, default=None):
+    """Reads a JSON file off the event loop, returning default if it does not exist."""
+    async with file_lock(file_path):
+        return await asyncio.to_thread(_read_json, file_path, default)
+
+
+async def write_json(file_path, data, indent=4):
+    """Atomically replaces a JSON file off the event loop."""
+    async with file_lock(file_path):
+        await asyncio.to_thread(_write_json_atomic, file_path, data, indent)
@@ -0,0 +1,179 @@
+import json
+import time
+import random
+import asyncio
+import logging
+from logic.storage import storage
+from logic.member_cache import member_cache
+from logic.http_client import http_client
+from logic.file_access import read_json, write_json
+
+logger = logging.getLogger(__name__)
+
+# OSRS hiscores lite endpoint; the first line is "rank,level,xp" for Overall
+OSRS_HISCORES_URL = "https://secure.runescape.com/m=hiscore_oldschool/index_lite.ws"
+
+# Path to the persisted per-member hiscore cache
+HISCORES_CACHE_PATH = "/root/ghosted-bot/data/hiscores/osrs_cache.json"
+
+# Lookups in flight at once, and the sustained request rate allowed
+MAX_CONCURRENT_LOOKUPS = 8
+REQUESTS_PER_SECOND = 10
+
+# A member's TTL starts at 6 hours and doubles, up to 3 days, each time their XP is unchanged
+BASE_TTL_SECONDS = 6 * 3600
+MAX_TTL_SECONDS = 3 * 24 * 3600
+
+
+class RateLimiter:
+    """Token bucket that spaces requests to a sustained rate."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class HiscoresEnricher:
+    """Fills in OSRS members' total XP from the hiscores.
+
+    Lookups run concurrently behind a semaphore and a token-bucket rate
+    limit. Results are cached per member with their own TTL: a member
+    whose XP has not moved is checked less and less often, while anyone
+    whose XP changed goes back to the base TTL. A member Wise Old Man has
+    seen no change for since their last lookup waits out the maximum TTL.
+    Members missing from the hiscores are cached too, so they are not
+    looked up every run.
+
+    base_url can point at a local stub server that serves index_lite.ws.
+    """
+
+    def __init__(self, base_url=OSRS_HISCORES_URL, cache_path=HISCORES_CACHE_PATH,
+                 max_concurrent=MAX_CONCURRENT_LOOKUPS, requests_per_second=REQUESTS_PER_SECOND):
+        self.base_url = base_url
+        self.cache_path = cache_path
+        self.max_concurrent = max_concurrent
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self._cache = None
+        self._enrich_lock = asyncio.Lock()
+
+    async def _ensure_loaded(self):
+        if self._cache is None:
+            try:
+                self._cache = await read_json(self.cache_path, default={})
+            except (json.JSONDecodeError, OSError):
+                self._cache = {}
+        return self._cache
+
+    def is_stale(self, name, now=None, last_changed=None):
+        """Checks whether a member's cached hiscore has outlived its TTL.
+
+        last_changed is the member's "Last Changed" time from Wise Old Man;
+        if it is older than the cached lookup, the maximum TTL applies.
+        """
+        entry = (self._cache or {}).get(name)
+        if entry is None:
+            return True
+        ttl = entry["ttl"]
+        if last_changed is not None and last_changed <= entry["fetched_at"]:
+            ttl = max(ttl, MAX_TTL_SECONDS)
+        return (now or time.time()) >= entry["fetched_at"] + ttl
+
+    @staticmethod
+    def parse_total_xp(text):
+        """Returns the Overall XP from an index_lite response, or None if unranked."""
+        first_line = text.strip().split("\n", 1)[0]
+        try:
+            xp = int(first_line.split(",")[2])
+        except (IndexError, ValueError):
+            return None
+        return xp if xp >= 0 else None
+
+    async def lookup(self, name):
+        """Fetches a member's total XP, or None if they are not on the hiscores.
+
+        Raises for other errors so the member is retried on the next run.
+        """
+        await self.rate_limiter.acquire()
+        # A cached fallback is not current XP; fail instead so the member keeps their old entry and is retried
+        response = await http_client.get(self.base_url, params={"player": name}, fallback=False)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return self.parse_total_xp(response.text)
+
+    def _record(self, name, xp, now):
+        previous = self._cache.get(name)
+        if previous is not None and previous["xp"] == xp:
+            ttl = min(MAX_TTL_SECONDS, previous["ttl"] * 2)
+        else:
+            ttl = BASE_TTL_SECONDS
+        # Jitter the TTL so refreshes spread out instead of expiring together
+        self._cache[name] = {"xp": xp, "fetched_at": now, "ttl": int(ttl * random.uniform(0.9, 1.1))}
+
+    async def enrich(self, force=False, exclude=()):
+        """Looks up every OSRS member whose cached XP is stale and stores the results.
+
+        Members in exclude (e.g. already covered by Wise Old Man) are
+        skipped. Returns (looked_up, failed, updated) counts.
+        """
+        async with self._enrich_lock:
+            await self._ensure_loaded()
+            roster = await member_cache.get_roster("osrs")
+            now = time.time()
+            candidates = [name for name in roster if name not in exclude]
+            names = [
+                name for name in candidates
+                if force or self.is_stale(name, now, roster[name].get("Last Changed"))
+            ]
+
+            semaphore = asyncio.Semaphore(self.max_concurrent)
+            failed = 0
+
+            async def refresh(name):
+                nonlocal failed
+                async with semaphore:
+                    try:
+                        xp = await self.lookup(name)
+                    except Exception as e:
+                        failed += 1
+                        logger.warning(f"Hiscores lookup failed for {name}: {e}")
+                        return
+                    self._record(name, xp, time.time())
+
+            started = time.perf_counter()
+            await asyncio.gather(*(refresh(name) for name in names))
+
+            # Drop cache entries for members who have left
+            for name in [name for name in self._cache if name not in roster]:
+                del self._cache[name]
+            await write_json(self.cache_path, dict(self._cache), indent=None)
+
+            xp_by_name = {
+                name: self._cache[name]["xp"]
+                for name in candidates
+                if name in self._cache and self._cache[name]["xp"] is not None
+            }
+            updated = await storage.set_total_xp("osrs", xp_by_name)
+            logger.info(
+                f"Hiscores enrichment looked up {len(names)} OSRS member(s) in "
+                f"{time.perf_counter() - started:.1f}s ({failed} failed, {updated} updated)"
+            )
+            return len(names), failed, updated
+
+
+# Shared hiscores enricher used by the roster sync
+hiscores_enricher = HiscoresEnricher()
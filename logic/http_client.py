@@ -0,0 +1,263 @@
+import json
+import codecs
+import asyncio
+import logging
+import aiohttp
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from logic.resilience import CircuitBreaker, CircuitOpenError, IDEMPOTENT_METHODS, endpoint_for, policy_for
+
+logger = logging.getLogger(__name__)
+
+# Connection pool and timeout settings shared by every outbound call
+TOTAL_CONNECTIONS = 100
+CONNECTIONS_PER_HOST = 10
+KEEPALIVE_SECONDS = 30
+CONNECT_TIMEOUT_SECONDS = 10
+READ_TIMEOUT_SECONDS = 30
+TOTAL_TIMEOUT_SECONDS = 60
+
+# Last good GET responses kept as fallbacks while an endpoint's breaker is open
+FALLBACK_CACHE_SIZE = 256
+
+# Used when a response declares no (or an unknown) charset, as requests does for text responses.
+# JSON without a charset is UTF-8.
+DEFAULT_CHARSET = "latin-1"
+JSON_CHARSET = "utf-8"
+
+
+def response_charset(headers, default=DEFAULT_CHARSET):
+    """Returns the charset declared in a Content-Type header, or default."""
+    mimetype, *parameters = headers.get("Content-Type", "").split(";")
+    for parameter in parameters:
+        key, _, value = parameter.strip().partition("=")
+        if key.strip().lower() == "charset":
+            try:
+                return codecs.lookup(value.strip().strip("\"'")).name
+            except LookupError:
+                break
+    if mimetype.strip().lower() == "application/json":
+        return JSON_CHARSET
+    return default
+
+
+class HttpError(Exception):
+    """Raised by HttpResponse.raise_for_status for non-2xx responses."""
+
+    def __init__(self, response):
+        super().__init__(f"{response.status_code} error for {response.method} {response.url}: {response.text[:200]}")
+        self.response = response
+        self.status_code = response.status_code
+
+
+class HttpResponse:
+    """Fully read response with a requests-style surface."""
+
+    def __init__(self, method, url, status_code, headers, content, from_cache=False):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.from_cache = from_cache
+
+    @property
+    def encoding(self):
+        return response_charset(self.headers)
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors="replace")
+
+    @property
+    def ok(self):
+        return 200 <= self.status_code < 300
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise HttpError(self)
+
+
+class HttpClient:
+    """Bot-wide aiohttp session with connection pooling and keep-alive.
+
+    The session is created lazily on the running loop. The connector caps
+    concurrent connections per host so a slow endpoint cannot exhaust the
+    pool, and every request gets strict connect and read timeouts.
+
+    Each endpoint (a host, or a single webhook) has a policy from
+    logic.resilience with its own timeouts, a circuit breaker, and bounded
+    jittered retries for idempotent requests on network errors and 5xx
+    responses. While a breaker is open, GETs are answered from the last
+    good response for the same URL (marked from_cache) and anything else
+    raises CircuitOpenError without touching the network. Callers that
+    store what they fetch pass fallback=False to get the error instead.
+    """
+
+    def __init__(self):
+        self._session = None
+        self._session_lock = asyncio.Lock()
+        self._breakers = {}
+        self._fallbacks = OrderedDict()
+
+    def breaker(self, endpoint):
+        """Returns the circuit breaker for an endpoint."""
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            policy = policy_for(endpoint)
+            breaker = CircuitBreaker(endpoint, policy.failure_threshold, policy.reset_timeout)
+            self._breakers[endpoint] = breaker
+        return breaker
+
+    @staticmethod
+    def _timeout(policy):
+        return aiohttp.ClientTimeout(
+            total=policy.total_timeout,
+            sock_connect=policy.connect_timeout,
+            sock_read=policy.read_timeout
+        )
+
+    @staticmethod
+    def _fallback_key(url, kwargs):
+        params = kwargs.get("params") or {}
+        return url, tuple(sorted((str(key), str(value)) for key, value in dict(params).items()))
+
+    def _remember(self, key, response):
+        self._fallbacks[key] = response
+        self._fallbacks.move_to_end(key)
+        while len(self._fallbacks) > FALLBACK_CACHE_SIZE:
+            self._fallbacks.popitem(last=False)
+
+    def _fallback(self, key):
+        cached = self._fallbacks.get(key) if key is not None else None
+        if cached is None:
+            return None
+        return HttpResponse(cached.method, cached.url, cached.status_code, cached.headers, cached.content, from_cache=True)
+
+    async def session(self):
+        """Returns the shared session, creating it on first use."""
+        if self._session is not None and not self._session.closed:
+            return self._session
+
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=TOTAL_CONNECTIONS,
+                    limit_per_host=CONNECTIONS_PER_HOST,
+                    keepalive_timeout=KEEPALIVE_SECONDS,
+                    ttl_dns_cache=300
+                )
+                timeout = aiohttp.ClientTimeout(
+                    total=TOTAL_TIMEOUT_SECONDS,
+                    sock_connect=CONNECT_TIMEOUT_SECONDS,
+                    sock_read=READ_TIMEOUT_SECONDS
+                )
+                self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+
+    async def _send(self, method, url, policy, **kwargs):
+        session = await self.session()
+        kwargs.setdefault("timeout", self._timeout(policy))
+        async with session.request(method, url, **kwargs) as response:
+            content = await response.read()
+            return HttpResponse(method, url, response.status, response.headers, content)
+
+    async def request(self, method, url, fallback=True, **kwargs):
+        """Sends a request through the endpoint's breaker and retry policy and returns the HttpResponse.
+
+        With fallback=False a GET is never answered from the fallback cache.
+        """
+        endpoint = endpoint_for(url)
+        policy = policy_for(endpoint)
+        breaker = self.breaker(endpoint)
+        fallback_key = self._fallback_key(url, kwargs) if method == "GET" and fallback else None
+
+        if not breaker.allow():
+            cached = self._fallback(fallback_key)
+            if cached is not None:
+                return cached
+            raise CircuitOpenError(endpoint, breaker.retry_after())
+
+        attempts = policy.max_attempts if method in IDEMPOTENT_METHODS else 1
+        last_error, last_response = None, None
+        for attempt in range(attempts):
+            if attempt > 0:
+                await asyncio.sleep(policy.backoff(attempt - 1))
+                if not breaker.allow():
+                    break
+
+            try:
+                response = await self._send(method, url, policy, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                breaker.record_failure()
+                last_error = e
+                logger.warning(f"{method} {endpoint} failed (attempt {attempt + 1}/{attempts}): {e!r}")
+                continue
+
+            if response.status_code >= 500:
+                breaker.record_failure()
+                last_response = response
+                logger.warning(f"{method} {endpoint} returned {response.status_code} (attempt {attempt + 1}/{attempts})")
+                continue
+
+            breaker.record_success()
+            if fallback_key is not None and response.ok:
+                self._remember(fallback_key, response)
+            return response
+
+        cached = self._fallback(fallback_key)
+        if cached is not None:
+            logger.warning(f"Serving cached response for {method} {url} after upstream failure")
+            return cached
+        if last_response is not None:
+            return last_response
+        if last_error is not None:
+            raise last_error
+        raise CircuitOpenError(endpoint, breaker.retry_after())
+
+    @asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        """Sends a request and yields the open aiohttp response so its body can be read incrementally.
+
+        Guarded by the endpoint's breaker and timeouts, but never retried.
+        """
+        endpoint = endpoint_for(url)
+        policy = policy_for(endpoint)
+        breaker = self.breaker(endpoint)
+        if not breaker.allow():
+            raise CircuitOpenError(endpoint, breaker.retry_after())
+
+        session = await self.session()
+        kwargs.setdefault("timeout", self._timeout(policy))
+        try:
+            async with session.request(method, url, **kwargs) as response:
+                if response.status >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                yield response
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            breaker.record_failure()
+            raise
+
+    async def get(self, url, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def patch(self, url, **kwargs):
+        return await self.request("PATCH", url, **kwargs)
+
+    async def close(self):
+        """Closes the shared session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# Shared HTTP client used by every cog
+http_client = HttpClient()
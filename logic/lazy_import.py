@@ -0,0 +1,168 @@
+import os
+import re
+import sys
+import time
+import json
+import logging
+import importlib
+import subprocess
+
+logger = logging.getLogger(__name__)
+
+# Path to the stored startup import profiles
+IMPORT_PROFILE_PATH = "/root/ghosted-bot/data/startup/import_profile.json"
+
+# Modules imported when profiling startup: the entry point, then every cog
+PROFILE_ENTRY_MODULES = ["bot"]
+COGS_DIR = "./cogs"
+
+# Imports cheaper than this (cumulative) are dropped from the stored tree
+PROFILE_MIN_CUMULATIVE_US = 1000
+
+_IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+# Modules loaded through lazy_import: {name: import_ms}
+lazy_import_times = {}
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            started = time.perf_counter()
+            self._module = importlib.import_module(self._name)
+            lazy_import_times[self._name] = (time.perf_counter() - started) * 1000
+            logger.info(f"Lazily imported {self._name} in {lazy_import_times[self._name]:.1f} ms")
+        return self._module
+
+    def __getattr__(self, attribute):
+        return getattr(self._load(), attribute)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+_lazy_modules = {}
+
+
+def lazy_import(name):
+    """Returns a proxy for a module that is only imported when first used.
+
+    Use it for heavy or rarely needed dependencies so their import cost is
+    paid by the first command that needs them instead of at startup.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    if name not in _lazy_modules:
+        _lazy_modules[name] = LazyModule(name)
+    return _lazy_modules[name]
+
+
+# ----------------------------------------------------------- import profile
+
+def parse_import_times(output):
+    """Parses `python -X importtime` output into a tree of {name, self_us, cumulative_us, children}."""
+    root = {"name": "<startup>", "self_us": 0, "cumulative_us": 0, "children": []}
+    # importtime prints children before their parent, indented one level deeper
+    pending = {}
+    for line in output.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = (len(indent) - 1) // 2
+        node = {
+            "name": name,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+            "children": pending.pop(depth + 1, [])
+        }
+        pending.setdefault(depth, []).append(node)
+
+    root["children"] = pending.pop(0, [])
+    root["cumulative_us"] = sum(child["cumulative_us"] for child in root["children"])
+    return root
+
+
+def _prune(node, min_cumulative_us):
+    node["children"] = [
+        _prune(child, min_cumulative_us) for child in node["children"]
+        if child["cumulative_us"] >= min_cumulative_us
+    ]
+    return node
+
+
+def _flatten(node, totals):
+    for child in node["children"]:
+        totals[child["name"]] = totals.get(child["name"], 0) + child["cumulative_us"]
+        _flatten(child, totals)
+    return totals
+
+
+def profile_startup(entry_modules=None, cogs_dir=COGS_DIR):
+    """Imports the bot and every cog in a fresh interpreter under -X importtime and returns the tree."""
+    modules = list(entry_modules or PROFILE_ENTRY_MODULES)
+    modules += [
+        f"cogs.{filename[:-3]}" for filename in sorted(os.listdir(cogs_dir))
+        if filename.endswith(".py") and not filename.startswith("__")
+    ]
+    script = "; ".join(f"import {module}" for module in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup profile failed:\n{result.stderr[-2000:]}")
+    return _prune(parse_import_times(result.stderr), PROFILE_MIN_CUMULATIVE_US)
+
+
+def compare_profiles(previous, current, limit=15):
+    """Returns [(name, previous_us, current_us)] for the imports whose cost changed the most."""
+    before = _flatten(previous, {})
+    after = _flatten(current, {})
+    changes = [(name, before.get(name, 0), after.get(name, 0)) for name in set(before) | set(after)]
+    changes.sort(key=lambda change: abs(change[2] - change[1]), reverse=True)
+    return changes[:limit]
+
+
+def store_profile(profile, label, profile_path=IMPORT_PROFILE_PATH):
+    """Stores a profile under a release label, keeping earlier releases; returns the previous one."""
+    try:
+        with open(profile_path, "r", encoding="utf-8") as file:
+            history = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        history = {"profiles": []}
+
+    previous = history["profiles"][-1] if history["profiles"] else None
+    history["profiles"] = [entry for entry in history["profiles"] if entry["label"] != label]
+    history["profiles"].append({"label": label, "recorded_at": int(time.time()), "tree": profile})
+
+    os.makedirs(os.path.dirname(profile_path), exist_ok=True)
+    temp_path = f"{profile_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(history, file, indent=None)
+    os.replace(temp_path, profile_path)
+    return previous
+
+
+if __name__ == "__main__":
+    # Usage: python -m logic.lazy_import <release label> [profile_path]
+    release = sys.argv[1] if len(sys.argv) > 1 else time.strftime("%Y-%m-%d")
+    path = sys.argv[2] if len(sys.argv) > 2 else IMPORT_PROFILE_PATH
+
+    tree = profile_startup()
+    print(f"Startup imports for {release}: {tree['cumulative_us'] / 1000:.1f} ms")
+    for child in sorted(tree["children"], key=lambda node: node["cumulative_us"], reverse=True)[:15]:
+        print(f"  {child['cumulative_us'] / 1000:>8.1f} ms  {child['name']}")
+
+    last = store_profile(tree, release, path)
+    if last is not None:
+        print(f"Change since {last['label']} ({last['tree']['cumulative_us'] / 1000:.1f} ms):")
+        for name, before_us, after_us in compare_profiles(last["tree"], tree):
+            print(f"  {(after_us - before_us) / 1000:>+8.1f} ms  {name}")
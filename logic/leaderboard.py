@@ -0,0 +1,156 @@
+import json
+import bisect
+import asyncio
+import hashlib
+import logging
+from logic.storage import storage
+from logic.donation_journal import donation_journal
+from logic.file_access import read_json, write_json
+
+logger = logging.getLogger(__name__)
+
+# Path to the persisted leaderboard index snapshot
+LEADERBOARD_INDEX_PATH = "/root/ghosted-bot/data/donations/leaderboard_index.json"
+
+
+class LeaderboardIndex:
+    """In-memory donation leaderboard kept sorted by total donated.
+
+    Entries live in a list of (-total, donator_id) tuples ordered with
+    bisect, so a donation only moves one entry instead of re-reading and
+    re-sorting every donator. The index follows the donation journal and
+    is saved to disk; it is rebuilt from the donations table plus the
+    journal tail only when the snapshot is missing, fails its checksum or
+    was taken at a different journal position.
+    """
+
+    def __init__(self, snapshot_path=LEADERBOARD_INDEX_PATH):
+        self.snapshot_path = snapshot_path
+        self._totals = {}
+        self._order = []
+        self._applied_seq = 0
+        self._loaded = False
+        self._dirty = False
+        self._load_lock = asyncio.Lock()
+
+    @staticmethod
+    def _total(totals):
+        return totals.get("rs3_donated", 0) + totals.get("osrs_donated", 0)
+
+    @staticmethod
+    def _snapshot_checksum(donators):
+        payload = json.dumps(donators, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _reset(self, donators):
+        self._totals = {
+            str(donator_id): {"rs3_donated": totals.get("rs3_donated", 0), "osrs_donated": totals.get("osrs_donated", 0)}
+            for donator_id, totals in donators.items()
+        }
+        self._order = sorted((-self._total(totals), donator_id) for donator_id, totals in self._totals.items())
+
+    async def _read_snapshot(self):
+        try:
+            return await read_json(self.snapshot_path)
+        except (json.JSONDecodeError, OSError):
+            return None
+
+    async def ensure_loaded(self):
+        """Loads the index from its snapshot, rebuilding on a checksum mismatch."""
+        if self._loaded:
+            return
+
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            await donation_journal.ensure_open()
+            snapshot = await self._read_snapshot()
+
+            if (
+                snapshot
+                and snapshot.get("checksum") == self._snapshot_checksum(snapshot.get("donators", {}))
+                and snapshot.get("journal_seq") == donation_journal.durable_seq
+            ):
+                self._reset(snapshot["donators"])
+                self._applied_seq = snapshot["journal_seq"]
+            else:
+                logger.info("Rebuilding donation leaderboard index from storage and journal")
+                donators, compacted_seq = await storage.get_donation_snapshot()
+                self._reset(donators)
+                self._applied_seq = compacted_seq
+
+                # Replay the journal tail, catching events made durable while reading
+                while self._applied_seq < donation_journal.durable_seq:
+                    events = await donation_journal.read_events(self._applied_seq)
+                    if not events:
+                        break
+                    for event in events:
+                        self._apply(event)
+                self._dirty = True
+
+            self._loaded = True
+
+        await self.save_if_dirty()
+
+    def _apply(self, event):
+        if event["seq"] <= self._applied_seq:
+            return
+        self.add_donation(event["donator_id"], event["game"], event["amount"])
+        self._applied_seq = event["seq"]
+
+    def apply_event(self, event):
+        """Journal listener: applies a durable donation event once loaded."""
+        if self._loaded:
+            self._apply(event)
+
+    def add_donation(self, donator_id, game, amount):
+        """Applies a single donation to the index in place."""
+        donator_id = str(donator_id)
+        totals = self._totals.get(donator_id)
+        if totals is None:
+            totals = {"rs3_donated": 0, "osrs_donated": 0}
+            self._totals[donator_id] = totals
+        else:
+            position = bisect.bisect_left(self._order, (-self._total(totals), donator_id))
+            del self._order[position]
+
+        totals["rs3_donated" if game == "rs3" else "osrs_donated"] += amount
+        bisect.insort(self._order, (-self._total(totals), donator_id))
+        self._dirty = True
+
+    def top(self, limit=10):
+        """Returns the top donators sorted by total donated."""
+        leaderboard = []
+        for negative_total, donator_id in self._order[:limit]:
+            totals = self._totals[donator_id]
+            leaderboard.append({
+                "id": donator_id,
+                "total_donated": -negative_total,
+                "rs3_donated": totals["rs3_donated"],
+                "osrs_donated": totals["osrs_donated"]
+            })
+        return leaderboard
+
+    async def save_if_dirty(self):
+        """Writes the snapshot to disk if the index changed since the last save."""
+        if not self._dirty:
+            return
+
+        self._dirty = False
+        donators = {donator_id: dict(totals) for donator_id, totals in self._totals.items()}
+        snapshot = {
+            "checksum": self._snapshot_checksum(donators),
+            "journal_seq": self._applied_seq,
+            "donators": donators
+        }
+        try:
+            await write_json(self.snapshot_path, snapshot, indent=None)
+        except OSError:
+            self._dirty = True
+            raise
+
+
+# Shared leaderboard index used by the donation cogs
+leaderboard_index = LeaderboardIndex()
+donation_journal.add_listener(leaderboard_index.apply_event)
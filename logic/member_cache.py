@@ -0,0 +1,59 @@
+import asyncio
+from logic.storage import storage
+
+
+class MemberRosterCache:
+    """In-memory RS3 and OSRS member lists shared by every cog.
+
+    Each roster is loaded from storage once and then served from memory.
+    Storage notifies the cache whenever a member list is written (e.g. by
+    /fetch or /changejoindate) and the affected roster is dropped, so the
+    next lookup reloads it. Returned dicts are shared; treat them as
+    read-only.
+    """
+
+    def __init__(self):
+        self._rosters = {}
+        self._generations = {}
+        self._locks = {}
+
+    def invalidate(self, game=None, names=None):
+        """Drops a cached roster, or every roster when no game is given.
+
+        names (the members that changed) is accepted for the storage listener
+        interface; the whole roster is dropped either way.
+        """
+        games = [game] if game is not None else list(self._rosters)
+        for cached_game in games:
+            self._rosters.pop(cached_game, None)
+            self._generations[cached_game] = self._generations.get(cached_game, 0) + 1
+
+    async def get_roster(self, game):
+        """Returns a game's member list as {name: member data}."""
+        roster = self._rosters.get(game)
+        if roster is not None:
+            return roster
+
+        lock = self._locks.setdefault(game, asyncio.Lock())
+        async with lock:
+            roster = self._rosters.get(game)
+            if roster is not None:
+                return roster
+
+            generation = self._generations.get(game, 0)
+            roster = await storage.get_members(game)
+
+            # Only cache the result if no write landed while it was loading
+            if self._generations.get(game, 0) == generation:
+                self._rosters[game] = roster
+            return roster
+
+    async def get_member(self, game, name):
+        """Returns a single member's data, or None if they are not on the list."""
+        roster = await self.get_roster(game)
+        return roster.get(name)
+
+
+# Shared member roster cache used by every cog
+member_cache = MemberRosterCache()
+storage.add_members_listener(member_cache.invalidate)
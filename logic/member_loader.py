@@ -0,0 +1,89 @@
+import json
+import time
+import asyncio
+import logging
+from logic.file_access import read_json, write_json
+
+logger = logging.getLogger(__name__)
+
+# Path to the compact on-disk Discord member snapshot
+MEMBER_SNAPSHOT_PATH = "/root/ghosted-bot/data/members/discord/member_snapshot.json"
+
+
+class MemberLoader:
+    """Warm-start Discord member cache reconciled by concurrent gateway chunking.
+
+    At boot the last snapshot ({guild_id: {member_id: display_name}}) is
+    loaded so display name lookups work before the gateway has delivered
+    any members. Roles are not kept: permission checks read the invoking
+    member's roles, which Discord sends with every interaction. Once the
+    bot is ready every guild is chunked over the gateway concurrently in
+    the background, and the snapshot is rewritten from the live cache. A
+    guild that fails to chunk keeps its previous snapshot entry instead
+    of being overwritten with a partial member list.
+    """
+
+    def __init__(self, snapshot_path=MEMBER_SNAPSHOT_PATH):
+        self.snapshot_path = snapshot_path
+        self._guilds = {}
+        self._reconcile_task = None
+
+    async def load_snapshot(self):
+        """Loads the last member snapshot from disk."""
+        try:
+            snapshot = await read_json(self.snapshot_path, default={})
+        except (json.JSONDecodeError, OSError):
+            snapshot = {}
+        self._guilds = {
+            guild_id: {
+                # Older snapshots stored [name, role_ids]
+                member_id: entry[0] if isinstance(entry, list) else entry
+                for member_id, entry in members.items()
+            }
+            for guild_id, members in snapshot.get("guilds", {}).items()
+        }
+        logger.info(f"Loaded member snapshot for {len(self._guilds)} guild(s)")
+
+    def display_name(self, guild, member_id):
+        """Returns a member's display name from the live cache or the snapshot, else None."""
+        member = guild.get_member(int(member_id))
+        if member is not None:
+            return member.display_name
+        return self._guilds.get(str(guild.id), {}).get(str(member_id))
+
+    async def _chunk_guild(self, guild):
+        started = time.perf_counter()
+        try:
+            if not guild.chunked:
+                await guild.chunk(cache=True)
+            logger.info(f"Chunked {guild.member_count} members for {guild.name} in {time.perf_counter() - started:.2f}s")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to chunk members for guild {guild.name}: {e}")
+            return False
+
+    async def reconcile(self, bot):
+        """Chunks every guild concurrently and rewrites the snapshot."""
+        guilds = list(bot.guilds)
+        chunked = await asyncio.gather(*(self._chunk_guild(guild) for guild in guilds))
+
+        snapshot = {}
+        for guild, ok in zip(guilds, chunked):
+            previous = self._guilds.get(str(guild.id))
+            if not ok and previous is not None:
+                # Only a partial member list is cached; keep the last complete one
+                snapshot[str(guild.id)] = previous
+                continue
+            snapshot[str(guild.id)] = {str(member.id): member.display_name for member in guild.members}
+        self._guilds = snapshot
+        await write_json(self.snapshot_path, {"saved_at": int(time.time()), "guilds": self._guilds}, indent=None)
+
+    def start_reconcile(self, bot):
+        """Starts reconciliation in the background unless it is already running."""
+        if self._reconcile_task is None or self._reconcile_task.done():
+            self._reconcile_task = asyncio.get_running_loop().create_task(self.reconcile(bot))
+        return self._reconcile_task
+
+
+# Shared member loader used by bot.py and the cogs
+member_loader = MemberLoader()
@@ -0,0 +1,72 @@
+import os
+import time
+import asyncio
+from collections import deque
+from logic.lazy_import import lazy_import
+
+# psutil is only needed once the first sample is taken
+psutil = lazy_import("psutil")
+
+# Sample every 30 seconds and keep one hour of history
+SAMPLE_INTERVAL_SECONDS = 30
+HISTORY_SECONDS = 3600
+
+
+class MetricsSampler:
+    """Fixed-size ring buffer of bot process metrics.
+
+    A background task calls sample() at a set interval; /status reads the
+    buffer instead of probing the system on the event loop.
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL_SECONDS, history=HISTORY_SECONDS):
+        self.interval = interval
+        self.samples = deque(maxlen=max(1, history // interval))
+        self._process = None
+
+    def _get_process(self):
+        if self._process is None:
+            self._process = psutil.Process(os.getpid())
+            # Prime cpu_percent so the first real sample covers a full interval
+            self._process.cpu_percent(interval=None)
+        return self._process
+
+    def _open_files(self, process):
+        if hasattr(process, "num_fds"):
+            return process.num_fds()
+        return process.num_handles()
+
+    async def sample(self, bot):
+        """Records one sample and returns it."""
+        # Event loop lag: how long a ready callback waits to be scheduled
+        started = time.perf_counter()
+        await asyncio.sleep(0)
+        loop_lag_ms = (time.perf_counter() - started) * 1000
+
+        process = self._get_process()
+        latency = bot.latency
+        sample = {
+            "time": time.time(),
+            "rss_mb": process.memory_info().rss / (1024 * 1024),
+            "cpu_percent": process.cpu_percent(interval=None),
+            "loop_lag_ms": loop_lag_ms,
+            "open_files": self._open_files(process),
+            "latency_ms": latency * 1000 if latency == latency and latency != float("inf") else None
+        }
+        self.samples.append(sample)
+        return sample
+
+    def latest(self):
+        """Returns the most recent sample, or None."""
+        return self.samples[-1] if self.samples else None
+
+    def summary(self, key):
+        """Returns (min, avg, max) of a metric over the buffered history."""
+        values = [sample[key] for sample in self.samples if sample[key] is not None]
+        if not values:
+            return None
+        return min(values), sum(values) / len(values), max(values)
+
+
+# Shared metrics sampler, driven by the Status cog
+metrics_sampler = MetricsSampler()
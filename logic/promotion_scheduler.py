@@ -0,0 +1,174 @@
+import heapq
+import logging
+from datetime import date
+import config
+from logic.storage import storage
+from logic.member_cache import member_cache
+from logic.promotions_engine import RosterColumns, next_eligible_ordinals, find_promotions, get_ladder, UNKNOWN_ORDINAL
+
+logger = logging.getLogger(__name__)
+
+# Pending-change marker meaning the whole roster has to be rescheduled
+ALL_MEMBERS = None
+
+
+class _GameQueue:
+    def __init__(self):
+        self.heap = []
+        self.scheduled = {}
+        self.eligible = set()
+        self.saved_eligible = set()
+        self.loaded = False
+        self.pending = set()
+        self.pending_all = True
+
+
+class PromotionScheduler:
+    """Min-heap of the date each member next becomes eligible for promotion.
+
+    The heap is built from one vectorized pass over the roster. After that,
+    storage change notifications (roster diffs from /fetch, join date
+    edits, XP enrichment) mark only the affected members, which are
+    rescheduled on the next query. due() pops just the members whose date
+    has arrived, so a daily check costs O(newly eligible), not O(roster).
+    Popped members stay in an eligible set until their rank or data
+    changes. The eligible set is saved to storage and reloaded on the
+    first query, so a restart does not report them again. eligible()
+    lists everyone due a promotion for /promotions run without marking
+    them reported. Stale heap entries are skipped lazily.
+    """
+
+    def __init__(self, ladders=None):
+        self.ladders = ladders or {game: get_ladder(game) for game in config.RANK_LADDERS}
+        self._queues = {game: _GameQueue() for game in self.ladders}
+
+    def on_members_changed(self, game, names=None):
+        """Storage listener: marks changed members (or the whole roster) for rescheduling."""
+        queue = self._queues.get(game)
+        if queue is None:
+            return
+        if names is ALL_MEMBERS:
+            queue.pending_all = True
+            queue.pending.clear()
+        elif not queue.pending_all:
+            queue.pending.update(names)
+
+    def _push(self, queue, name, ordinal, today_ordinal):
+        if ordinal == UNKNOWN_ORDINAL:
+            queue.eligible.discard(name)
+            return
+        if ordinal <= today_ordinal and name in queue.eligible:
+            # Still eligible; do not report them as newly eligible again
+            return
+        queue.eligible.discard(name)
+        queue.scheduled[name] = ordinal
+        heapq.heappush(queue.heap, (ordinal, name))
+
+    async def _sync(self, game, today_ordinal):
+        queue = self._queues[game]
+        if queue.loaded and not queue.pending_all and not queue.pending:
+            return
+
+        ladder = self.ladders[game]
+
+        # Take the pending changes before awaiting, so changes that arrive meanwhile are kept for the next sync
+        if queue.pending_all or not queue.loaded:
+            queue.pending_all, queue.pending = False, set()
+            if queue.loaded:
+                previously_eligible = queue.eligible
+            else:
+                previously_eligible = await storage.get_promotion_eligible(game)
+                queue.saved_eligible = set(previously_eligible)
+            roster = await member_cache.get_roster(game)
+
+            queue.heap, queue.scheduled, queue.eligible = [], {}, set()
+            columns = RosterColumns.from_roster(roster, ladder)
+            ordinals = next_eligible_ordinals(columns, ladder).tolist()
+            for name, ordinal in zip(columns.names, ordinals):
+                if name in previously_eligible:
+                    queue.eligible.add(name)
+                self._push(queue, name, ordinal, today_ordinal)
+            queue.loaded = True
+            logger.info(f"Scheduled promotion dates for {len(queue.scheduled)} {game} member(s)")
+            return
+
+        names, queue.pending = queue.pending, set()
+        roster = await member_cache.get_roster(game)
+        for name in names:
+            queue.scheduled.pop(name, None)
+            member = roster.get(name)
+            if member is None:
+                queue.eligible.discard(name)
+                continue
+            columns = RosterColumns.from_roster({name: member}, ladder)
+            self._push(queue, name, int(next_eligible_ordinals(columns, ladder)[0]), today_ordinal)
+
+        # Drop superseded entries once they outnumber the live ones
+        if len(queue.heap) > 2 * len(queue.scheduled) + 64:
+            queue.heap = [(ordinal, name) for name, ordinal in queue.scheduled.items()]
+            heapq.heapify(queue.heap)
+
+    async def due(self, game, today_ordinal=None):
+        """Pops and returns the members of a game who became eligible by the given day, in date order."""
+        today_ordinal = today_ordinal or date.today().toordinal()
+        await self._sync(game, today_ordinal)
+
+        queue = self._queues[game]
+        newly_eligible = []
+        while queue.heap and queue.heap[0][0] <= today_ordinal:
+            ordinal, name = heapq.heappop(queue.heap)
+            if queue.scheduled.get(name) != ordinal:
+                continue  # Superseded by a later reschedule
+            del queue.scheduled[name]
+            queue.eligible.add(name)
+            newly_eligible.append(name)
+
+        if queue.eligible != queue.saved_eligible:
+            eligible = set(queue.eligible)
+            await storage.set_promotion_eligible(game, eligible)
+            queue.saved_eligible = eligible
+        return newly_eligible
+
+    async def eligible(self, game, today_ordinal=None):
+        """Returns [name, join date, current rank, new rank] for every member eligible by the given day.
+
+        Unlike due(), nobody is marked as reported, so the daily digest is unaffected.
+        """
+        today_ordinal = today_ordinal or date.today().toordinal()
+        await self._sync(game, today_ordinal)
+
+        queue = self._queues[game]
+        names = set(queue.eligible)
+        # Heap entries due by today form a subtree at the root, so only that part is walked
+        stack = [0]
+        while stack:
+            index = stack.pop()
+            if index >= len(queue.heap) or queue.heap[index][0] > today_ordinal:
+                continue
+            ordinal, name = queue.heap[index]
+            if queue.scheduled.get(name) == ordinal:
+                names.add(name)
+            stack.extend((2 * index + 1, 2 * index + 2))
+        if not names:
+            return []
+
+        # Report in roster order, as a full scan would; walking the keys is cheap next to evaluating every member
+        roster = await member_cache.get_roster(game)
+        return await self._confirm(game, [name for name in roster if name in names], today_ordinal)
+
+    async def digest(self, game, today_ordinal=None):
+        """Returns [name, join date, current rank, new rank] for members who became eligible today."""
+        return await self._confirm(game, await self.due(game, today_ordinal), today_ordinal)
+
+    async def _confirm(self, game, names, today_ordinal):
+        if not names:
+            return []
+        roster = await member_cache.get_roster(game)
+        # Confirm against the full promotion rules, only for the members that came due
+        subset = {name: roster[name] for name in names if name in roster}
+        return find_promotions(subset, self.ladders[game], today_ordinal)
+
+
+# Shared promotion scheduler, kept current by storage change notifications
+promotion_scheduler = PromotionScheduler()
+storage.add_members_listener(promotion_scheduler.on_members_changed)
@@ -0,0 +1,293 @@
+import time
+from datetime import date, datetime
+from functools import lru_cache
+import config
+from logic.lazy_import import lazy_import
+
+# numpy is only imported the first time promotions are evaluated
+np = lazy_import("numpy")
+
+# Join dates are stored as MM/DD/YYYY; unknown or unparsable dates map to this ordinal
+UNKNOWN_ORDINAL = -1
+
+# Threshold used for a step with no day requirement
+NO_MINIMUM = -(2 ** 31)
+
+
+@lru_cache(maxsize=None)
+def join_date_ordinal(join_date):
+    """Parses a MM/DD/YYYY join date into a proleptic ordinal, cached per distinct date string."""
+    try:
+        return datetime.strptime(join_date, "%m/%d/%Y").toordinal()
+    except (TypeError, ValueError):
+        return UNKNOWN_ORDINAL
+
+
+class PromotionLadder:
+    """A declarative rank ladder compiled into sorted threshold arrays.
+
+    ranks is the ladder from most junior to most senior, as dicts with a
+    name and optional min_days / min_xp. A rank's seniority code is its
+    position, looked up in O(1) through a lower-cased name map; ranks not
+    on the ladder get UNKNOWN_CODE. Ranks with requirements are promotion
+    steps, and a member qualifies for a step when both minimums are met.
+    Both minimums must be non-decreasing along the ladder, so the number
+    of steps a member qualifies for is min(searchsorted(days),
+    searchsorted(xp)). Members holding an ignored rank are never promoted.
+    The arrays are built on first use.
+    """
+
+    UNKNOWN_CODE = -1
+
+    def __init__(self, name, ranks, ignored_ranks=(), default_rank=None):
+        self.name = name
+        self.rank_codes = {}
+        for code, rank in enumerate(ranks):
+            key = rank['name'].lower()
+            if key in self.rank_codes:
+                raise ValueError(f"Rank {rank['name']} appears twice in the {name} ladder")
+            self.rank_codes[key] = code
+
+        self.steps = [
+            (rank['name'], rank.get('min_days'), rank.get('min_xp'))
+            for rank in ranks
+            if 'min_days' in rank or 'min_xp' in rank
+        ]
+        self.ranks = [rank for rank, _min_days, _min_xp in self.steps]
+        self.ignored_ranks = {rank.lower() for rank in ignored_ranks}
+        self.default_rank = default_rank
+        self.unknown_code = self.UNKNOWN_CODE
+        self._arrays = None
+
+    @classmethod
+    def from_definition(cls, name, definition):
+        """Compiles a ladder from its config.RANK_LADDERS entry."""
+        return cls(
+            name,
+            definition['ranks'],
+            ignored_ranks=definition.get('ignored_ranks', ()),
+            default_rank=definition.get('default_rank')
+        )
+
+    def arrays(self):
+        """Returns the compiled (min_days, min_xp, step_codes) arrays."""
+        if self._arrays is None:
+            min_days = np.array([NO_MINIMUM if days is None else days for _rank, days, _xp in self.steps], dtype=np.int64)
+            min_xp = np.array([xp or 0 for _rank, _days, xp in self.steps], dtype=np.int64)
+            if np.any(np.diff(min_days) < 0) or np.any(np.diff(min_xp) < 0):
+                raise ValueError(f"{self.name} ladder requirements must not decrease going up the ladder")
+            step_codes = np.array([self.code(rank) for rank in self.ranks], dtype=np.int16)
+            self._arrays = (min_days, min_xp, step_codes)
+        return self._arrays
+
+    def code(self, rank):
+        """Returns the seniority code of a rank name."""
+        return self.rank_codes.get(rank.lower(), self.unknown_code)
+
+    def eligible_steps(self, days, xp):
+        """Returns the highest qualifying step index per member (-1 for none)."""
+        min_days, min_xp, _step_codes = self.arrays()
+        by_days = np.searchsorted(min_days, days, side="right")
+        by_xp = np.searchsorted(min_xp, xp, side="right")
+        return np.minimum(by_days, by_xp) - 1
+
+
+_ladders = {}
+
+
+def get_ladder(game):
+    """Returns the compiled ladder for a game, compiling config.RANK_LADDERS once."""
+    ladder = _ladders.get(game)
+    if ladder is None:
+        ladder = PromotionLadder.from_definition(game, config.RANK_LADDERS[game])
+        _ladders[game] = ladder
+    return ladder
+
+
+class RosterColumns:
+    """Columnar view of a roster: names, join-day ordinals, XP and rank codes."""
+
+    def __init__(self, names, join_dates, ranks, join_ordinal, xp, rank_code, ignored):
+        self.names = names
+        self.join_dates = join_dates
+        self.ranks = ranks
+        self.join_ordinal = join_ordinal
+        self.xp = xp
+        self.rank_code = rank_code
+        self.ignored = ignored
+
+    @classmethod
+    def from_roster(cls, members_data, ladder):
+        """Builds the columns from {name: member data}.
+
+        A roster has few distinct join dates and ranks, so each one is
+        parsed or looked up once and mapped back onto the members with an
+        index array instead of per member.
+        """
+        count = len(members_data)
+        names = list(members_data)
+        members = list(members_data.values())
+        join_dates = [data.get("Join Date", "Unknown") for data in members]
+        ranks = [data.get("Clan Rank") or ladder.default_rank or "" for data in members]
+        xp = np.fromiter((data.get("Total XP") or 0 for data in members), dtype=np.int64, count=count)
+
+        date_ids = {}
+        date_index = np.fromiter((date_ids.setdefault(value, len(date_ids)) for value in join_dates), dtype=np.int64, count=count)
+        date_ordinals = np.array(
+            [join_date_ordinal(value) if value != "Unknown" else UNKNOWN_ORDINAL for value in date_ids],
+            dtype=np.int64
+        )
+
+        rank_ids = {}
+        rank_index = np.fromiter((rank_ids.setdefault(rank, len(rank_ids)) for rank in ranks), dtype=np.int64, count=count)
+        rank_codes = np.array([ladder.code(rank) for rank in rank_ids], dtype=np.int16)
+        rank_ignored = np.array([rank.lower() in ladder.ignored_ranks for rank in rank_ids], dtype=bool)
+
+        return cls(
+            names,
+            join_dates,
+            ranks,
+            date_ordinals[date_index],
+            xp,
+            rank_codes[rank_index],
+            rank_ignored[rank_index]
+        )
+
+
+def evaluate(columns, ladder, today_ordinal=None):
+    """Returns (member indices to promote, their new step indices) for the whole roster at once."""
+    today_ordinal = today_ordinal or date.today().toordinal()
+    days = today_ordinal - columns.join_ordinal
+    steps = ladder.eligible_steps(days, columns.xp)
+
+    step_codes = ladder.arrays()[2]
+    new_codes = np.where(steps >= 0, step_codes[np.maximum(steps, 0)], ladder.unknown_code)
+    promote = (
+        (columns.join_ordinal != UNKNOWN_ORDINAL)
+        & ~columns.ignored
+        & (steps >= 0)
+        & (new_codes > columns.rank_code)
+    )
+    indices = np.flatnonzero(promote)
+    return indices, steps[indices]
+
+
+def next_eligible_ordinals(columns, ladder):
+    """Returns the date ordinal each member first qualifies for a rank above their own (-1 for never).
+
+    Only the member's current XP is considered, so members held back by an
+    XP requirement get -1 until their XP changes. Dates may be in the past
+    for members who are already eligible.
+    """
+    min_days, min_xp, step_codes = ladder.arrays()
+    # members x steps: steps that would be a promotion and whose XP requirement is already met
+    candidates = (step_codes[None, :] > columns.rank_code[:, None]) & (min_xp[None, :] <= columns.xp[:, None])
+    has_candidate = candidates.any(axis=1)
+    first_step = candidates.argmax(axis=1)
+
+    ordinals = columns.join_ordinal + np.maximum(min_days[first_step], 0)
+    valid = has_candidate & (columns.join_ordinal != UNKNOWN_ORDINAL) & ~columns.ignored
+    return np.where(valid, ordinals, UNKNOWN_ORDINAL)
+
+
+def find_promotions(members_data, ladder, today_ordinal=None):
+    """Returns [name, join date, current rank, new rank] for every member due a promotion."""
+    columns = RosterColumns.from_roster(members_data, ladder)
+    indices, steps = evaluate(columns, ladder, today_ordinal)
+    return [
+        [columns.names[index], columns.join_dates[index], columns.ranks[index], ladder.ranks[step]]
+        for index, step in zip(indices.tolist(), steps.tolist())
+    ]
+
+
+def forecast(members_data, ladder, limit=10, today_ordinal=None):
+    """Returns [name, current rank, next rank, days left, XP left] for the members closest to their next rank.
+
+    Only members not yet eligible for a promotion are included. Closeness
+    is the share of the next rank's harder requirement still missing, so a
+    member 5 of 30 days short ranks behind one 1M of 50M XP short, with
+    days left breaking ties.
+    """
+    today_ordinal = today_ordinal or date.today().toordinal()
+    columns = RosterColumns.from_roster(members_data, ladder)
+    min_days, min_xp, step_codes = ladder.arrays()
+
+    # Step codes follow ladder order, so the next rank is the first step coded above the current rank
+    next_step = np.searchsorted(step_codes, columns.rank_code, side="right")
+    days = today_ordinal - columns.join_ordinal
+    candidates = np.flatnonzero(
+        (columns.join_ordinal != UNKNOWN_ORDINAL)
+        & ~columns.ignored
+        & (next_step < len(step_codes))
+        & (ladder.eligible_steps(days, columns.xp) < next_step)
+    )
+    if not len(candidates):
+        return []
+
+    steps = next_step[candidates]
+    days_left = np.maximum(min_days[steps] - days[candidates], 0)
+    xp_left = np.maximum(min_xp[steps] - columns.xp[candidates], 0)
+    missing = np.maximum(
+        days_left / np.maximum(min_days[steps], 1),
+        xp_left / np.maximum(min_xp[steps], 1)
+    )
+
+    order = np.lexsort((days_left, missing))[:limit]
+    return [
+        [columns.names[index], columns.ranks[index], ladder.ranks[step], left_days, left_xp]
+        for index, step, left_days, left_xp in zip(
+            candidates[order].tolist(), steps[order].tolist(), days_left[order].tolist(), xp_left[order].tolist()
+        )
+    ]
+
+
+def benchmark(ladder, size=100_000, runs=5, seed=0):
+    """Times promotions over a synthetic roster of stored member records.
+
+    Returns the best run of each stage in milliseconds as
+    {"columns", "evaluate", "find_promotions"}; find_promotions is the
+    whole path a real run takes, from the roster dict to the result rows.
+    """
+    rng = np.random.default_rng(seed)
+    today = date.today()
+    ranks = list(ladder.rank_codes) + sorted(ladder.ignored_ranks) + ["guest"]
+    days_ago = rng.integers(0, 2000, size=size).tolist()
+    rank_picks = rng.integers(0, len(ranks), size=size).tolist()
+    xp = rng.integers(0, 300_000_000, size=size).tolist()
+    members_data = {
+        f"member{index}": {
+            "Clan Rank": ranks[rank_picks[index]],
+            "Total XP": xp[index],
+            "Join Date": date.fromordinal(today.toordinal() - days_ago[index]).strftime("%m/%d/%Y")
+        }
+        for index in range(size)
+    }
+
+    def best_of(func):
+        best = None
+        for _run in range(runs):
+            started = time.perf_counter()
+            func()
+            elapsed = (time.perf_counter() - started) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    columns = RosterColumns.from_roster(members_data, ladder)
+    return {
+        "columns": best_of(lambda: RosterColumns.from_roster(members_data, ladder)),
+        "evaluate": best_of(lambda: evaluate(columns, ladder)),
+        "find_promotions": best_of(lambda: find_promotions(members_data, ladder))
+    }
+
+
+if __name__ == "__main__":
+    # Usage: python -m logic.promotions_engine [members]
+    import sys
+
+    members = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for game in config.RANK_LADDERS:
+        timings = benchmark(get_ladder(game), members)
+        print(
+            f"{game}: find_promotions {timings['find_promotions']:.1f} ms for {members} members "
+            f"(columns {timings['columns']:.1f} ms, evaluate {timings['evaluate']:.1f} ms)"
+        )
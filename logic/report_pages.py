@@ -0,0 +1,196 @@
+import logging
+import nextcord
+from nextcord import Embed
+
+logger = logging.getLogger(__name__)
+
+# Discord limits: embed description, all embeds in one message combined, embeds per message, message content
+MAX_DESCRIPTION_LENGTH = 4096
+MAX_MESSAGE_EMBEDS_LENGTH = 6000
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_MESSAGE_LENGTH = 2000
+
+# Characters reserved per embed for the " · Page N" footer suffix
+FOOTER_RESERVE = 32
+
+# How long the paginator buttons stay active
+PAGINATOR_TIMEOUT_SECONDS = 15 * 60
+
+
+def split_line(line, limit):
+    """Hard-splits a single line that is longer than limit."""
+    for start in range(0, len(line), limit):
+        yield line[start:start + limit]
+
+
+def chunk_lines(lines, limit=MAX_MESSAGE_LENGTH, header=None):
+    """Yields newline-joined chunks of lines, each at most limit characters.
+
+    The header, if given, starts the first chunk. Lines are never split
+    unless a single line is longer than limit.
+    """
+    chunk = header or ""
+    for line in lines:
+        for piece in split_line(line, limit):
+            candidate = f"{chunk}\n{piece}" if chunk else piece
+            if len(candidate) <= limit:
+                chunk = candidate
+                continue
+            yield chunk
+            chunk = piece
+    if chunk and chunk != header:
+        yield chunk
+
+
+def pack_pages(lines, embed_overhead=0, description_limit=MAX_DESCRIPTION_LENGTH,
+               message_limit=MAX_MESSAGE_EMBEDS_LENGTH, embeds_per_message=MAX_EMBEDS_PER_MESSAGE):
+    """Yields pages of embed descriptions, one page per message.
+
+    Lines fill an embed up to description_limit and spill into the next
+    embed of the same page until the page holds embeds_per_message embeds
+    or its combined size (each description plus embed_overhead for the
+    title and footer) would pass message_limit. Lines are consumed lazily,
+    so only the pages that are asked for get built.
+    """
+    page, used, description = [], 0, ""
+    for line in lines:
+        for piece in split_line(line, description_limit):
+            candidate = f"{description}\n{piece}" if description else piece
+            if len(candidate) <= min(description_limit, message_limit - used - embed_overhead):
+                description = candidate
+                continue
+
+            if description:
+                page.append(description)
+                used += len(description) + embed_overhead
+            if len(page) >= embeds_per_message or len(piece) > message_limit - used - embed_overhead:
+                yield page
+                page, used = [], 0
+            description = piece
+
+    if description:
+        page.append(description)
+    if page:
+        yield page
+
+
+class ReportPages:
+    """Report lines rendered into pages of embeds on demand.
+
+    A page is a list of up to 10 embeds that fits in one message. Pages
+    are packed from the line iterator only when first requested and kept
+    for going back, so a huge report costs nothing until someone pages
+    through it.
+    """
+
+    def __init__(self, title, lines, color=None, empty_text="Nothing to report.", footer=None):
+        self.title = title
+        self.color = color
+        self.empty_text = empty_text
+        self.footer = footer
+        self._packer = pack_pages(lines, embed_overhead=len(title) + len(footer or "") + FOOTER_RESERVE)
+        self._pages = []
+        self._exhausted = False
+
+    def _render_until(self, index):
+        while len(self._pages) <= index and not self._exhausted:
+            try:
+                descriptions = next(self._packer)
+            except StopIteration:
+                self._exhausted = True
+                break
+            self._pages.append(self._build(len(self._pages) + 1, descriptions))
+
+        if not self._pages and self._exhausted:
+            self._pages.append(self._build(1, [self.empty_text]))
+
+    def _build(self, number, descriptions):
+        embeds = [Embed(description=description, color=self.color) for description in descriptions]
+        embeds[0].title = self.title
+        embeds[-1].set_footer(text=f"{self.footer} · Page {number}" if self.footer else f"Page {number}")
+        return embeds
+
+    def has_page(self, index):
+        self._render_until(index)
+        return index < len(self._pages)
+
+    def page(self, index):
+        """Returns the embeds of a page, rendering it if needed."""
+        self._render_until(index)
+        return self._pages[index]
+
+    def __iter__(self):
+        index = 0
+        while self.has_page(index):
+            yield self.page(index)
+            index += 1
+
+
+class ReportPaginator(nextcord.ui.View):
+    """Previous/Next buttons that flip a message between report pages.
+
+    Only one page ahead is rendered, so the Next button knows whether
+    there is more. Only owner_id, the user who ran the report, can flip
+    pages. Set message to the sent message so the buttons can be disabled
+    when the view times out.
+    """
+
+    def __init__(self, pages, owner_id, timeout=PAGINATOR_TIMEOUT_SECONDS):
+        super().__init__(timeout=timeout)
+        self.pages = pages
+        self.owner_id = owner_id
+        self.index = 0
+        self.message = None
+        self._update_buttons()
+
+    async def interaction_check(self, interaction):
+        if interaction.user.id == self.owner_id:
+            return True
+        await interaction.response.send_message(
+            "Only the person who ran this report can change its pages.",
+            ephemeral=True
+        )
+        return False
+
+    def _update_buttons(self):
+        self.previous_page.disabled = self.index == 0
+        self.next_page.disabled = not self.pages.has_page(self.index + 1)
+
+    async def _show(self, interaction, index):
+        self.index = index
+        self._update_buttons()
+        await interaction.response.edit_message(embeds=self.pages.page(index), view=self)
+
+    @nextcord.ui.button(label="◀ Previous", style=nextcord.ButtonStyle.secondary)
+    async def previous_page(self, button, interaction):
+        await self._show(interaction, max(self.index - 1, 0))
+
+    @nextcord.ui.button(label="Next ▶", style=nextcord.ButtonStyle.secondary)
+    async def next_page(self, button, interaction):
+        await self._show(interaction, self.index + 1)
+
+    async def on_timeout(self):
+        if self.message is None:
+            return
+        for item in self.children:
+            item.disabled = True
+        try:
+            await self.message.edit(view=self)
+        except nextcord.HTTPException as e:
+            logger.warning(f"Could not disable report paginator: {e}")
+
+
+async def send_report(interaction, pages):
+    """Responds with the first page of a report, adding a paginator only if there are more pages."""
+    if not pages.has_page(1):
+        await interaction.response.send_message(embeds=pages.page(0))
+        return
+
+    view = ReportPaginator(pages, interaction.user.id)
+    view.message = await interaction.response.send_message(embeds=pages.page(0), view=view)
+
+
+async def send_chunks(channel, lines, header=None):
+    """Sends lines to a channel in as few messages as the 2000 character limit allows."""
+    for chunk in chunk_lines(lines, header=header):
+        await channel.send(chunk)
@@ -0,0 +1,123 @@
+import time
+import random
+from urllib.parse import urlsplit
+
+# Methods that are safe to retry automatically
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class EndpointPolicy:
+    """Timeouts, retries and circuit breaker thresholds for one endpoint."""
+
+    def __init__(self, max_attempts=3, connect_timeout=5, read_timeout=10, total_timeout=20,
+                 backoff_base=0.5, backoff_max=5, failure_threshold=5, reset_timeout=30):
+        self.max_attempts = max_attempts
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_timeout = total_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+    def backoff(self, attempt):
+        """Returns a jittered exponential delay before the given retry attempt."""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+
+
+# Per-host policies; anything else uses DEFAULT_POLICY
+DEFAULT_POLICY = EndpointPolicy()
+ENDPOINT_POLICIES = {
+    # Clan exports can be slow to generate but should still answer within seconds
+    "services.runescape.com": EndpointPolicy(read_timeout=15, total_timeout=30),
+    "www.ghostedbot.com": EndpointPolicy(),
+    "secure.runescape.com": EndpointPolicy(max_attempts=2, failure_threshold=10),
+    "api.wiseoldman.net": EndpointPolicy(),
+    # Webhook edits are retried by the webhook dispatcher itself
+    "discord.com": EndpointPolicy(max_attempts=1, read_timeout=10, total_timeout=15, failure_threshold=10)
+}
+
+
+# Hosts whose webhooks each get their own breaker, so one failing webhook does not block the rest
+WEBHOOK_HOSTS = {"discord.com"}
+
+
+def endpoint_for(url):
+    """Returns the endpoint key for a URL: its host, or "host/webhooks/<id>" for a webhook URL."""
+    parts = urlsplit(url)
+    host = parts.hostname or url
+    if host in WEBHOOK_HOSTS:
+        segments = parts.path.strip("/").split("/")
+        if "webhooks" in segments[:-1]:
+            # Keyed by webhook ID only; the token after it must not end up in logs
+            return f"{host}/webhooks/{segments[segments.index('webhooks') + 1]}"
+    return host
+
+
+def policy_for(endpoint):
+    """Returns the policy for an endpoint key, looked up by its host."""
+    return ENDPOINT_POLICIES.get(endpoint.split("/", 1)[0], DEFAULT_POLICY)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint whose circuit breaker is open."""
+
+    def __init__(self, endpoint, retry_after):
+        super().__init__(f"{endpoint} is unavailable, not retrying for another {retry_after:.0f}s")
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    After failure_threshold failures in a row the breaker opens and calls
+    fail fast for reset_timeout seconds. It then lets a single trial call
+    through (half-open): success closes it, failure opens it again. A
+    trial that never reports back (e.g. it was cancelled) stops blocking
+    after another reset_timeout.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, endpoint, failure_threshold=5, reset_timeout=30):
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0
+        self._trial_started_at = None
+
+    def retry_after(self):
+        """Seconds until an open breaker allows a trial call."""
+        return max(0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self):
+        """Returns True if a call may go through now."""
+        if self.state == self.CLOSED:
+            return True
+        now = time.monotonic()
+        if self.state == self.OPEN and self.retry_after() <= 0:
+            self.state = self.HALF_OPEN
+            self._trial_started_at = None
+        if self.state == self.HALF_OPEN:
+            if self._trial_started_at is None or now - self._trial_started_at >= self.reset_timeout:
+                self._trial_started_at = now
+                return True
+        return False
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_started_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        self._trial_started_at = None
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
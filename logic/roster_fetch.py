@@ -0,0 +1,127 @@
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from logic.storage import storage
+from logic.member_cache import member_cache
+from logic.http_client import http_client, HttpError, HttpResponse, response_charset
+from logic.roster_import import RosterImport
+
+logger = logging.getLogger(__name__)
+
+# Clan export sources for each game
+ROSTER_SOURCES = {
+    "rs3": "http://services.runescape.com/m=clan-hiscores/members_lite.ws?clanName=Ghosted",
+    "osrs": "https://www.ghostedbot.com/data/osrs_clanexport.csv"
+}
+
+# Storage meta key prefix for each source's ETag, Last-Modified and body hash
+VALIDATORS_KEY = "roster_validators"
+
+# Fetch outcomes
+NOT_MODIFIED = "not_modified"
+UNCHANGED = "unchanged"
+UPDATED = "updated"
+
+
+class RosterFetcher:
+    """Conditional, streaming clan roster fetches.
+
+    Each request carries the ETag and Last-Modified validators from the
+    previous fetch, so an unchanged export costs a 304 round trip. A full
+    response is streamed and hashed line by line. If the hash matches the
+    last import the body is neither parsed nor written; otherwise its
+    lines are fed to a RosterImport, which diffs them against the cached
+    member list, and only the diff is applied to storage.
+
+    Fetches are single-flight per game: a fetch requested while another
+    is running (e.g. /fetch during a scheduled sync) joins it.
+    """
+
+    def __init__(self, sources=None):
+        self.sources = sources or ROSTER_SOURCES
+        self.last_success = {}
+        self._inflight = {}
+
+    @staticmethod
+    def _validators_key(game):
+        return f"{VALIDATORS_KEY}:{game}"
+
+    async def _get_validators(self, game):
+        stored = await storage.get_meta(self._validators_key(game))
+        return json.loads(stored) if stored else {}
+
+    def is_fetching(self, game):
+        """Returns True if a fetch for the game is in progress."""
+        task = self._inflight.get(game)
+        return task is not None and not task.done()
+
+    async def fetch(self, game):
+        """Fetches a game's roster and applies its changes, joining a fetch already in progress.
+
+        Returns (status, diff) where status is NOT_MODIFIED, UNCHANGED or
+        UPDATED and diff is the applied RosterDiff (None unless UPDATED).
+        Raises HttpError for non-2xx responses.
+        """
+        if not self.is_fetching(game):
+            self._inflight[game] = asyncio.get_running_loop().create_task(self._fetch(game))
+        # Shielded so a cancelled caller does not cancel the fetch for everyone else
+        return await asyncio.shield(self._inflight[game])
+
+    async def _fetch(self, game):
+        result = await self._fetch_once(game)
+        self.last_success[game] = time.time()
+        return result
+
+    async def _fetch_once(self, game):
+        validators = await self._get_validators(game)
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        url = self.sources[game]
+        async with http_client.stream("GET", url, headers=headers) as response:
+            if response.status == 304:
+                logger.info(f"{game} roster not modified")
+                return NOT_MODIFIED, None
+            if response.status != 200:
+                raise HttpError(HttpResponse("GET", url, response.status, response.headers, await response.read()))
+
+            # The RS3 export is Latin-1 (names use 0xA0 for spaces) and declares no charset.
+            # aiohttp's get_encoding() cannot guess before the body is read, so parse the header.
+            encoding = response_charset(response.headers)
+            body_hash = hashlib.sha256()
+            lines = []
+            async for line in response.content:
+                body_hash.update(line)
+                lines.append(line)
+
+            new_validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "sha256": body_hash.hexdigest()
+            }
+
+        if new_validators["sha256"] == validators.get("sha256"):
+            # Same body; only persist validators if the server rotated them
+            if new_validators != validators:
+                await storage.set_meta(self._validators_key(game), json.dumps(new_validators))
+            logger.info(f"{game} roster body unchanged, skipped import")
+            return UNCHANGED, None
+
+        roster_import = RosterImport(game, await member_cache.get_roster(game))
+        for line in lines:
+            roster_import.feed_line(line.decode(encoding, errors="replace"))
+        diff = roster_import.finish()
+        await storage.apply_member_changes(game, diff.updates, diff.left)
+        # Stored only after the import succeeds, so a failed write is retried next time
+        await storage.set_meta(self._validators_key(game), json.dumps(new_validators))
+        logger.info(f"Imported {game} roster: {diff.summary()}")
+        return UPDATED, diff
+
+
+# Shared roster fetcher used by /fetch and the scheduled roster sync
+roster_fetcher = RosterFetcher()
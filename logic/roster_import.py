@@ -0,0 +1,139 @@
+import csv
+import logging
+from collections import deque
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class RosterDiff:
+    """Changes between the stored member list and a freshly imported export.
+
+    joined maps new names to their member data, left lists departed
+    names, rank_changed and xp_changed hold (name, old, new) tuples, and
+    updates holds every row that has to be written (joined or changed).
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.joined = {}
+        self.left = []
+        self.rank_changed = []
+        self.xp_changed = []
+        self.updates = {}
+
+    def __bool__(self):
+        return bool(self.updates or self.left)
+
+    def summary(self):
+        """Returns a short human-readable description of the diff."""
+        if not self:
+            return "no changes"
+        parts = [
+            f"{len(self.joined)} joined",
+            f"{len(self.left)} left",
+            f"{len(self.rank_changed)} rank change(s)"
+        ]
+        if self.xp_changed:
+            parts.append(f"{len(self.xp_changed)} XP change(s)")
+        return ", ".join(parts)
+
+
+class _LineFeed:
+    """Iterator the csv reader pulls lines from as they arrive."""
+
+    def __init__(self):
+        self.lines = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self.lines:
+            raise StopIteration
+        return self.lines.popleft()
+
+
+class RosterImport:
+    """Incremental clan export parser that diffs rows as they stream in.
+
+    Lines are fed one at a time to a csv reader, so quoted names with
+    commas and trailing extra fields are handled, and each row is compared
+    with the known member list immediately instead of building a second
+    full roster. finish() returns the RosterDiff.
+
+    RS3 exports are "name, rank, total xp, kills"; join dates are kept
+    from the known list. OSRS exports are "name, rank, join date
+    (DD-MMM-YYYY)"; XP from the known list is kept.
+    """
+
+    def __init__(self, game, known_members):
+        self.game = game
+        self.known_members = known_members
+        self.diff = RosterDiff(game)
+        self._seen = set()
+        self._feed = _LineFeed()
+        self._reader = csv.reader(self._feed)
+        self._header_skipped = False
+
+    def feed_line(self, line):
+        """Parses one line of the export."""
+        self._feed.lines.append(line)
+        for row in self._reader:
+            if not self._header_skipped:
+                self._header_skipped = True
+                continue
+            self._handle_row(row)
+
+    def _parse_row(self, row, previous):
+        name, rank = row[0].strip(), row[1].strip()
+        if self.game == "rs3":
+            return name, {
+                "Clan Rank": rank,
+                "Total XP": int(row[2].strip()),
+                "Join Date": previous.get("Join Date", "Unknown")
+            }
+
+        try:
+            join_date = datetime.strptime(row[2].strip(), "%d-%b-%Y").strftime("%m/%d/%Y")
+        except ValueError:
+            join_date = "Unknown"
+        member = {"Clan Rank": rank}
+        if "Total XP" in previous:
+            member["Total XP"] = previous["Total XP"]
+        member["Join Date"] = join_date
+        return name, member
+
+    def _handle_row(self, row):
+        if len(row) < 3 or not row[0].strip():
+            return
+
+        try:
+            name, member = self._parse_row(row, self.known_members.get(row[0].strip(), {}))
+        except ValueError:
+            logger.warning(f"Skipping malformed {self.game} roster row: {row}")
+            return
+        if name in self._seen:
+            return
+        self._seen.add(name)
+
+        previous = self.known_members.get(name)
+        if previous is None:
+            self.diff.joined[name] = member
+            self.diff.updates[name] = member
+            return
+
+        if previous.get("Clan Rank") != member["Clan Rank"]:
+            self.diff.rank_changed.append((name, previous.get("Clan Rank"), member["Clan Rank"]))
+        if previous.get("Total XP") != member.get("Total XP"):
+            self.diff.xp_changed.append((name, previous.get("Total XP"), member.get("Total XP")))
+        if previous != member:
+            self.diff.updates[name] = member
+
+    def finish(self):
+        """Finishes the import and returns the diff against the known members."""
+        if not self._seen and self.known_members:
+            # An empty export would otherwise remove every member
+            raise ValueError(f"{self.game} roster export contained no members")
+        self.diff.left = [name for name in self.known_members if name not in self._seen]
+        return self.diff
@@ -0,0 +1,595 @@
+import os
+import json
+import sqlite3
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Path to the shared data directory and the SQLite database inside it
+DATA_DIR = "/root/ghosted-bot/data"
+DATABASE_PATH = os.path.join(DATA_DIR, "ghostedbot.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS members (
+    game TEXT NOT NULL,
+    name TEXT NOT NULL,
+    clan_rank TEXT,
+    total_xp INTEGER,
+    join_date TEXT NOT NULL DEFAULT 'Unknown',
+    last_changed INTEGER,
+    PRIMARY KEY (game, name)
+);
+
+CREATE TABLE IF NOT EXISTS promotion_eligible (
+    game TEXT NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (game, name)
+);
+
+CREATE TABLE IF NOT EXISTS donations (
+    donator_id TEXT PRIMARY KEY,
+    rs3_donated INTEGER NOT NULL DEFAULT 0,
+    osrs_donated INTEGER NOT NULL DEFAULT 0
+);
+-- Donations are ranked in memory by the leaderboard index, so this index only slowed writes
+DROP INDEX IF EXISTS idx_donations_total;
+
+CREATE TABLE IF NOT EXISTS ledger (
+    game TEXT PRIMARY KEY,
+    amount INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO ledger (game, amount) VALUES ('rs3', 0), ('osrs', 0);
+
+CREATE TABLE IF NOT EXISTS expenditures (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    amount INTEGER NOT NULL,
+    formatted_amount TEXT NOT NULL,
+    game TEXT NOT NULL,
+    reason TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS inactivity (
+    game TEXT NOT NULL,
+    discord_user_id TEXT NOT NULL,
+    display_name TEXT,
+    reported_at,
+    PRIMARY KEY (game, discord_user_id)
+);
+
+CREATE TABLE IF NOT EXISTS audit_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp INTEGER NOT NULL,
+    user_id TEXT NOT NULL,
+    command TEXT NOT NULL,
+    channel_id TEXT,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_audit_log_user ON audit_log (user_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_audit_log_command ON audit_log (command, timestamp);
+"""
+
+# Legacy JSON files imported by the one-shot migrator, relative to DATA_DIR
+LEGACY_MEMBER_FILES = {
+    "rs3": "members/runescape3/rs3_memberlist.json",
+    "osrs": "members/oldschoolrunescape/osrs_memberlist.json"
+}
+LEGACY_INACTIVITY_FILES = {
+    "osrs": "activity/osrs-inactivity-list.json",
+    "rs3": "activity/rs3-inactivity-list.json"
+}
+LEGACY_LEADERBOARD_DIR = "donations/leaderboard"
+LEGACY_LEDGER_FILE = "donations/ledger.json"
+LEGACY_EXPENDITURES_FILE = "donations/expenditures.json"
+
+
+class Storage:
+    """Shared SQLite (WAL) storage with an async API.
+
+    Every query runs on a single dedicated worker thread that owns the
+    connection, so callers never block the event loop and writes are
+    serialized without any extra locking.
+    """
+
+    def __init__(self, db_path=DATABASE_PATH, data_dir=DATA_DIR):
+        self.db_path = db_path
+        self.data_dir = data_dir
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="storage")
+        self._conn = None
+        self._members_listeners = []
+
+    def _connect(self):
+        """Opens the connection, applies the schema and runs the migrator once."""
+        if self._conn is not None:
+            return self._conn
+
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.executescript(SCHEMA)
+        self._add_missing_columns(conn)
+        self._conn = conn
+
+        if self._get_meta(conn, "json_migrated") is None:
+            self._migrate_json_tree(conn)
+        return conn
+
+    @staticmethod
+    def _add_missing_columns(conn):
+        """Adds columns introduced after a table was first created (CREATE TABLE IF NOT EXISTS skips them)."""
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(members)")}
+        if "last_changed" not in columns:
+            conn.execute("ALTER TABLE members ADD COLUMN last_changed INTEGER")
+
+    async def _run(self, func, *args):
+        """Runs a function with the connection on the storage thread."""
+        def call():
+            return func(self._connect(), *args)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, call)
+
+    async def close(self):
+        """Checkpoints the WAL and closes the connection."""
+        def close_conn():
+            if self._conn is not None:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                self._conn.close()
+                self._conn = None
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, close_conn)
+
+    # ---------------------------------------------------------------- meta
+
+    @staticmethod
+    def _get_meta(conn, key):
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    @staticmethod
+    def _set_meta(conn, key, value):
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value)
+        )
+
+    async def get_meta(self, key):
+        """Returns a stored metadata value, or None."""
+        return await self._run(self._get_meta, key)
+
+    async def set_meta(self, key, value):
+        """Stores a metadata value."""
+        await self._run(self._set_meta, key, value)
+
+    # ------------------------------------------------------------- members
+
+    def add_members_listener(self, listener):
+        """Registers a callback invoked with (game, names) whenever a member list changes.
+
+        names is the set of affected member names, or None if the whole list may have changed.
+        """
+        self._members_listeners.append(listener)
+
+    def _notify_members_changed(self, game, names=None):
+        for listener in self._members_listeners:
+            listener(game, names)
+
+    @staticmethod
+    def _member_row_to_dict(row):
+        member = {"Clan Rank": row["clan_rank"]}
+        if row["total_xp"] is not None:
+            member["Total XP"] = row["total_xp"]
+        member["Join Date"] = row["join_date"]
+        if row["last_changed"] is not None:
+            member["Last Changed"] = row["last_changed"]
+        return member
+
+    async def get_members(self, game):
+        """Returns the member list for a game as {name: member data}."""
+        def query(conn):
+            rows = conn.execute(
+                "SELECT name, clan_rank, total_xp, join_date, last_changed FROM members WHERE game = ? ORDER BY rowid",
+                (game,)
+            ).fetchall()
+            return {row["name"]: self._member_row_to_dict(row) for row in rows}
+
+        return await self._run(query)
+
+    @staticmethod
+    def _replace_members(conn, game, members):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS current_names (name TEXT PRIMARY KEY)")
+            conn.execute("DELETE FROM current_names")
+            conn.executemany("INSERT OR IGNORE INTO current_names (name) VALUES (?)", ((name,) for name in members))
+            conn.execute(
+                "DELETE FROM members WHERE game = ? AND name NOT IN (SELECT name FROM current_names)",
+                (game,)
+            )
+            conn.executemany(
+                "INSERT INTO members (game, name, clan_rank, total_xp, join_date) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(game, name) DO UPDATE SET clan_rank = excluded.clan_rank, "
+                "total_xp = excluded.total_xp, join_date = excluded.join_date",
+                (
+                    (game, name, data.get("Clan Rank"), data.get("Total XP"), data.get("Join Date", "Unknown"))
+                    for name, data in members.items()
+                )
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    async def replace_members(self, game, members):
+        """Replaces a game's member list, removing anyone no longer in the clan."""
+        try:
+            await self._run(self._replace_members, game, members)
+        finally:
+            self._notify_members_changed(game)
+
+    @staticmethod
+    def _apply_member_changes(conn, game, upserts, removals):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "DELETE FROM members WHERE game = ? AND name = ?",
+                ((game, name) for name in removals)
+            )
+            conn.executemany(
+                "INSERT INTO members (game, name, clan_rank, total_xp, join_date) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(game, name) DO UPDATE SET clan_rank = excluded.clan_rank, "
+                "total_xp = excluded.total_xp, join_date = excluded.join_date",
+                (
+                    (game, name, data.get("Clan Rank"), data.get("Total XP"), data.get("Join Date", "Unknown"))
+                    for name, data in upserts.items()
+                )
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    async def apply_member_changes(self, game, upserts, removals):
+        """Upserts changed members and removes departed ones in one transaction."""
+        if not upserts and not removals:
+            return
+        try:
+            await self._run(self._apply_member_changes, game, upserts, removals)
+        finally:
+            self._notify_members_changed(game, set(upserts) | set(removals))
+
+    async def _set_member_column(self, game, column, values_by_name):
+        if not values_by_name:
+            return 0
+
+        def update(conn):
+            # Row by row, so listeners only hear about the members whose value actually moved
+            changed = set()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for name, value in values_by_name.items():
+                    cursor = conn.execute(
+                        f"UPDATE members SET {column} = ? WHERE game = ? AND name = ? AND {column} IS NOT ?",
+                        (value, game, name, value)
+                    )
+                    if cursor.rowcount:
+                        changed.add(name)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            return changed
+
+        changed = await self._run(update)
+        if changed:
+            self._notify_members_changed(game, changed)
+        return len(changed)
+
+    async def set_total_xp(self, game, xp_by_name):
+        """Updates total XP for existing members from {name: xp}. Returns the number of rows changed."""
+        return await self._set_member_column(game, "total_xp", xp_by_name)
+
+    async def set_last_changed(self, game, last_changed_by_name):
+        """Updates when existing members' stats last changed, from {name: unix time}. Returns the number of rows changed."""
+        return await self._set_member_column(game, "last_changed", last_changed_by_name)
+
+    async def set_join_date(self, game, name, join_date):
+        """Updates a member's join date. Returns False if the member does not exist."""
+        def update(conn):
+            cursor = conn.execute(
+                "UPDATE members SET join_date = ? WHERE game = ? AND name = ?",
+                (join_date, game, name)
+            )
+            return cursor.rowcount > 0
+
+        try:
+            return await self._run(update)
+        finally:
+            self._notify_members_changed(game, {name})
+
+    # ---------------------------------------------------------- promotions
+
+    async def get_promotion_eligible(self, game):
+        """Returns the names already reported as eligible for promotion in a game."""
+        def query(conn):
+            rows = conn.execute("SELECT name FROM promotion_eligible WHERE game = ?", (game,)).fetchall()
+            return {row["name"] for row in rows}
+
+        return await self._run(query)
+
+    async def set_promotion_eligible(self, game, names):
+        """Replaces the set of names already reported as eligible for promotion in a game."""
+        def replace(conn):
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM promotion_eligible WHERE game = ?", (game,))
+                conn.executemany(
+                    "INSERT INTO promotion_eligible (game, name) VALUES (?, ?)",
+                    ((game, name) for name in names)
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        await self._run(replace)
+
+    # ----------------------------------------------------------- donations
+
+    @staticmethod
+    def _apply_donation_events(conn, events, through_seq):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            compacted_seq = int(Storage._get_meta(conn, "journal_compacted_seq") or 0)
+            for event in events:
+                if event["seq"] <= compacted_seq:
+                    continue
+                column = "rs3_donated" if event["game"] == "rs3" else "osrs_donated"
+                conn.execute(
+                    f"INSERT INTO donations (donator_id, {column}) VALUES (?, ?) "
+                    f"ON CONFLICT(donator_id) DO UPDATE SET {column} = {column} + excluded.{column}",
+                    (event["donator_id"], event["amount"])
+                )
+            Storage._set_meta(conn, "journal_compacted_seq", str(max(compacted_seq, through_seq)))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    async def apply_donation_events(self, events, through_seq):
+        """Folds journaled donation events into the running totals in one transaction.
+
+        Events at or below the stored compaction watermark are skipped, so
+        replaying a segment that was already folded in is harmless.
+        """
+        await self._run(self._apply_donation_events, events, through_seq)
+
+    async def get_donation_snapshot(self):
+        """Returns every donator's totals and the journal seq they include."""
+        def query(conn):
+            conn.execute("BEGIN")
+            try:
+                rows = conn.execute("SELECT donator_id, rs3_donated, osrs_donated FROM donations").fetchall()
+                compacted_seq = int(self._get_meta(conn, "journal_compacted_seq") or 0)
+            finally:
+                conn.execute("COMMIT")
+            donators = {
+                row["donator_id"]: {"rs3_donated": row["rs3_donated"], "osrs_donated": row["osrs_donated"]}
+                for row in rows
+            }
+            return donators, compacted_seq
+
+        return await self._run(query)
+
+    # -------------------------------------------------------------- ledger
+
+    async def get_ledger(self):
+        """Returns the clan coffer balances as {game: amount}."""
+        def query(conn):
+            return {row["game"]: row["amount"] for row in conn.execute("SELECT game, amount FROM ledger")}
+
+        return await self._run(query)
+
+    async def set_ledger_amount(self, game, amount):
+        """Replaces the clan coffer balance for a game."""
+        def upsert(conn):
+            conn.execute(
+                "INSERT INTO ledger (game, amount) VALUES (?, ?) "
+                "ON CONFLICT(game) DO UPDATE SET amount = excluded.amount",
+                (game, amount)
+            )
+
+        await self._run(upsert)
+
+    # -------------------------------------------------------- expenditures
+
+    async def add_expenditure(self, expenditure):
+        """Records a new expenditure."""
+        def insert(conn):
+            conn.execute(
+                "INSERT INTO expenditures (date, timestamp, amount, formatted_amount, game, reason) "
+                "VALUES (:date, :timestamp, :amount, :formatted_amount, :game, :reason)",
+                expenditure
+            )
+
+        await self._run(insert)
+
+    async def get_recent_expenditures(self, limit=5):
+        """Returns the most recent expenditures, newest first."""
+        def query(conn):
+            rows = conn.execute(
+                "SELECT date, timestamp, amount, formatted_amount, game, reason "
+                "FROM expenditures ORDER BY timestamp DESC, id DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+            return [dict(row) for row in rows]
+
+        return await self._run(query)
+
+    # ---------------------------------------------------------- inactivity
+
+    async def get_inactivity(self, game):
+        """Returns the inactivity list for a game in report order."""
+        def query(conn):
+            rows = conn.execute(
+                "SELECT display_name, discord_user_id, reported_at FROM inactivity WHERE game = ? ORDER BY rowid",
+                (game,)
+            ).fetchall()
+            return [
+                {
+                    "Display Name": row["display_name"],
+                    "Discord User ID": row["discord_user_id"],
+                    "Date & Time": row["reported_at"]
+                }
+                for row in rows
+            ]
+
+        return await self._run(query)
+
+    async def mark_inactive(self, game, user_id, display_name, reported_at):
+        """Adds a member to the inactivity list. Returns False if they were already on it."""
+        def insert(conn):
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO inactivity (game, discord_user_id, display_name, reported_at) VALUES (?, ?, ?, ?)",
+                (game, str(user_id), display_name, reported_at)
+            )
+            return cursor.rowcount > 0
+
+        return await self._run(insert)
+
+    async def mark_active(self, game, user_id):
+        """Removes a member from the inactivity list. Returns False if they were not on it."""
+        def delete(conn):
+            cursor = conn.execute(
+                "DELETE FROM inactivity WHERE game = ? AND discord_user_id = ?",
+                (game, str(user_id))
+            )
+            return cursor.rowcount > 0
+
+        return await self._run(delete)
+
+    # ----------------------------------------------------------- audit log
+
+    async def add_audit_records(self, records):
+        """Appends a batch of command usage records in one transaction."""
+        def insert(conn):
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    "INSERT INTO audit_log (timestamp, user_id, command, channel_id, details) "
+                    "VALUES (:timestamp, :user_id, :command, :channel_id, :details)",
+                    records
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+        await self._run(insert)
+
+    # ------------------------------------------------------------ migrator
+
+    def _load_legacy(self, relative_path, default):
+        file_path = os.path.join(self.data_dir, relative_path)
+        if not os.path.exists(file_path):
+            return default
+        try:
+            with open(file_path, "r") as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            logger.warning(f"Skipping unreadable legacy file during migration: {file_path}")
+            return default
+
+    def _migrate_json_tree(self, conn):
+        """Imports the legacy per-cog JSON files into the database in one transaction."""
+        logger.info(f"Migrating legacy JSON data from {self.data_dir}")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for game, relative_path in LEGACY_MEMBER_FILES.items():
+                members = self._load_legacy(relative_path, {})
+                conn.executemany(
+                    "INSERT OR REPLACE INTO members (game, name, clan_rank, total_xp, join_date) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        (game, name, data.get("Clan Rank"), data.get("Total XP"), data.get("Join Date", "Unknown"))
+                        for name, data in members.items()
+                    )
+                )
+
+            for game, relative_path in LEGACY_INACTIVITY_FILES.items():
+                entries = self._load_legacy(relative_path, [])
+                conn.executemany(
+                    "INSERT OR IGNORE INTO inactivity (game, discord_user_id, display_name, reported_at) VALUES (?, ?, ?, ?)",
+                    (
+                        (game, str(entry["Discord User ID"]), entry.get("Display Name"), entry.get("Date & Time"))
+                        for entry in entries
+                    )
+                )
+
+            leaderboard_dir = os.path.join(self.data_dir, LEGACY_LEADERBOARD_DIR)
+            if os.path.isdir(leaderboard_dir):
+                for file in os.listdir(leaderboard_dir):
+                    if not file.endswith(".json"):
+                        continue
+                    data = self._load_legacy(os.path.join(LEGACY_LEADERBOARD_DIR, file), None)
+                    if data is None:
+                        continue
+                    conn.execute(
+                        "INSERT OR REPLACE INTO donations (donator_id, rs3_donated, osrs_donated) VALUES (?, ?, ?)",
+                        (file[:-len(".json")], data.get("rs3_donated", 0), data.get("osrs_donated", 0))
+                    )
+
+            ledger = self._load_legacy(LEGACY_LEDGER_FILE, {})
+            for game, amount in ledger.items():
+                conn.execute(
+                    "INSERT OR REPLACE INTO ledger (game, amount) VALUES (?, ?)",
+                    (game, amount)
+                )
+
+            # Legacy file is newest first; insert oldest first so ids follow time
+            expenditures = self._load_legacy(LEGACY_EXPENDITURES_FILE, [])
+            conn.executemany(
+                "INSERT INTO expenditures (date, timestamp, amount, formatted_amount, game, reason) "
+                "VALUES (:date, :timestamp, :amount, :formatted_amount, :game, :reason)",
+                list(reversed(expenditures))
+            )
+
+            self._set_meta(conn, "json_migrated", "1")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        logger.info("Legacy JSON migration complete")
+
+
+# Shared storage instance used by every cog
+storage = Storage()
+
+
+if __name__ == "__main__":
+    # One-shot migration: python -m logic.storage [data_dir] [db_path]
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else DATA_DIR
+    db_path = sys.argv[2] if len(sys.argv) > 2 else os.path.join(data_dir, "ghostedbot.db")
+
+    async def main():
+        migrator = Storage(db_path=db_path, data_dir=data_dir)
+        ledger = await migrator.get_ledger()
+        print(f"[DEBUG] Database ready at {db_path} (ledger: {ledger})")
+        await migrator.close()
+
+    asyncio.run(main())
@@ -0,0 +1,210 @@
+import json
+import time
+import random
+import hashlib
+import asyncio
+import logging
+import aiohttp
+from logic.http_client import http_client, HttpError
+from logic.file_access import read_json, write_json
+
+logger = logging.getLogger(__name__)
+
+# Retry policy for webhook edits
+MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 1
+BACKOFF_MAX_SECONDS = 30
+
+# Path to the persisted hashes of the last payload sent to each message
+RENDER_CACHE_PATH = "/root/ghosted-bot/data/webhooks/render_cache.json"
+
+
+class RenderCache:
+    """Content hashes of the last payload successfully sent to each message.
+
+    Keyed by message ID only, so webhook tokens never reach the disk.
+    """
+
+    def __init__(self, cache_path=RENDER_CACHE_PATH):
+        self.cache_path = cache_path
+        self._hashes = None
+
+    @staticmethod
+    def payload_hash(payload):
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    async def _ensure_loaded(self):
+        if self._hashes is None:
+            try:
+                self._hashes = await read_json(self.cache_path, default={})
+            except (json.JSONDecodeError, OSError):
+                self._hashes = {}
+        return self._hashes
+
+    async def matches(self, message_id, payload_hash):
+        """Returns True if the message already shows a payload with this hash."""
+        hashes = await self._ensure_loaded()
+        return hashes.get(str(message_id)) == payload_hash
+
+    async def record(self, message_id, payload_hash):
+        """Remembers the hash of a payload that was just sent."""
+        hashes = await self._ensure_loaded()
+        hashes[str(message_id)] = payload_hash
+        await write_json(self.cache_path, dict(hashes))
+
+    async def invalidate(self, message_id=None):
+        """Forgets one message's hash, or all of them, forcing the next edit through."""
+        hashes = await self._ensure_loaded()
+        if message_id is None:
+            hashes.clear()
+        else:
+            hashes.pop(str(message_id), None)
+        await write_json(self.cache_path, dict(hashes))
+
+
+class WebhookDispatcher:
+    """Queue for webhook message edits that respects Discord rate limits.
+
+    Edits are keyed by (webhook URL, message ID). While an edit for a
+    message is waiting to be sent, newer edits for the same message
+    replace its payload, so a burst of updates becomes a single PATCH
+    with the latest content. Rate-limit buckets are tracked from the
+    X-RateLimit-* response headers, 429s wait out retry_after, and
+    network errors or 5xx responses are retried with jittered backoff.
+    An edit whose payload hashes the same as the last one sent to that
+    message is skipped without a network call.
+    """
+
+    def __init__(self, max_retries=MAX_RETRIES, render_cache=None):
+        self.max_retries = max_retries
+        self.render_cache = render_cache or RenderCache()
+        self._pending = {}
+        self._queue = None
+        self._worker = None
+        self._route_buckets = {}
+        self._buckets = {}
+        self._global_reset_at = 0
+
+    def edit_message(self, webhook_url, message_id, payload):
+        """Queues an edit and returns a future that resolves once it (or a newer edit) is sent."""
+        key = (webhook_url, str(message_id))
+        entry = self._pending.get(key)
+        if entry is not None:
+            entry[0] = payload
+            return entry[1]
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = [payload, future]
+        self._ensure_worker()
+        self._queue.put_nowait(key)
+        return future
+
+    def _ensure_worker(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        while True:
+            key = await self._queue.get()
+            payload, future = self._pending.pop(key)
+            try:
+                payload_hash = RenderCache.payload_hash(payload)
+                if not await self.render_cache.matches(key[1], payload_hash):
+                    await self._send(key, payload)
+                    await self.render_cache.record(key[1], payload_hash)
+            except Exception as e:
+                logger.error(f"Webhook edit for message {key[1]} failed: {e}")
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(None)
+
+    # --------------------------------------------------------- rate limits
+
+    async def _wait_for_bucket(self, route):
+        now = time.monotonic()
+        wait = max(0, self._global_reset_at - now)
+
+        bucket = self._buckets.get(self._route_buckets.get(route))
+        if bucket is not None:
+            remaining, reset_at = bucket
+            if remaining <= 0:
+                wait = max(wait, reset_at - now)
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _update_bucket(self, route, headers):
+        bucket_id = headers.get("X-RateLimit-Bucket")
+        if bucket_id is None:
+            return
+        self._route_buckets[route] = bucket_id
+        try:
+            remaining = int(headers.get("X-RateLimit-Remaining", 1))
+            reset_after = float(headers.get("X-RateLimit-Reset-After", 0))
+        except ValueError:
+            return
+        self._buckets[bucket_id] = (remaining, time.monotonic() + reset_after)
+
+    def _handle_rate_limited(self, route, response):
+        try:
+            body = response.json()
+        except ValueError:
+            body = {}
+        retry_after = float(body.get("retry_after", response.headers.get("Retry-After", 1)))
+        reset_at = time.monotonic() + retry_after
+
+        if body.get("global") or response.headers.get("X-RateLimit-Global"):
+            self._global_reset_at = reset_at
+        else:
+            bucket_id = self._route_buckets.get(route, route)
+            self._route_buckets[route] = bucket_id
+            self._buckets[bucket_id] = (0, reset_at)
+        logger.warning(f"Webhook rate limited, retrying in {retry_after:.2f}s")
+
+    @staticmethod
+    def _backoff(attempt):
+        delay = min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+
+    # ------------------------------------------------------------- sending
+
+    async def _send(self, key, payload):
+        webhook_url, message_id = key
+        route = ("PATCH", webhook_url)
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            await self._wait_for_bucket(route)
+
+            try:
+                response = await http_client.patch(f"{webhook_url}/messages/{message_id}", json=payload)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_error = e
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            self._update_bucket(route, response.headers)
+
+            if response.status_code == 429:
+                last_error = HttpError(response)
+                self._handle_rate_limited(route, response)
+                continue
+
+            if response.status_code >= 500:
+                last_error = HttpError(response)
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            response.raise_for_status()
+            return response
+
+        raise last_error
+
+
+# Shared webhook dispatcher used by every cog that edits webhook messages
+webhook_dispatcher = WebhookDispatcher()
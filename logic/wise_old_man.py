@@ -0,0 +1,134 @@
+import time
+import logging
+from datetime import datetime
+import config
+from logic.storage import storage
+from logic.member_cache import member_cache
+from logic.http_client import http_client
+
+logger = logging.getLogger(__name__)
+
+# Wise Old Man v2 API; group hiscores are paginated with limit/offset (max 50 per page)
+WOM_API_URL = "https://api.wiseoldman.net/v2"
+PAGE_SIZE = 50
+
+# Group responses are reused for 15 minutes
+CACHE_TTL_SECONDS = 15 * 60
+
+USER_AGENT = "GhostedBot"
+
+
+def normalize_name(name):
+    """Normalizes an OSRS name the way the game does (case, spaces, underscores and hyphens)."""
+    return name.replace("\xa0", " ").replace("_", " ").replace("-", " ").strip().lower()
+
+
+def parse_timestamp(value):
+    """Converts a Wise Old Man ISO 8601 timestamp to unix seconds, or None."""
+    if not value:
+        return None
+    try:
+        return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+    except ValueError:
+        return None
+
+
+class WiseOldManClient:
+    """Group-level Wise Old Man queries for the OSRS clan.
+
+    The whole group's members and their total XP come from the paginated
+    group hiscores endpoint, so a clan of a few hundred members costs a
+    handful of requests instead of one per player. Each entry also
+    carries when Wise Old Man last saw the player's stats change, which
+    is stored with the member so the hiscores enricher can check
+    unchanged players less often. GET responses are cached in memory for
+    a TTL.
+
+    base_url can point at a local fixture server.
+    """
+
+    def __init__(self, group_id=None, base_url=WOM_API_URL, ttl=CACHE_TTL_SECONDS):
+        self.group_id = group_id or config.WISE_OLD_MAN_CREDENTIALS['group_id']
+        self.base_url = base_url
+        self.ttl = ttl
+        self._cache = {}
+
+    async def _get(self, path, params=None):
+        key = (path, tuple(sorted((params or {}).items())))
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        # Never take a cached fallback: its XP would be stored and cached as current
+        response = await http_client.get(
+            f"{self.base_url}{path}", params=params, headers={"User-Agent": USER_AGENT}, fallback=False
+        )
+        response.raise_for_status()
+        data = response.json()
+        self._cache[key] = (time.monotonic() + self.ttl, data)
+        return data
+
+    def invalidate(self):
+        """Drops every cached response."""
+        self._cache.clear()
+
+    async def get_group_hiscores(self, metric="overall"):
+        """Returns every group member's hiscore entry for a metric, fetched page by page."""
+        entries, offset = [], 0
+        while True:
+            page = await self._get(
+                f"/groups/{self.group_id}/hiscores",
+                {"metric": metric, "limit": PAGE_SIZE, "offset": offset}
+            )
+            entries.extend(page)
+            if len(page) < PAGE_SIZE:
+                return entries
+            offset += PAGE_SIZE
+
+    async def get_group_members(self):
+        """Returns {normalized name: {"display_name", "xp", "last_changed"}} for the whole group.
+
+        last_changed is when Wise Old Man last saw the player's stats change, in unix seconds, or None.
+        """
+        members = {}
+        for entry in await self.get_group_hiscores("overall"):
+            player = entry.get("player", {})
+            name = player.get("displayName") or player.get("username")
+            if not name:
+                continue
+            xp = entry.get("data", {}).get("experience")
+            members[normalize_name(name)] = {
+                "display_name": name,
+                "xp": xp if xp is not None and xp >= 0 else None,
+                "last_changed": parse_timestamp(player.get("lastChangedAt"))
+            }
+        return members
+
+    async def sync_osrs_members(self):
+        """Feeds the group's total XP and last-changed times into the OSRS member records.
+
+        Returns the set of roster names Wise Old Man had XP for.
+        """
+        group = await self.get_group_members()
+        roster = await member_cache.get_roster("osrs")
+
+        xp_by_name, last_changed_by_name = {}, {}
+        for name in roster:
+            record = group.get(normalize_name(name))
+            if record is None:
+                continue
+            if record["xp"] is not None:
+                xp_by_name[name] = record["xp"]
+            if record["last_changed"] is not None:
+                last_changed_by_name[name] = record["last_changed"]
+
+        updated = await storage.set_total_xp("osrs", xp_by_name)
+        await storage.set_last_changed("osrs", last_changed_by_name)
+        logger.info(
+            f"Wise Old Man sync matched {len(xp_by_name)}/{len(roster)} OSRS member(s), {updated} updated"
+        )
+        return set(xp_by_name)
+
+
+# Shared Wise Old Man client used by the roster sync
+wise_old_man = WiseOldManClient()
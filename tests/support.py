@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import logic.member_cache
+from logic.storage import Storage
+from logic.member_cache import MemberRosterCache
+from logic.http_client import HttpClient
+
+
+class ServiceTestCase(unittest.IsolatedAsyncioTestCase):
+    """Runs each test against a throwaway SQLite store, member cache and HTTP client.
+
+    The shared storage, member_cache and http_client objects are swapped
+    out in logic.member_cache and in every module listed in
+    patched_modules, so the code under test never touches the real data
+    directory or a session from another event loop. serve() starts a
+    local aiohttp server for the code under test to call.
+    """
+
+    patched_modules = ()
+
+    async def asyncSetUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.data_dir = self._tmp.name
+        self.storage = Storage(os.path.join(self.data_dir, "test.db"), self.data_dir)
+        self.member_cache = MemberRosterCache()
+        self.storage.add_members_listener(self.member_cache.invalidate)
+        self.http_client = HttpClient()
+
+        replacements = {"storage": self.storage, "member_cache": self.member_cache, "http_client": self.http_client}
+        for module in (logic.member_cache, *self.patched_modules):
+            for name, value in replacements.items():
+                if hasattr(module, name):
+                    patcher = mock.patch.object(module, name, value)
+                    patcher.start()
+                    self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await self.http_client.close()
+        await self.storage.close()
+        self.storage._executor.shutdown()
+        self._tmp.cleanup()
+
+    async def serve(self, *routes):
+        """Starts a local server for the given aiohttp routes and returns it; use server.make_url(path)."""
+        app = web.Application()
+        app.add_routes(routes)
+        server = TestServer(app)
+        await server.start_server()
+        self.addAsyncCleanup(server.close)
+        return server
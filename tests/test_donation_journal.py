@@ -0,0 +1,55 @@
+import os
+import asyncio
+import unittest
+from unittest import mock
+import logic.donation_journal
+from logic.donation_journal import DonationJournal
+from support import ServiceTestCase
+
+
+class DonationJournalTests(ServiceTestCase):
+    patched_modules = (logic.donation_journal,)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.journal = DonationJournal(
+            journal_path=os.path.join(self.data_dir, "journal", "journal.jsonl"),
+            archive_dir=os.path.join(self.data_dir, "journal", "archive")
+        )
+        self.addAsyncCleanup(self.journal.close)
+
+    async def test_concurrent_appends_share_a_batch(self):
+        events = await asyncio.gather(*(self.journal.append(f"user{index}", "rs3", 1000, "mod") for index in range(5)))
+
+        self.assertEqual([event["seq"] for event in events], [1, 2, 3, 4, 5])
+        self.assertEqual(self.journal.durable_seq, 5)
+        self.assertEqual([event["seq"] for event in await self.journal.read_events()], [1, 2, 3, 4, 5])
+
+    async def test_failed_write_leaves_no_partial_line_or_gap(self):
+        await self.journal.append("user1", "rs3", 1000, "mod")
+
+        with mock.patch.object(logic.donation_journal.os, "fsync", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                await self.journal.append("user2", "rs3", 2000, "mod")
+
+        with open(self.journal.journal_path) as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+        event = await self.journal.append("user3", "osrs", 3000, "mod")
+        self.assertEqual(event["seq"], 2)
+        self.assertEqual([event["donator_id"] for event in await self.journal.read_events()], ["user1", "user3"])
+
+    async def test_close_waits_for_pending_batch(self):
+        append = asyncio.get_running_loop().create_task(self.journal.append("user1", "rs3", 1000, "mod"))
+        # Opening the journal takes a few awaits before the event is queued
+        while not self.journal._flush_tasks:
+            await asyncio.sleep(0)
+
+        await self.journal.close()
+        self.assertTrue(append.done())
+        self.assertEqual(self.journal.durable_seq, 1)
+        self.assertEqual((await append)["seq"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
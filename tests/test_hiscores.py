@@ -0,0 +1,181 @@
+import os
+import time
+import asyncio
+import unittest
+from unittest import mock
+from aiohttp import web
+import logic.hiscores
+import logic.http_client
+from logic.hiscores import HiscoresEnricher, RateLimiter, BASE_TTL_SECONDS, MAX_TTL_SECONDS
+from logic.resilience import EndpointPolicy
+from support import ServiceTestCase
+
+# Overall rank, level and XP, then one line per skill
+INDEX_LITE = "{rank},2277,{xp}\n1,99,13034431\n1,99,13034431\n"
+
+OSRS_MEMBERS = {
+    "Lynx Titan": {"Clan Rank": "marshal", "Join Date": "01/01/2020"},
+    "Iron Hyger": {"Clan Rank": "general", "Join Date": "01/01/2021"},
+    "Nobody": {"Clan Rank": "thief", "Join Date": "01/01/2022"}
+}
+
+
+class ParseTotalXpTests(unittest.TestCase):
+    def test_overall_xp(self):
+        self.assertEqual(HiscoresEnricher.parse_total_xp(INDEX_LITE.format(rank=1, xp=4600000000)), 4600000000)
+
+    def test_unranked(self):
+        self.assertIsNone(HiscoresEnricher.parse_total_xp("-1,-1,-1\n"))
+
+    def test_malformed(self):
+        self.assertIsNone(HiscoresEnricher.parse_total_xp("<html>Maintenance</html>"))
+        self.assertIsNone(HiscoresEnricher.parse_total_xp(""))
+
+
+class RateLimiterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_spaces_requests_after_burst(self):
+        limiter = RateLimiter(20, burst=1)
+        started = time.monotonic()
+        for _ in range(6):
+            await limiter.acquire()
+        # The first token is free, the other five wait 1/20 s each
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+
+
+class HiscoresEnricherTests(ServiceTestCase):
+    patched_modules = (logic.hiscores,)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.storage.replace_members("osrs", OSRS_MEMBERS)
+        self.xp = {"Lynx Titan": 4600000000, "Iron Hyger": 250000000}
+        self.lookups = []
+        self.healthy = True
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def index_lite(request):
+            player = request.query["player"]
+            self.lookups.append(player)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                await asyncio.sleep(0.02)
+            finally:
+                self.in_flight -= 1
+            if not self.healthy:
+                return web.Response(status=503, text="Down")
+            if player not in self.xp:
+                return web.Response(status=404, text="Not found")
+            return web.Response(text=INDEX_LITE.format(rank=1, xp=self.xp[player]))
+
+        server = await self.serve(web.get("/index_lite.ws", index_lite))
+        self.enricher = HiscoresEnricher(
+            base_url=str(server.make_url("/index_lite.ws")),
+            cache_path=os.path.join(self.data_dir, "osrs_cache.json"),
+            max_concurrent=2,
+            requests_per_second=100
+        )
+
+    async def test_lookup(self):
+        self.assertEqual(await self.enricher.lookup("Lynx Titan"), 4600000000)
+        self.assertIsNone(await self.enricher.lookup("Nobody"))
+
+    async def test_enrich_stores_xp(self):
+        looked_up, failed, updated = await self.enricher.enrich()
+
+        self.assertEqual((looked_up, failed, updated), (3, 0, 2))
+        members = await self.storage.get_members("osrs")
+        self.assertEqual(members["Lynx Titan"]["Total XP"], 4600000000)
+        self.assertEqual(members["Iron Hyger"]["Total XP"], 250000000)
+        self.assertNotIn("Total XP", members["Nobody"])
+        self.assertTrue(os.path.exists(self.enricher.cache_path))
+
+    async def test_enrich_respects_concurrency_limit(self):
+        await self.enricher.enrich()
+        self.assertLessEqual(self.max_in_flight, 2)
+
+    async def test_fresh_entries_are_not_looked_up_again(self):
+        await self.enricher.enrich()
+        self.lookups.clear()
+
+        looked_up, _failed, _updated = await self.enricher.enrich()
+        self.assertEqual(looked_up, 0)
+        self.assertEqual(self.lookups, [])
+
+        await self.enricher.enrich(force=True)
+        self.assertEqual(sorted(self.lookups), sorted(OSRS_MEMBERS))
+
+    async def test_exclude_skips_members(self):
+        await self.enricher.enrich(exclude={"Lynx Titan"})
+        self.assertNotIn("Lynx Titan", self.lookups)
+
+    async def test_stale_entry_is_refreshed(self):
+        await self.enricher.enrich()
+        entry = self.enricher._cache["Iron Hyger"]
+        self.assertFalse(self.enricher.is_stale("Iron Hyger"))
+        self.assertTrue(self.enricher.is_stale("Iron Hyger", now=entry["fetched_at"] + entry["ttl"]))
+
+    async def test_unchanged_on_wise_old_man_waits_for_max_ttl(self):
+        await self.enricher.enrich()
+        entry = self.enricher._cache["Iron Hyger"]
+        after_ttl = entry["fetched_at"] + entry["ttl"]
+
+        self.assertTrue(self.enricher.is_stale("Iron Hyger", now=after_ttl, last_changed=entry["fetched_at"] + 1))
+        self.assertFalse(self.enricher.is_stale("Iron Hyger", now=after_ttl, last_changed=entry["fetched_at"] - 1))
+        self.assertTrue(self.enricher.is_stale(
+            "Iron Hyger", now=entry["fetched_at"] + MAX_TTL_SECONDS, last_changed=entry["fetched_at"] - 1
+        ))
+
+    async def test_enrich_uses_stored_last_changed(self):
+        await self.enricher.enrich()
+        for entry in self.enricher._cache.values():
+            entry["fetched_at"] -= entry["ttl"]
+        await self.storage.set_last_changed("osrs", {"Lynx Titan": int(self.enricher._cache["Lynx Titan"]["fetched_at"]) - 1})
+        self.lookups.clear()
+
+        await self.enricher.enrich()
+        self.assertEqual(sorted(self.lookups), ["Iron Hyger", "Nobody"])
+
+    async def test_ttl_backs_off_while_xp_is_unchanged(self):
+        await self.enricher._ensure_loaded()
+        self.enricher._record("Lynx Titan", 100, time.time())
+        first = self.enricher._cache["Lynx Titan"]["ttl"]
+        self.assertGreaterEqual(first, BASE_TTL_SECONDS * 0.9)
+        self.assertLessEqual(first, BASE_TTL_SECONDS * 1.1)
+
+        self.enricher._record("Lynx Titan", 100, time.time())
+        self.assertGreaterEqual(self.enricher._cache["Lynx Titan"]["ttl"], first * 2 * 0.9)
+
+        for _ in range(10):
+            self.enricher._record("Lynx Titan", 100, time.time())
+        self.assertLessEqual(self.enricher._cache["Lynx Titan"]["ttl"], MAX_TTL_SECONDS * 1.1)
+
+        self.enricher._record("Lynx Titan", 200, time.time())
+        self.assertLessEqual(self.enricher._cache["Lynx Titan"]["ttl"], BASE_TTL_SECONDS * 1.1)
+
+    async def test_failed_lookups_are_counted(self):
+        async def broken(request):
+            return web.Response(status=400, text="Bad request")
+
+        server = await self.serve(web.get("/index_lite.ws", broken))
+        self.enricher.base_url = str(server.make_url("/index_lite.ws"))
+
+        looked_up, failed, updated = await self.enricher.enrich()
+        self.assertEqual((looked_up, failed, updated), (3, 3, 0))
+
+    async def test_cached_fallbacks_are_not_stored_as_fresh(self):
+        await self.enricher.enrich()
+        fetched_at = self.enricher._cache["Lynx Titan"]["fetched_at"]
+
+        # The client now holds a good response for every member to fall back on
+        self.healthy = False
+        single_attempt = EndpointPolicy(max_attempts=1, failure_threshold=100)
+        with mock.patch.object(logic.http_client, "policy_for", lambda endpoint: single_attempt):
+            looked_up, failed, updated = await self.enricher.enrich(force=True)
+
+        self.assertEqual((looked_up, failed, updated), (3, 3, 0))
+        self.assertEqual(self.enricher._cache["Lynx Titan"]["fetched_at"], fetched_at)
+
+if __name__ == "__main__":
+    unittest.main()
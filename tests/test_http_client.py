@@ -0,0 +1,92 @@
+import unittest
+from unittest import mock
+from aiohttp import web
+from multidict import CIMultiDict
+import logic.http_client
+from logic.http_client import HttpResponse, HttpError
+from logic.resilience import EndpointPolicy, CircuitOpenError, endpoint_for, policy_for
+from support import ServiceTestCase
+
+# Fast retries so failure paths do not slow the suite down
+TEST_POLICY = EndpointPolicy(max_attempts=2, backoff_base=0.01, backoff_max=0.01, failure_threshold=2, reset_timeout=60)
+
+
+class ResponseTextTests(unittest.TestCase):
+    def response(self, content_type, content):
+        return HttpResponse("GET", "http://test", 200, CIMultiDict({"Content-Type": content_type}), content)
+
+    def test_declared_charset(self):
+        self.assertEqual(self.response("text/plain; charset=utf-8", "Nurse Kate ✓".encode("utf-8")).text, "Nurse Kate ✓")
+
+    def test_latin1_without_charset(self):
+        self.assertEqual(self.response("text/plain", b"Nurse\xa0Kate").text, "Nurse\xa0Kate")
+
+    def test_json_defaults_to_utf8(self):
+        self.assertEqual(self.response("application/json", '"Zé"'.encode("utf-8")).text, '"Zé"')
+
+
+class EndpointTests(unittest.TestCase):
+    def test_webhooks_get_their_own_endpoint(self):
+        first = endpoint_for("https://discord.com/api/webhooks/111/token-a/messages/1")
+        second = endpoint_for("https://discord.com/api/webhooks/222/token-b/messages/1")
+
+        self.assertEqual(first, "discord.com/webhooks/111")
+        self.assertNotEqual(first, second)
+        self.assertNotIn("token", first)
+        self.assertEqual(policy_for(first).max_attempts, 1)
+
+    def test_other_hosts_share_one_endpoint(self):
+        self.assertEqual(endpoint_for("https://api.wiseoldman.net/v2/groups/1"), "api.wiseoldman.net")
+
+
+class HttpClientTests(ServiceTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        patcher = mock.patch.object(logic.http_client, "policy_for", lambda endpoint: TEST_POLICY)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.healthy = True
+
+        async def data(request):
+            if not self.healthy:
+                return web.Response(status=503, text="Down")
+            return web.Response(text="fresh")
+
+        self.server = await self.serve(web.get("/data", data))
+        self.url = str(self.server.make_url("/data"))
+
+    async def test_fallback_served_after_upstream_failure(self):
+        await self.http_client.get(self.url)
+        self.healthy = False
+
+        response = await self.http_client.get(self.url)
+        self.assertTrue(response.from_cache)
+        self.assertEqual(response.text, "fresh")
+
+    async def test_fallback_can_be_refused(self):
+        await self.http_client.get(self.url)
+        self.healthy = False
+
+        response = await self.http_client.get(self.url, fallback=False)
+        self.assertFalse(response.from_cache)
+        with self.assertRaises(HttpError):
+            response.raise_for_status()
+
+        # The breaker is now open; without a fallback the call fails fast
+        with self.assertRaises(CircuitOpenError):
+            await self.http_client.get(self.url, fallback=False)
+        self.assertTrue((await self.http_client.get(self.url)).from_cache)
+
+    async def test_open_breaker_only_affects_its_endpoint(self):
+        first = self.http_client.breaker(endpoint_for("https://discord.com/api/webhooks/111/token"))
+        second = self.http_client.breaker(endpoint_for("https://discord.com/api/webhooks/222/token"))
+        for _ in range(TEST_POLICY.failure_threshold):
+            first.record_failure()
+
+        self.assertFalse(first.allow())
+        self.assertTrue(second.allow())
+
+
+if __name__ == "__main__":
+    unittest.main()
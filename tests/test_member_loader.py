@@ -0,0 +1,59 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest import mock
+from logic.member_loader import MemberLoader
+
+
+def fake_guild(guild_id, members, chunk_error=None):
+    guild = mock.MagicMock()
+    guild.id = guild_id
+    guild.chunked = False
+    guild.members = [mock.MagicMock(id=member_id, display_name=name) for member_id, name in members.items()]
+    guild.get_member.side_effect = lambda member_id: next((member for member in guild.members if member.id == member_id), None)
+    guild.chunk = mock.AsyncMock(side_effect=chunk_error)
+    return guild
+
+
+class MemberLoaderTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.snapshot_path = os.path.join(self._tmp.name, "member_snapshot.json")
+        self.loader = MemberLoader(self.snapshot_path)
+
+    def write_snapshot(self, guilds):
+        with open(self.snapshot_path, "w") as f:
+            json.dump({"saved_at": 0, "guilds": guilds}, f)
+
+    async def test_reads_names_from_older_snapshots(self):
+        self.write_snapshot({"1": {"10": ["Zezima", [555]]}, "2": {"20": "Lynx Titan"}})
+        await self.loader.load_snapshot()
+
+        self.assertEqual(self.loader.display_name(fake_guild(1, {}), 10), "Zezima")
+        self.assertEqual(self.loader.display_name(fake_guild(2, {}), 20), "Lynx Titan")
+        self.assertIsNone(self.loader.display_name(fake_guild(2, {}), 30))
+
+    async def test_live_member_wins_over_snapshot(self):
+        self.write_snapshot({"1": {"10": "Old Name"}})
+        await self.loader.load_snapshot()
+        self.assertEqual(self.loader.display_name(fake_guild(1, {10: "New Name"}), 10), "New Name")
+
+    async def test_reconcile_keeps_snapshot_of_guild_that_failed_to_chunk(self):
+        self.write_snapshot({"1": {"10": "Zezima"}, "2": {"20": "Lynx Titan"}})
+        await self.loader.load_snapshot()
+
+        bot = mock.MagicMock(guilds=[
+            fake_guild(1, {10: "Zezima", 11: "Iron Hyger"}),
+            fake_guild(2, {}, chunk_error=RuntimeError("gateway closed"))
+        ])
+        await self.loader.reconcile(bot)
+
+        with open(self.snapshot_path) as f:
+            saved = json.load(f)["guilds"]
+        self.assertEqual(saved, {"1": {"10": "Zezima", "11": "Iron Hyger"}, "2": {"20": "Lynx Titan"}})
+
+
+if __name__ == "__main__":
+    unittest.main()
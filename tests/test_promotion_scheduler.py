@@ -0,0 +1,109 @@
+import random
+import unittest
+from datetime import date
+from unittest import mock
+import logic.promotion_scheduler
+from logic.promotion_scheduler import PromotionScheduler
+from logic.promotions_engine import find_promotions, get_ladder
+from support import ServiceTestCase
+
+TODAY = date(2026, 1, 1).toordinal()
+
+
+def joined(days_ago):
+    return date.fromordinal(TODAY - days_ago).strftime("%m/%d/%Y")
+
+
+RS3_MEMBERS = {
+    "Old": {"Clan Rank": "Recruit", "Join Date": joined(200)},
+    "New": {"Clan Rank": "Recruit", "Join Date": joined(5)},
+    "Captain": {"Clan Rank": "Captain", "Join Date": joined(900)}
+}
+
+
+class PromotionSchedulerTests(ServiceTestCase):
+    patched_modules = (logic.promotion_scheduler,)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.storage.replace_members("rs3", RS3_MEMBERS)
+        self.scheduler = self.start_scheduler()
+
+    def start_scheduler(self):
+        scheduler = PromotionScheduler()
+        self.storage.add_members_listener(scheduler.on_members_changed)
+        return scheduler
+
+    async def test_members_are_reported_once(self):
+        self.assertEqual(await self.scheduler.due("rs3", TODAY), ["Old"])
+        self.assertEqual(await self.scheduler.due("rs3", TODAY), [])
+        # New reaches Corporal 31 days after joining
+        self.assertEqual(await self.scheduler.due("rs3", TODAY + 26), ["New"])
+
+    async def test_digest(self):
+        self.assertEqual(await self.scheduler.digest("rs3", TODAY), [["Old", joined(200), "Recruit", "Lieutenant"]])
+
+    async def test_restart_does_not_report_eligible_members_again(self):
+        await self.scheduler.due("rs3", TODAY)
+        self.assertEqual(await self.storage.get_promotion_eligible("rs3"), {"Old"})
+
+        restarted = self.start_scheduler()
+        self.assertEqual(await restarted.due("rs3", TODAY), [])
+        self.assertEqual(await restarted.due("rs3", TODAY + 26), ["New"])
+
+    async def test_promoted_member_leaves_the_eligible_set(self):
+        await self.scheduler.due("rs3", TODAY)
+        await self.storage.apply_member_changes("rs3", {"Old": {"Clan Rank": "Lieutenant", "Join Date": joined(200)}}, ())
+
+        self.assertEqual(await self.scheduler.due("rs3", TODAY), [])
+        self.assertEqual(await self.storage.get_promotion_eligible("rs3"), set())
+
+    async def test_changes_during_a_rebuild_are_kept(self):
+        await self.scheduler.due("rs3", TODAY)
+        await self.storage.replace_members("rs3", RS3_MEMBERS)
+
+        get_roster = self.member_cache.get_roster
+        edited = False
+
+        async def get_roster_then_edit(game):
+            # The roster is read, then a join date edit lands before the rebuild finishes
+            nonlocal edited
+            roster = await get_roster(game)
+            if not edited:
+                edited = True
+                await self.storage.set_join_date("rs3", "New", joined(100))
+            return roster
+
+        with mock.patch.object(self.member_cache, "get_roster", get_roster_then_edit):
+            self.assertEqual(await self.scheduler.due("rs3", TODAY), [])
+            self.assertEqual(await self.scheduler.due("rs3", TODAY), ["New"])
+
+    async def test_eligible_lists_everyone_without_marking_them_reported(self):
+        expected = [["Old", joined(200), "Recruit", "Lieutenant"]]
+        self.assertEqual(await self.scheduler.eligible("rs3", TODAY), expected)
+        self.assertEqual(await self.scheduler.due("rs3", TODAY), ["Old"])
+        # Already reported members are still eligible
+        self.assertEqual(await self.scheduler.eligible("rs3", TODAY), expected)
+
+    async def test_eligible_matches_a_full_scan(self):
+        rng = random.Random(7)
+        ranks = ["thief", "recruit", "corporal", "sergeant", "general", "marshal", "owner", None]
+        roster = {
+            f"Member {index}": {
+                "Clan Rank": rng.choice(ranks),
+                "Total XP": rng.choice([None, rng.randint(0, 300000000)]),
+                "Join Date": rng.choice([joined(rng.randint(0, 700)), "Unknown"])
+            }
+            for index in range(500)
+        }
+        await self.storage.replace_members("osrs", roster)
+        roster = await self.storage.get_members("osrs")
+
+        for today in (TODAY, TODAY + 30, TODAY + 30, TODAY + 200):
+            expected = find_promotions(roster, get_ladder("osrs"), today)
+            self.assertEqual(await self.scheduler.eligible("osrs", today), expected)
+            await self.scheduler.due("osrs", today)
+
+
+if __name__ == "__main__":
+    unittest.main()
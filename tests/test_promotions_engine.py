@@ -0,0 +1,68 @@
+import unittest
+from datetime import date
+from logic.promotions_engine import RosterColumns, find_promotions, get_ladder, join_date_ordinal, benchmark, UNKNOWN_ORDINAL
+
+TODAY = date(2026, 1, 1).toordinal()
+
+
+def joined(days_ago):
+    return date.fromordinal(TODAY - days_ago).strftime("%m/%d/%Y")
+
+
+class RosterColumnsTests(unittest.TestCase):
+    def test_shared_values_map_back_to_each_member(self):
+        ladder = get_ladder("osrs")
+        roster = {
+            "A": {"Clan Rank": "recruit", "Total XP": 10, "Join Date": joined(20)},
+            "B": {"Clan Rank": "general", "Join Date": joined(20)},
+            "C": {"Clan Rank": "Owner", "Total XP": None, "Join Date": "Unknown"},
+            "D": {"Total XP": 5}
+        }
+        columns = RosterColumns.from_roster(roster, ladder)
+
+        self.assertEqual(columns.names, ["A", "B", "C", "D"])
+        self.assertEqual(columns.ranks, ["recruit", "general", "Owner", "thief"])
+        self.assertEqual(columns.join_ordinal.tolist(), [TODAY - 20, TODAY - 20, UNKNOWN_ORDINAL, UNKNOWN_ORDINAL])
+        self.assertEqual(columns.xp.tolist(), [10, 0, 0, 5])
+        self.assertEqual(columns.rank_code.tolist(), [ladder.code("recruit"), ladder.code("general"), ladder.unknown_code, ladder.code("thief")])
+        self.assertEqual(columns.ignored.tolist(), [False, False, True, False])
+
+    def test_empty_roster(self):
+        self.assertEqual(find_promotions({}, get_ladder("rs3"), TODAY), [])
+
+
+class FindPromotionsTests(unittest.TestCase):
+    def test_osrs_needs_days_and_xp(self):
+        roster = {
+            "Ready": {"Clan Rank": "thief", "Total XP": 600000, "Join Date": joined(100)},
+            "Too New": {"Clan Rank": "thief", "Total XP": 600000, "Join Date": joined(10)},
+            "Low XP": {"Clan Rank": "recruit", "Total XP": 60000, "Join Date": joined(300)},
+            "Owner": {"Clan Rank": "owner", "Total XP": 10 ** 9, "Join Date": joined(3000)}
+        }
+        self.assertEqual(
+            find_promotions(roster, get_ladder("osrs"), TODAY),
+            [["Ready", joined(100), "thief", "sergeant"]]
+        )
+
+    def test_rs3_by_days(self):
+        roster = {
+            "Old": {"Clan Rank": "Recruit", "Join Date": joined(200)},
+            "New": {"Clan Rank": "Recruit", "Join Date": joined(5)},
+            "Unknown": {"Clan Rank": "Recruit", "Join Date": "Unknown"}
+        }
+        self.assertEqual(
+            find_promotions(roster, get_ladder("rs3"), TODAY),
+            [["Old", joined(200), "Recruit", "Lieutenant"]]
+        )
+
+
+class BenchmarkTests(unittest.TestCase):
+    def test_reports_each_stage(self):
+        join_date_ordinal.cache_clear()
+        timings = benchmark(get_ladder("osrs"), size=1000, runs=1)
+        self.assertEqual(set(timings), {"columns", "evaluate", "find_promotions"})
+        self.assertTrue(all(value >= 0 for value in timings.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from unittest import mock
+from logic.report_pages import ReportPages, ReportPaginator, chunk_lines, pack_pages
+
+
+def interaction_from(user_id):
+    interaction = mock.MagicMock()
+    interaction.user.id = user_id
+    interaction.response.send_message = mock.AsyncMock()
+    return interaction
+
+
+class PackingTests(unittest.TestCase):
+    def test_chunks_stay_within_limit(self):
+        chunks = list(chunk_lines([f"line {index}" for index in range(100)], limit=50, header="Report"))
+        self.assertTrue(chunks[0].startswith("Report\n"))
+        self.assertTrue(all(len(chunk) <= 50 for chunk in chunks))
+
+    def test_pages_respect_message_limit(self):
+        pages = list(pack_pages(["x" * 100] * 200, embed_overhead=10, description_limit=1000, message_limit=3000))
+        for page in pages:
+            self.assertLessEqual(sum(len(description) + 10 for description in page), 3000)
+        self.assertEqual(sum(description.count("x") for page in pages for description in page), 100 * 200)
+
+
+class ReportPaginatorTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.view = ReportPaginator(ReportPages("Report", [f"line {index}" for index in range(2000)]), owner_id=1)
+
+    async def test_owner_can_page(self):
+        interaction = interaction_from(1)
+        self.assertTrue(await self.view.interaction_check(interaction))
+        interaction.response.send_message.assert_not_called()
+
+    async def test_others_are_turned_away_privately(self):
+        interaction = interaction_from(2)
+        self.assertFalse(await self.view.interaction_check(interaction))
+        self.assertTrue(interaction.response.send_message.call_args.kwargs["ephemeral"])
+
+
+if __name__ == "__main__":
+    unittest.main()
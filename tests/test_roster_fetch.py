@@ -0,0 +1,86 @@
+import unittest
+from unittest import mock
+from aiohttp import web
+import logic.roster_fetch
+from logic.roster_fetch import RosterFetcher, UPDATED, UNCHANGED, NOT_MODIFIED
+from logic.roster_import import RosterImport
+from support import ServiceTestCase
+
+# RS3 members_lite.ws is Latin-1: a space in a name is byte 0xA0
+RS3_EXPORT = (
+    b"Clanmate, Clan Rank, Total XP, Kills\n"
+    b"Nurse\xa0Kate,Captain,123456789,0\n"
+    b"Zezima,Recruit,1000,0\n"
+)
+
+KNOWN_RS3_MEMBERS = {
+    "Nurse\xa0Kate": {"Clan Rank": "Lieutenant", "Total XP": 100000000, "Join Date": "01/15/2023"},
+    "Zezima": {"Clan Rank": "Recruit", "Total XP": 1000, "Join Date": "06/01/2024"}
+}
+
+
+class RosterImportTests(unittest.TestCase):
+    def test_latin1_name_matches_known_member(self):
+        roster_import = RosterImport("rs3", KNOWN_RS3_MEMBERS)
+        for line in RS3_EXPORT.splitlines(keepends=True):
+            roster_import.feed_line(line.decode("latin-1"))
+        diff = roster_import.finish()
+
+        self.assertEqual(diff.joined, {})
+        self.assertEqual(diff.left, [])
+        self.assertEqual(diff.rank_changed, [("Nurse\xa0Kate", "Lieutenant", "Captain")])
+        self.assertEqual(diff.updates["Nurse\xa0Kate"]["Join Date"], "01/15/2023")
+
+
+class RosterFetchTests(ServiceTestCase):
+    patched_modules = (logic.roster_fetch,)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.storage.replace_members("rs3", KNOWN_RS3_MEMBERS)
+        self.requests = []
+
+        async def members_lite(request):
+            self.requests.append(request)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            # No charset, like the real export
+            return web.Response(body=RS3_EXPORT, content_type="text/plain", headers={"ETag": '"v1"'})
+
+        server = await self.serve(web.get("/members_lite.ws", members_lite))
+        self.fetcher = RosterFetcher(sources={"rs3": str(server.make_url("/members_lite.ws"))})
+
+    async def test_latin1_export_keeps_members_and_join_dates(self):
+        status, diff = await self.fetcher.fetch("rs3")
+
+        self.assertEqual(status, UPDATED)
+        self.assertEqual(diff.joined, {})
+        self.assertEqual(diff.left, [])
+        members = await self.storage.get_members("rs3")
+        self.assertEqual(set(members), {"Nurse\xa0Kate", "Zezima"})
+        self.assertEqual(members["Nurse\xa0Kate"]["Join Date"], "01/15/2023")
+        self.assertEqual(members["Nurse\xa0Kate"]["Clan Rank"], "Captain")
+
+    async def test_second_fetch_is_conditional(self):
+        await self.fetcher.fetch("rs3")
+        status, diff = await self.fetcher.fetch("rs3")
+
+        self.assertEqual(status, NOT_MODIFIED)
+        self.assertIsNone(diff)
+        self.assertEqual(self.requests[-1].headers.get("If-None-Match"), '"v1"')
+
+    async def test_unchanged_body_is_not_parsed(self):
+        await self.fetcher.fetch("rs3")
+        # A new ETag for the same body skips the 304 but not the hash check
+        await self.storage.set_meta("roster_validators:rs3", (await self.storage.get_meta("roster_validators:rs3")).replace("v1", "v0"))
+
+        with mock.patch.object(logic.roster_fetch, "RosterImport") as roster_import:
+            status, diff = await self.fetcher.fetch("rs3")
+
+        self.assertEqual(status, UNCHANGED)
+        self.assertIsNone(diff)
+        roster_import.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import sqlite3
+import unittest
+from logic.storage import Storage
+from support import ServiceTestCase
+
+
+class SetTotalXpTests(ServiceTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await self.storage.replace_members("osrs", {
+            "Same": {"Clan Rank": "recruit", "Total XP": 100, "Join Date": "01/01/2024"},
+            "Moved": {"Clan Rank": "recruit", "Total XP": 100, "Join Date": "01/01/2024"},
+            "Unset": {"Clan Rank": "recruit", "Join Date": "01/01/2024"}
+        })
+        self.notified = []
+        self.storage.add_members_listener(lambda game, names: self.notified.append((game, names)))
+
+    async def test_only_changed_members_are_notified(self):
+        changed = await self.storage.set_total_xp("osrs", {"Same": 100, "Moved": 200, "Unset": 50, "Missing": 10})
+
+        self.assertEqual(changed, 2)
+        self.assertEqual(self.notified, [("osrs", {"Moved", "Unset"})])
+        members = await self.storage.get_members("osrs")
+        self.assertEqual(members["Moved"]["Total XP"], 200)
+        self.assertNotIn("Missing", members)
+
+    async def test_no_changes_no_notification(self):
+        self.assertEqual(await self.storage.set_total_xp("osrs", {"Same": 100}), 0)
+        self.assertEqual(self.notified, [])
+
+
+    async def test_last_changed(self):
+        self.assertEqual(await self.storage.set_last_changed("osrs", {"Moved": 1700000000, "Missing": 1}), 1)
+        members = await self.storage.get_members("osrs")
+        self.assertEqual(members["Moved"]["Last Changed"], 1700000000)
+        self.assertNotIn("Last Changed", members["Same"])
+        self.assertEqual(self.notified, [("osrs", {"Moved"})])
+
+
+class SchemaUpgradeTests(ServiceTestCase):
+    async def test_members_table_gains_last_changed(self):
+        db_path = os.path.join(self.data_dir, "old.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE members (game TEXT NOT NULL, name TEXT NOT NULL, clan_rank TEXT, total_xp INTEGER, "
+            "join_date TEXT NOT NULL DEFAULT 'Unknown', PRIMARY KEY (game, name))"
+        )
+        conn.execute("INSERT INTO members (game, name, clan_rank) VALUES ('osrs', 'Old', 'recruit')")
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("INSERT INTO meta (key, value) VALUES ('json_migrated', '1')")
+        conn.commit()
+        conn.close()
+
+        storage = Storage(db_path, self.data_dir)
+        try:
+            await storage.set_last_changed("osrs", {"Old": 1700000000})
+            self.assertEqual((await storage.get_members("osrs"))["Old"]["Last Changed"], 1700000000)
+        finally:
+            await storage.close()
+            storage._executor.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+from aiohttp import web
+import logic.wise_old_man
+from logic.wise_old_man import WiseOldManClient, PAGE_SIZE, normalize_name, parse_timestamp
+from logic.http_client import HttpError
+from support import ServiceTestCase
+
+GROUP_ID = 1234
+
+LAST_CHANGED_AT = "2025-03-01T12:00:00.000Z"
+LAST_CHANGED = 1740830400
+
+
+def hiscore_entry(name, xp):
+    player = {"username": name.lower(), "displayName": name, "lastChangedAt": LAST_CHANGED_AT}
+    return {"player": player, "data": {"experience": xp}}
+
+
+class NormalizeNameTests(unittest.TestCase):
+    def test_matches_game_name_rules(self):
+        self.assertEqual(normalize_name("Iron_Hyger"), "iron hyger")
+        self.assertEqual(normalize_name("Iron-Hyger"), "iron hyger")
+        self.assertEqual(normalize_name("Iron\xa0Hyger "), "iron hyger")
+
+
+class ParseTimestampTests(unittest.TestCase):
+    def test_iso_timestamps(self):
+        self.assertEqual(parse_timestamp(LAST_CHANGED_AT), LAST_CHANGED)
+        self.assertIsNone(parse_timestamp(None))
+        self.assertIsNone(parse_timestamp("yesterday"))
+
+
+class WiseOldManClientTests(ServiceTestCase):
+    patched_modules = (logic.wise_old_man,)
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.entries = [hiscore_entry(f"Member {index}", 1000000 + index) for index in range(120)]
+        self.requests = []
+        self.failures = []
+
+        async def group_hiscores(request):
+            self.requests.append(dict(request.query))
+            if request.match_info["group_id"] != str(GROUP_ID):
+                return web.json_response({"message": "Group not found."}, status=404)
+            if self.failures:
+                return web.json_response({"message": "Unavailable"}, status=self.failures.pop(0))
+            offset, limit = int(request.query["offset"]), int(request.query["limit"])
+            return web.json_response(self.entries[offset:offset + limit])
+
+        self.server = await self.serve(web.get("/v2/groups/{group_id}/hiscores", group_hiscores))
+        self.client = WiseOldManClient(group_id=GROUP_ID, base_url=str(self.server.make_url("/v2")))
+
+    async def test_pages_through_the_group(self):
+        entries = await self.client.get_group_hiscores()
+
+        self.assertEqual(len(entries), 120)
+        self.assertEqual([int(query["offset"]) for query in self.requests], [0, 50, 100])
+        self.assertTrue(all(int(query["limit"]) == PAGE_SIZE for query in self.requests))
+
+    async def test_full_last_page_requests_one_more(self):
+        self.entries = self.entries[:PAGE_SIZE * 2]
+        entries = await self.client.get_group_hiscores()
+
+        self.assertEqual(len(entries), PAGE_SIZE * 2)
+        self.assertEqual(len(self.requests), 3)
+
+    async def test_responses_are_cached_for_the_ttl(self):
+        await self.client.get_group_hiscores()
+        await self.client.get_group_hiscores()
+        self.assertEqual(len(self.requests), 3)
+
+        self.client.invalidate()
+        await self.client.get_group_hiscores()
+        self.assertEqual(len(self.requests), 6)
+
+    async def test_expired_responses_are_refetched(self):
+        self.client.ttl = 0
+        await self.client.get_group_hiscores()
+        await self.client.get_group_hiscores()
+        self.assertEqual(len(self.requests), 6)
+
+    async def test_group_members(self):
+        self.entries.append({"player": {"username": "unranked", "displayName": "Unranked"}, "data": {"experience": -1}})
+        members = await self.client.get_group_members()
+
+        self.assertEqual(members["member 7"], {"display_name": "Member 7", "xp": 1000007, "last_changed": LAST_CHANGED})
+        self.assertIsNone(members["unranked"]["xp"])
+        self.assertIsNone(members["unranked"]["last_changed"])
+
+    async def test_unknown_group_raises_and_is_not_cached(self):
+        client = WiseOldManClient(group_id=999, base_url=str(self.server.make_url("/v2")))
+        with self.assertRaises(HttpError) as raised:
+            await client.get_group_hiscores()
+        self.assertEqual(raised.exception.status_code, 404)
+
+        with self.assertRaises(HttpError):
+            await client.get_group_hiscores()
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_transient_server_error_is_retried(self):
+        self.failures = [503]
+        entries = await self.client.get_group_hiscores()
+        self.assertEqual(len(entries), 120)
+
+    async def test_cached_fallbacks_are_not_used(self):
+        await self.client.get_group_hiscores()
+        self.client.invalidate()
+        self.failures = [503, 503, 503]
+
+        with self.assertRaises(HttpError) as raised:
+            await self.client.get_group_hiscores()
+        self.assertEqual(raised.exception.status_code, 503)
+
+    async def test_sync_osrs_members(self):
+        await self.storage.replace_members("osrs", {
+            "Member_3": {"Clan Rank": "recruit", "Join Date": "01/01/2024"},
+            "member-4": {"Clan Rank": "recruit", "Total XP": 1000004, "Join Date": "01/01/2024"},
+            "Not In Group": {"Clan Rank": "thief", "Join Date": "01/01/2024"}
+        })
+
+        covered = await self.client.sync_osrs_members()
+
+        self.assertEqual(covered, {"Member_3", "member-4"})
+        members = await self.storage.get_members("osrs")
+        self.assertEqual(members["Member_3"]["Total XP"], 1000003)
+        self.assertEqual(members["member-4"]["Total XP"], 1000004)
+        self.assertEqual(members["Member_3"]["Last Changed"], LAST_CHANGED)
+        self.assertNotIn("Total XP", members["Not In Group"])
+        self.assertNotIn("Last Changed", members["Not In Group"])
+
+
+if __name__ == "__main__":
+    unittest.main()